@@ -0,0 +1,148 @@
+"""
+asyncio interface to the instruments in socket_communicators.
+
+Every call to an instrument runs the synchronous method of the matching class in
+socket_communicators on a worker thread that belongs to that instrument, so a
+program can await several instruments at once, e.g. move the stepper motor
+while reading the cavity length and transferring data from the Network Analyzer.
+Calls to the same instrument run one at a time, in the order they were made.
+
+The protocol itself (framing, shadowed GPIB settings, waits, retries and
+reconnects) only exists in socket_communicators, both interfaces behave the same.
+
+Example usage:
+    ardu_comm = await AsyncArduComm.open(ardu_sock)
+    nwa_comm = await AsyncNetworkAnalyzerComm.open(nwa_sock, nwa_points, nwa_span, nwa_power)
+
+    length, sweep = await asyncio.gather(ardu_comm.get_cavity_length(),
+                                         nwa_comm.take_data_single())
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+
+import socket_communicators as sc
+
+class AsyncComm:
+    """
+    Wraps an instrument object from socket_communicators so that its methods can be awaited.
+    Method calls become coroutines, everything else is passed through.
+    """
+
+    # class from socket_communicators that open() creates, set by subclasses
+    comm_class = None
+
+    def __init__(self, comm, timeout=None, executor=None):
+        """
+        Args:
+            comm: instance of one of the classes in socket_communicators
+            timeout: default time limit for a call, in seconds, None waits forever
+            executor: single worker executor that runs the calls, one is created if not given
+        """
+
+        self.comm = comm
+        self.timeout = timeout
+        # a single worker keeps calls to the instrument in order
+        if executor is None:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.executor = executor
+
+    @classmethod
+    async def open(cls, *args, timeout=None, **kwargs):
+        """
+        Create the instrument object on its worker thread, since the constructors
+        of socket_communicators talk to the instrument.
+
+        Args:
+            args, kwargs: passed on to comm_class
+            timeout: default time limit for a call, in seconds
+        """
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        loop = asyncio.get_running_loop()
+        comm = await loop.run_in_executor(executor, functools.partial(cls.comm_class, *args, **kwargs))
+
+        return cls(comm, timeout, executor)
+
+    async def call(self, name, *args, timeout=None, **kwargs):
+        """
+        Call a method of the instrument object on the worker thread.
+
+        A call that runs past its time limit raises asyncio.TimeoutError. If the
+        method had not started yet it is dropped, otherwise it can not be
+        interrupted and finishes before the next call starts, so the instrument
+        is never left half way through a transfer.
+
+        Args:
+            name: name of the method
+            args, kwargs: passed on to the method
+            timeout: time limit for this call in seconds, defaults to self.timeout
+
+        Returns:
+            The method's return value
+        """
+
+        if timeout is None:
+            timeout = self.timeout
+
+        method = getattr(self.comm, name)
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, functools.partial(method, *args, **kwargs))
+
+        return await asyncio.wait_for(future, timeout)
+
+    def shutdown(self, wait=True):
+        """
+        Stop the worker thread once the calls already made have finished.
+        """
+        self.executor.shutdown(wait=wait)
+
+    def __getattr__(self, name):
+        if name == 'comm':
+            raise AttributeError(name)
+        attr = getattr(self.comm, name)
+
+        if not callable(attr):
+            return attr
+
+        async def async_call(*args, **kwargs):
+            return await self.call(name, *args, **kwargs)
+
+        return async_call
+
+class AsyncNetworkAnalyzerComm(AsyncComm):
+    """
+    asyncio interface to NetworkAnalyzerComm (HP8757 C Network Analyzer).
+    """
+    comm_class = sc.NetworkAnalyzerComm
+
+class AsyncStepperMotorComm(AsyncComm):
+    """
+    asyncio interface to StepperMotorComm (Applied Motion products stepper motor).
+    """
+    comm_class = sc.StepperMotorComm
+
+class AsyncSwitchComm(AsyncComm):
+    """
+    asyncio interface to SwitchComm (Sorensen XDL Series II PSU driving the RF switches).
+    """
+    comm_class = sc.SwitchComm
+
+class AsyncArduComm(AsyncComm):
+    """
+    asyncio interface to ArduComm (Arduino Uno equipped with a string potentiometer).
+    """
+    comm_class = sc.ArduComm
+
+class AsyncSignalAnalyzerComm(AsyncComm):
+    """
+    asyncio interface to SignalAnalyzerComm (Agilent CXA Signal Analyzer).
+    """
+    comm_class = sc.SignalAnalyzerComm
+
+class AsyncSignalGeneratorComm(AsyncComm):
+    """
+    asyncio interface to SignalGeneratorComm (Agilent MXG N5183B Signal Generator).
+    """
+    comm_class = sc.SignalGeneratorComm
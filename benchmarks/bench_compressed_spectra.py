@@ -0,0 +1,94 @@
+#!/usr/bin/env python3.5
+
+"""
+Throughput and compression ratio of the compressed spectrum stream written by
+DigitizerSaver in 'Z' mode, for each codec with and without the delta and
+shuffle filters.
+
+Spectra are synthetic averaged noise power spectra in dBm of 131072 points,
+as taken by the Signal Analyzer: a slowly varying baseline with the
+fluctuations expected after 256 averages. Ratios are relative to raw float32,
+and for reference the ASCII text written by the 'R+F' mode takes several times
+the size of the raw float32 data.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# the modules being benchmarked are in the folder above
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_processors as procs
+
+NUM_SPECTRA = 10
+FFT_LENGTH = 131072
+SA_AVERAGES = 256
+
+CONFIGURATIONS = [
+    ("none", None, False, False),
+    ("zlib", 1, False, False),
+    ("zlib", 6, False, False),
+    ("zlib", 1, False, True),
+    ("zlib", 6, False, True),
+    ("zlib", 6, True, True),
+    ("lzma", 0, False, True),
+    ("lzma", 0, True, True),
+    ("lzma", 6, True, True),
+]
+
+def make_spectra(num_spectra, seed):
+
+    rng = np.random.RandomState(seed)
+
+    frequency = np.linspace(0, 1, FFT_LENGTH)
+    baseline_mw = 1e-9 * (1 + 0.3 * np.sin(2 * np.pi * 3 * frequency))
+
+    spectra = []
+    for _ in range(num_spectra):
+        averaged = baseline_mw * rng.chisquare(2 * SA_AVERAGES, FFT_LENGTH) / (2 * SA_AVERAGES)
+        spectra.append((10 * np.log10(averaged)).astype(np.float32))
+
+    return spectra
+
+def main():
+
+    spectra = make_spectra(NUM_SPECTRA, 0)
+    raw_bytes = sum(spectrum.nbytes for spectrum in spectra)
+    text_bytes = sum(len(",".join(spectrum.astype(str))) for spectrum in spectra)
+
+    print("ASCII text is %.2fx the size of raw float32\n" % (text_bytes / raw_bytes))
+    print("codec  level  delta  shuffle  ratio  write (MB/s)  read one spectrum (ms)")
+
+    for codec, level, delta, shuffle in CONFIGURATIONS:
+        path = tempfile.mktemp(suffix='.spectra')
+        try:
+            writer = procs.SpectrumStreamWriter(path, codec, level, delta, shuffle)
+            start = time.perf_counter()
+            for spectrum in spectra:
+                writer.append(spectrum, "Q;10000\n")
+            write_time = time.perf_counter() - start
+            writer.close()
+
+            stored_bytes = os.path.getsize(path)
+
+            reader = procs.SpectrumStreamReader(path)
+            order = np.random.RandomState(1).permutation(len(spectra))
+            start = time.perf_counter()
+            for index in order:
+                assert np.array_equal(reader[index], spectra[index])
+            read_time = (time.perf_counter() - start) / len(spectra)
+            reader.close()
+        finally:
+            for name in (path, path + '.idx'):
+                if os.path.exists(name):
+                    os.remove(name)
+
+        print("%-6s %5s %6s %8s %6.2f %13.1f %23.2f" % (codec, level, delta, shuffle, raw_bytes / stored_bytes,
+                                                        raw_bytes / write_time / 1e6, 1e3 * read_time))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3.5
+
+"""
+Timing and accuracy benchmark of the Lorentzian fitters in data_processors, on
+synthetic transmission windows with a known quality factor and center frequency.
+
+Each window is a Lorentzian peak in dBm, offset from the window center by a
+fraction of a bin and with Gaussian noise added in dB, taken with the same
+number of points as the Network Analyzer. Errors are quoted as the median
+absolute fractional error of Q and the median absolute error of the center.
+The half power fitter reports the frequency of the highest point as the center,
+so its center error is limited by the bin width.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# the modules being benchmarked are in the folder above
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_processors as procs
+
+NWA_POINTS = 401
+FREQ_WINDOW = 10.0
+NUM_WINDOWS = 200
+NOISE_DB = 0.05
+
+def make_windows(num_windows, quality_factor, seed):
+    """
+    Returns:
+        (windows, window_centers, true_centers) with one window of power in dBm per row
+    """
+    rng = np.random.RandomState(seed)
+
+    window_centers = rng.uniform(3000, 6000, num_windows).round()
+    true_centers = window_centers + rng.uniform(-0.5, 0.5, num_windows)
+    hwhm = true_centers / (2 * quality_factor)
+
+    x = (window_centers[:, np.newaxis] - FREQ_WINDOW / 2
+         + FREQ_WINDOW * np.arange(NWA_POINTS) / NWA_POINTS)
+    shape = hwhm[:, np.newaxis] ** 2 / ((x - true_centers[:, np.newaxis]) ** 2 + hwhm[:, np.newaxis] ** 2)
+    windows = 10 * np.log10(1e-3 * shape) + rng.normal(0, NOISE_DB, x.shape)
+
+    return windows, window_centers, true_centers
+
+def errors(results, quality_factor, true_centers):
+
+    q_error = np.median(np.abs(results[:, 0] / quality_factor - 1))
+    center_error = np.median(np.abs(results[:, 1] - true_centers))
+    return q_error, center_error
+
+def time_single(fitter, windows, window_centers):
+    """
+    One call per window as made by ModeTracker.fit_peak, with printing suppressed.
+    """
+    fitter.print_blue = fitter.print_purple = lambda *args: None
+
+    start = time.perf_counter()
+    results = [fitter(window.tolist(), center, FREQ_WINDOW) for window, center in zip(windows, window_centers)]
+    return (time.perf_counter() - start) / len(windows), np.array(results)
+
+def time_batch(fitter, windows, window_centers):
+
+    start = time.perf_counter()
+    results = fitter.fit_batch(windows, window_centers, FREQ_WINDOW)
+    return (time.perf_counter() - start) / len(windows), results
+
+def main():
+
+    fitters = [("half power", procs.NouveauLorentzianFitter()),
+               ("least squares", procs.LorentzianFitter())]
+
+    print("Q       fitter          single (ms)  batch (ms)  Q error  center error (MHz)")
+    for quality_factor in [5000, 10000, 20000]:
+        windows, window_centers, true_centers = make_windows(NUM_WINDOWS, quality_factor, quality_factor)
+
+        for name, fitter in fitters:
+            single_time, single_results = time_single(fitter, windows, window_centers)
+            batch_time, batch_results = time_batch(fitter, windows, window_centers)
+            assert np.allclose(single_results, batch_results)
+
+            q_error, center_error = errors(batch_results, quality_factor, true_centers)
+            print("%-7d %-14s %12.3f %11.4f %8.4f %19.4f" % (quality_factor, name, 1e3 * single_time,
+                                                             1e3 * batch_time, q_error, center_error))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3.5
+
+"""
+Benchmark of the per-call overhead of ModeTrack's string interface compared
+with its array interface, for 1604-point reflection scans (4 windows of 401
+points) as taken by ModeTracker.find_minima_peak.
+
+The string timings include building the newline separated triples on the
+Python side, which is the marshalling cost the array interface removes. Both
+paths run the same peak finding, so the difference is the overhead per call.
+
+The last measurement checks that a Python thread keeps running while peak
+finding runs, ie that the wrapper releases the GIL.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+# the modules being benchmarked are in the folder above
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_processors as procs
+import modetrack as mt
+
+CENTERS = [3200, 3600, 4000, 4400]
+SPAN = 400
+POINTS = 401
+# quadratic frequency vs. length paths of modes 0 through 3
+PATHS = [(47.9998, -1041.54, 8950.56), (44.2758, -1055.35, 9610.61),
+         (45.8298, -1139.8, 10626.7), (37.697, -1038.49, 10780.2)]
+
+def make_scan(cavity_length, seed):
+    """
+    Synthetic reflection scan with a Lorentzian dip at each mode.
+    """
+    rng = np.random.RandomState(seed)
+
+    convertor = procs.Convertor()
+    powers = rng.normal(0.0, 0.05, len(CENTERS) * POINTS)
+    points = convertor.make_plot_points([powers], cavity_length,
+                                        CENTERS[0] - SPAN / 2, CENTERS[-1] + SPAN / 2)
+
+    for a, b, c in PATHS:
+        center = a * cavity_length ** 2 + b * cavity_length + c
+        for triple in points:
+            triple[2] -= 10 / (1 + ((triple[0] - center) / 3.0) ** 2)
+
+    return points
+
+def points_to_str(formatted_points):
+    """
+    String marshalling previously done by ModeTracker.find_minima_peak
+    """
+    data_str = ''
+    for triple in formatted_points:
+        temp_str = str(triple)
+        trans_table = dict.fromkeys(map(ord, ' []'), None)
+        temp_str = temp_str.translate(trans_table)
+        data_str += temp_str + "\n"
+    return data_str[:-1]
+
+def time_calls(func, scans, repeats):
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        results = [func(points) for points in scans]
+    return (time.perf_counter() - start) / (repeats * len(scans)), results
+
+def background_progress(func, scans):
+    """
+    Count how far a busy Python thread gets while 'func' runs over 'scans',
+    relative to how far it gets while the main thread sleeps for the same time.
+    """
+    counter = [0]
+    stop = threading.Event()
+
+    def count():
+        while not stop.is_set():
+            counter[0] += 1
+
+    thread = threading.Thread(target=count)
+    thread.start()
+
+    start = time.perf_counter()
+    for points in scans:
+        func(points)
+    elapsed = time.perf_counter() - start
+    during_calls = counter[0]
+
+    time.sleep(elapsed)
+    while_idle = counter[0] - during_calls
+
+    stop.set()
+    thread.join()
+
+    return during_calls / while_idle
+
+def main():
+
+    convertor = procs.Convertor()
+    scans = [make_scan(float(length), seed) for seed, length in enumerate(np.linspace(6.0, 8.0, 20))]
+    background = np.zeros(len(CENTERS) * POINTS)
+    repeats = 3
+
+    def string_call(points):
+        return m_track.GetPeaksBiLat(points_to_str(points), 1)
+
+    def array_call(points):
+        frequencies, cavity_length, powers = convertor.plot_points_to_arrays(points)
+        return m_track.GetPeaksBiLatArray(frequencies, powers, cavity_length, 1)
+
+    # the mode paths are refined by every call, start each interface from the same state
+    m_track = mt.ModeTrack()
+    m_track.SetBackgroundArray(background)
+    string_time, string_results = time_calls(string_call, scans, repeats)
+
+    m_track = mt.ModeTrack()
+    m_track.SetBackgroundArray(background)
+    array_time, array_results = time_calls(array_call, scans, repeats)
+
+    print("interface  per call (ms)")
+    print("string     %13.3f" % (1e3 * string_time))
+    print("array      %13.3f" % (1e3 * array_time))
+    print("speed-up   %12.1fx" % (string_time / array_time))
+    print("results identical: " + str(string_results == array_results))
+
+    # convert up front so that only the native peak finding is measured
+    powers = mt.DoubleMatrix([convertor.plot_points_to_arrays(points)[2].tolist() for points in scans * 10])
+    frequencies = mt.DoubleVector([triple[0] for triple in scans[0]])
+    lengths = mt.DoubleVector([points[0][1] for points in scans * 10])
+    def batch_call(_):
+        return m_track.GetPeaksBiLatBatch(powers, frequencies, lengths)
+
+    progress = background_progress(batch_call, [None])
+    print("Python thread progress during batch peak finding: %.0f%% of idle" % (100 * progress))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3.5
+
+"""
+Benchmark of the filters ModeTrack applies before identifying peaks, for
+spectra from a single Network Analyzer window (401 points) up to a full
+Signal Analyzer spectrum (131072 points).
+
+Each filter is checked against a NumPy transcription of the original
+algorithm, which evaluates the Gaussian range kernel exactly for every pair of
+points. The bilateral filter error is quoted relative to the spread of the
+spectrum. The last column times a whole GetPeaksBiLatArray call, which can be
+compared between builds of the module.
+
+Gaussian smoothing is timed for several kernel radii; ModeTrack switches to
+FFT convolution where that is expected to be faster than a direct convolution.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# the modules being benchmarked are in the folder above
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import modetrack as mt
+
+SIZES = [401, 1604, 8192, 32768, 131072]
+# parameters used by ModeTrack::FindPeaks
+SIGMA_S = 10.0
+SIGMA_R = 2.0
+# Gaussian kernel radii, ModeTrack uses 15 by default
+RADII = [5, 15, 60, 150]
+
+def make_spectrum(num_points, seed):
+    """
+    Noisy spectrum in dB with a few Lorentzian dips.
+    """
+    rng = np.random.RandomState(seed)
+
+    x = np.arange(num_points, dtype=np.float64)
+    powers = rng.normal(0.0, 0.5, num_points)
+    for center in rng.uniform(0.1, 0.9, 4) * num_points:
+        powers -= 10 / (1 + ((x - center) / (num_points / 400.0)) ** 2)
+
+    return powers
+
+def gaussian(x, sigma):
+    return 1 / (np.sqrt(np.pi / 2) * sigma) * np.exp(-0.5 * (x / sigma) ** 2)
+
+def reference_bilateral(powers, sigma_s, sigma_r):
+    """
+    Bilateral filter with zero padding, as originally computed by ModeTrack
+    """
+    radius = int(np.ceil(5 // 2 * sigma_s))
+    padded = np.pad(powers, radius, mode='constant')
+
+    conv = np.zeros_like(powers)
+    norm = np.zeros_like(powers)
+    for offset in range(-radius, radius + 1):
+        neighbours = padded[radius + offset:radius + offset + len(powers)]
+        weight = gaussian(abs(offset), sigma_s) * gaussian(powers - neighbours, sigma_r)
+        conv += weight * neighbours
+        norm += weight
+
+    return conv / norm
+
+def reference_derivative(powers):
+    padded = np.pad(powers, 2, mode='constant')
+    return (-padded[4:] + 8 * padded[3:-1] - 8 * padded[1:-3] + padded[:-4]) / 12
+
+def reference_gauss_blur(powers, radius, sigma):
+    """
+    Convolution with an L2 normalised Gaussian kernel, keeping only the outputs
+    for which the kernel lies inside the spectrum, aligned as ModeTrack::Convolve
+    """
+    kernel = gaussian(np.arange(-radius, radius + 1), sigma)
+    kernel /= np.sqrt(np.sum(kernel ** 2))
+    return np.convolve(powers, kernel)[len(kernel):len(powers)]
+
+def time_call(func, repeats):
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        func()
+    return (time.perf_counter() - start) / repeats
+
+def main():
+
+    m_track = mt.ModeTrack()
+
+    print("points   bilateral (ms)  max error  derivative (ms)  max error  GetPeaksBiLatArray (ms)")
+    for num_points in SIZES:
+        powers = make_spectrum(num_points, num_points)
+        frequencies = np.linspace(3000.0, 4600.0, num_points)
+        filtered = np.empty(num_points)
+        derivative = np.empty(num_points)
+        repeats = max(3, 200000 // num_points)
+
+        bilat_time = time_call(lambda: m_track.BilateralFilterArray(powers, filtered, SIGMA_S, SIGMA_R), repeats)
+        bilat_error = np.max(np.abs(filtered - reference_bilateral(powers, SIGMA_S, SIGMA_R)))
+        bilat_error /= np.ptp(powers)
+
+        der_time = time_call(lambda: m_track.DerivativeArray(powers, derivative), repeats)
+        der_error = np.max(np.abs(derivative - reference_derivative(powers)))
+
+        m_track.SetBackgroundArray(np.zeros(num_points))
+        peaks_time = time_call(lambda: m_track.GetPeaksBiLatArray(frequencies, powers, 7.0, 1), repeats)
+
+        print("%-8d %14.3f %10.1e %16.3f %10.1e %24.3f" % (num_points, 1e3 * bilat_time, bilat_error,
+                                                          1e3 * der_time, der_error, 1e3 * peaks_time))
+
+    print("\npoints   " + "".join("r=%-3d (ms)  max error  " % radius for radius in RADII))
+    for num_points in SIZES:
+        powers = make_spectrum(num_points, num_points)
+        repeats = max(3, 200000 // num_points)
+
+        line = "%-8d" % num_points
+        for radius in RADII:
+            filtered = np.empty(max(num_points - 2 * radius - 1, 0))
+            blur_time = time_call(lambda: m_track.GaussBlurArray(powers, filtered, radius, radius / 2), repeats)
+            blur_error = np.max(np.abs(filtered - reference_gauss_blur(powers, radius, radius / 2)))
+            line += " %10.3f %10.1e " % (1e3 * blur_time, blur_error)
+        print(line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3.5
+
+"""
+Micro-benchmark comparing the old string-concatenating receive loop with the
+reusable ReceiveBuffer used by SocketComm.
+
+Payloads are sized after an ASCII sweep from the Network Analyzer (~3 KB) and
+ASCII spectra from the Signal Analyzer (131072 points, several MB).
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+
+# the modules being benchmarked are in the folder above
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import socket_communicators as sc
+
+PAYLOADS = {
+    "NWA 3 KB": ",".join(["-42.125"] * 401).encode() + b"\n",
+    "SA 2 MB": ",".join(["-1.234567e+01"] * 131072).encode() + b"\n",
+    "SA 8 MB": ",".join(["-1.234567e+01"] * 4 * 131072).encode() + b"\n",
+}
+
+def send_payload(sock, payload):
+    sock.sendall(payload)
+
+def concat_read(sock, num_bytes):
+    """
+    Receive loop as previously used by SocketComm._read_data
+    """
+    data = ''
+    while len(data) < num_bytes:
+        buff = sock.recv(2048)
+        data += buff.decode()
+    return data
+
+def buffer_read(recv_buffer, sock, num_bytes):
+    recv_buffer.reset()
+    while recv_buffer.length < num_bytes:
+        recv_buffer.recv_into(sock)
+    return recv_buffer.data()
+
+def time_read(read_func, payload, repeats):
+
+    total = 0.0
+    for _ in range(repeats):
+        sender, receiver = socket.socketpair()
+        thread = threading.Thread(target=send_payload, args=(sender, payload))
+
+        start = time.perf_counter()
+        thread.start()
+        read_func(receiver, len(payload))
+        total += time.perf_counter() - start
+
+        thread.join()
+        sender.close()
+        receiver.close()
+
+    return total / repeats
+
+def main():
+
+    recv_buffer = sc.ReceiveBuffer()
+    repeats = 5
+
+    print("payload     concatenate (ms)  recv_into (ms)  speed-up")
+    for name, payload in PAYLOADS.items():
+        concat = time_read(concat_read, payload, repeats)
+        buffered = time_read(lambda sock, n: buffer_read(recv_buffer, sock, n), payload, repeats)
+        print("%-10s %17.3f %15.3f %9.1fx" % (name, 1e3 * concat, 1e3 * buffered, concat / buffered))
+
+if __name__ == "__main__":
+    main()
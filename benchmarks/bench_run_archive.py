@@ -0,0 +1,98 @@
+#!/usr/bin/env python3.5
+
+"""
+Benchmark of saving Signal Analyzer spectra as text files with DigitizerSaver
+('R+F', raw and formatted text per spectrum) compared with a binary RunArchive
+through ArchiveSaver, and of loading the saved spectra back for analysis.
+
+Spectra are ASCII transfers of 131072 points, as with the default fft_length,
+each saved with the header built by ModeTracker._build_data_header.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# the modules being benchmarked are in the folder above
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_processors as procs
+
+NUM_SPECTRA = 20
+FFT_LENGTH = 131072
+
+HEADER = "\n".join(["sa_span;90", "fft_length;131072", "effective_volume;20", "bfield;1.54",
+                     "noise_temperature;400", "sa_averages;256", "Q;10234.5",
+                     "actual_center_freq;3712.4", "fitted_hwhm;0.18", "cavity_length;7.25"]) + "\n"
+
+def folder_size(directory):
+
+    return sum(os.path.getsize(os.path.join(path, name))
+               for path, _, names in os.walk(directory) for name in names)
+
+def save_spectra(saver, spectra):
+
+    start = time.perf_counter()
+    for spectrum in spectra:
+        saver(spectrum, HEADER)
+    return (time.perf_counter() - start) / len(spectra)
+
+def load_text(directory):
+    """
+    Read back every formatted spectrum written by DigitizerSaver
+    """
+    header_lines = HEADER.count("\n") + 1
+    names = [name for name in os.listdir(directory) if name.startswith('SA_F')]
+    names.sort(key=lambda name: int(name[len('SA_F'):-len('.csv')]))
+
+    return np.array([np.loadtxt(os.path.join(directory, name), skiprows=header_lines) for name in names])
+
+def load_archive(directory):
+
+    spectra, metadata, config = procs.load_run_archive(directory)
+    return np.concatenate(spectra)
+
+def main():
+
+    rng = np.random.RandomState(0)
+    spectra = [",".join("%.6e" % value for value in rng.normal(-90.0, 1.0, FFT_LENGTH))
+               for _ in range(NUM_SPECTRA)]
+
+    # FlatFileSaver folders are relative to the directory of data_processors
+    module_dir = os.path.dirname(os.path.realpath(procs.__file__))
+    tmp_dir = tempfile.mkdtemp()
+    root_dir = os.path.relpath(tmp_dir, module_dir)
+
+    try:
+        text_saver = procs.DigitizerSaver(os.path.join(root_dir, "text"), 'R+F')
+        text_save = save_spectra(text_saver, spectra)
+        text_size = folder_size(text_saver.directory)
+
+        start = time.perf_counter()
+        text_spectra = load_text(text_saver.directory)
+        text_load = time.perf_counter() - start
+
+        archive_saver = procs.ArchiveSaver(os.path.join(root_dir, "archive"), {'fft_length': FFT_LENGTH})
+        archive_save = save_spectra(archive_saver, spectra)
+        archive_saver.close()
+        archive_size = folder_size(archive_saver.directory)
+
+        start = time.perf_counter()
+        archive_spectra = load_archive(archive_saver.archive.directory)
+        archive_load = time.perf_counter() - start
+
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    print("\nstorage      save per spectrum (ms)  size (MB)  load all (ms)")
+    print("text (R+F)   %22.1f %10.2f %14.1f" % (1e3 * text_save, text_size / 1e6, 1e3 * text_load))
+    print("archive      %22.1f %10.2f %14.1f" % (1e3 * archive_save, archive_size / 1e6, 1e3 * archive_load))
+    print("loaded spectra agree to float32 precision: "
+          + str(np.allclose(text_spectra, archive_spectra, rtol=1e-6, atol=0)))
+
+if __name__ == "__main__":
+    main()
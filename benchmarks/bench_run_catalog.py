@@ -0,0 +1,113 @@
+#!/usr/bin/env python3.5
+
+"""
+Benchmark of finding spectra by center frequency and Q through a RunCatalog,
+compared with walking the run folders and parsing every data file, which was
+the only way to search saved data before.
+
+Runs of text spectra are saved with DigitizerSaver, with headers as built by
+ModeTracker._build_data_header, and catalogued as they are saved. The catalog
+is then rebuilt from the folders to time a rebuild.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# the modules being benchmarked are in the folder above
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_processors as procs
+
+NUM_RUNS = 10
+SPECTRA_PER_RUN = 50
+FFT_LENGTH = 8192
+
+def make_header(rng):
+
+    header = ''
+    header += "Q;" + str(rng.uniform(5000, 15000)) + "\n"
+    header += "actual_center_freq;" + str(rng.uniform(3000, 4600)) + "\n"
+    header += "fitted_hwhm;" + str(rng.uniform(0.1, 0.5)) + "\n"
+    header += "cavity_length;" + str(rng.uniform(6, 8)) + "\n"
+
+    return header
+
+def walk_runs(root_dir, min_frequency, max_frequency, min_q):
+    """
+    Search by reading every file of every run folder.
+    """
+    convertor = procs.Convertor()
+    found = []
+
+    for run in sorted(os.listdir(root_dir)):
+        run_directory = os.path.join(root_dir, run)
+        if not os.path.isdir(run_directory):
+            continue
+        for name in sorted(os.listdir(run_directory)):
+            with open(os.path.join(run_directory, name)) as in_file:
+                lines = in_file.read().splitlines()
+            header = procs._parse_data_header("\n".join(line for line in lines if ';' in line))
+            if (min_frequency <= header['actual_center_freq'] <= max_frequency and header['Q'] >= min_q):
+                found.append(convertor.parse_powers(lines[-1]))
+
+    return found
+
+def main():
+
+    rng = np.random.RandomState(0)
+    # FlatFileSaver makes run folders relative to data_processors.py
+    module_dir = os.path.dirname(os.path.realpath(procs.__file__))
+    root_dir = tempfile.mkdtemp(dir=module_dir)
+
+    try:
+        catalog = procs.RunCatalog(os.path.join(root_dir, 'catalog.sqlite'))
+
+        save_time = 0.0
+        for _ in range(NUM_RUNS):
+            saver = procs.DigitizerSaver(os.path.basename(root_dir), 'R', catalog=catalog)
+            for _ in range(SPECTRA_PER_RUN):
+                spectrum = (rng.normal(-80, 1, FFT_LENGTH)).astype(np.float32)
+                start = time.perf_counter()
+                saver(spectrum, make_header(rng))
+                save_time += time.perf_counter() - start
+            # run folders are named to the second
+            time.sleep(1)
+
+        num_spectra = NUM_RUNS * SPECTRA_PER_RUN
+
+        start = time.perf_counter()
+        walked = walk_runs(root_dir, 4090, 4110, 10000)
+        walk_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        records = catalog.query(min_frequency=4090, max_frequency=4110, min_q=10000)
+        query_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        spectra = [catalog.load(record) for record in records]
+        load_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        catalogued = catalog.rebuild()
+        rebuild_time = time.perf_counter() - start
+
+        assert catalogued == num_spectra
+        assert np.allclose(np.sort([np.sum(a) for a in walked]), np.sort([np.sum(b) for b in spectra]))
+
+        print("%d spectra of %d points in %d runs, %d match\n" % (num_spectra, FFT_LENGTH, NUM_RUNS, len(records)))
+        print("walk and parse every file  %10.1f ms" % (1e3 * walk_time))
+        print("catalog query              %10.3f ms" % (1e3 * query_time))
+        print("catalog query and load     %10.1f ms" % (1e3 * (query_time + load_time)))
+        print("rebuild catalog            %10.1f ms" % (1e3 * rebuild_time))
+        print("save and catalog spectrum  %10.1f ms" % (1e3 * save_time / num_spectra))
+        catalog.close()
+    finally:
+        shutil.rmtree(root_dir)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3.5
+
+"""
+Timing benchmark comparing idle-timeout socket reads with framed reads.
+
+A local fake instrument answers each query with a canned response, roughly
+mimicking the Network Analyzer (ASCII sweep), the Arduino (cavity length)
+and the Signal Analyzer (*OPC? poll and a definite-length spectrum block).
+"""
+
+import os
+import socket
+import sys
+import threading
+import time
+
+# the modules being benchmarked are in the folder above
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import socket_communicators as sc
+
+RESPONSES = {
+    "NWA": ",".join(["-42.125"] * 401).encode() + b"\n",
+    "ARDU": b"7.5\r\n",
+    "OPC": b"1\n",
+    "SPEC": b"#6" + str(4 * 8192).zfill(6).encode() + bytes(4 * 8192) + b"\n",
+}
+
+FRAMERS = {
+    "NWA": sc.TerminatorFramer(b"\n"),
+    "ARDU": sc.TerminatorFramer(b"\n"),
+    "OPC": sc.BlockFramer(b"\n"),
+    "SPEC": sc.BlockFramer(b"\n"),
+}
+
+class FakeInstrument(threading.Thread):
+    """
+    Single connection server that replies to each newline terminated query
+    with the matching entry from RESPONSES.
+    """
+
+    def __init__(self):
+        super(FakeInstrument, self).__init__(daemon=True)
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+
+    def run(self):
+        conn, _ = self.server.accept()
+        pending = b''
+        while True:
+            buff = conn.recv(2048)
+            if not buff:
+                break
+            pending += buff
+            while b'\n' in pending:
+                query, pending = pending.split(b'\n', 1)
+                conn.sendall(RESPONSES[query.decode()])
+        conn.close()
+
+def time_requests(comm, sock, name, framer, timeout, repeats):
+
+    start = time.perf_counter()
+    for _ in range(repeats):
+        comm._flush_input(sock)
+        comm._send_command(sock, name)
+        data = comm._read_data(sock, timeout=timeout, framer=framer)
+        assert len(data) > 0
+    return (time.perf_counter() - start) / repeats
+
+def main():
+
+    fake = FakeInstrument()
+    fake.start()
+
+    comm = sc.SocketComm()
+    sock = comm._socket_connect("127.0.0.1", fake.port)
+
+    timeout = 1
+    repeats = 3
+
+    print("request  idle-timeout (s)  framed (s)  saved (s)")
+    for name in RESPONSES:
+        idle = time_requests(comm, sock, name, None, timeout, repeats)
+        framed = time_requests(comm, sock, name, FRAMERS[name], timeout, repeats)
+        print("%-8s %16.4f %11.4f %10.4f" % (name, idle, framed, idle - framed))
+
+    sock.close()
+
+if __name__ == "__main__":
+    main()
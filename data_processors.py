@@ -1,53 +1,159 @@
-import re  # re.split
 from scipy.optimize import leastsq  # least squares curve fitting
 import numpy as np  # numpy arrays
 import color_printer as cp
 import os
 import time
 import subprocess
+import collections
+import functools
+import json
+import struct
+import threading
+import queue
+import atexit
+import sqlite3
+import zlib
+import lzma
+
+# columns of a measurement, the array equivalent of the list of triples
+# returned by Convertor.make_plot_points
+PlotArrays = collections.namedtuple('PlotArrays', ['frequencies', 'cavity_length', 'powers'])
+
+@functools.lru_cache(maxsize=64)
+def _frequency_axis(num_points, min_frequency, max_frequency):
+    """
+    Frequency (MHz, rounded to whole MHz) of each point of a measurement, as
+    assigned by Convertor. Cached since the same spans and window centers are
+    measured over and over, the returned array is read only.
+    """
+    
+    indices = np.arange(1, num_points + 1)
+    frequencies = np.round(indices * (max_frequency - min_frequency) / num_points + min_frequency)
+    frequencies.setflags(write=False)
+    
+    return frequencies
 
 # convert either a list of strings, or a single string
 # into a list of floats
 
 class Convertor:
     
+    def parse_powers(self, raw_data):
+        """
+        Parse raw data into an array of power values.
+        
+        Args:
+            raw_data: Either a list of strings or a single string of comma or newline
+            seperated values, or a list of NumPy arrays (or a single array) from a binary transfer
+            
+        Returns:
+            contiguous float64 NumPy array
+            
+        Raises:
+            ValueError: if any value is not a number, eg because a transfer was truncated
+        """
+        
+        if self._is_binary(raw_data):
+            return np.ascontiguousarray(self._join_arrays(raw_data), dtype=np.float64)
+        
+        # unlike np.fromstring(), which stops at the first malformed value, this
+        # fails on any value that float() would not accept
+        total_str = ''.join(raw_data).strip().replace('\n', ',')
+        return np.array(total_str.split(','), dtype=np.float64)
+    
     def str_list_to_power_list(self, raw_strs):
+        """
+        List equivalent of parse_powers(), kept for callers that expect Python floats.
+        """
+        return self.parse_powers(raw_strs).tolist()
     
-        total_str = ''.join(raw_strs)
-        power_list = total_str.strip()
-        power_list = re.split(',|\n', power_list)
-        power_list = [float(y) for y in power_list]
+    def _is_binary(self, raw_data):
+        """
+        Check whether raw data is a NumPy array, or a list of NumPy arrays,
+        rather than a string or list of strings.
+        """
+        if isinstance(raw_data, np.ndarray):
+            return True
+        return len(raw_data) > 0 and isinstance(raw_data[0], np.ndarray)
     
-        return power_list
+    def _join_arrays(self, raw_data):
+        """
+        Join either a list of NumPy arrays, or a single array into one array.
+        """
+        if isinstance(raw_data, np.ndarray):
+            return raw_data
+        return np.concatenate(raw_data)
     
     def power_list_to_str(self, power_list, center_freq, freq_window, cavity_length):
+        
+        frequencies, powers = self.power_list_to_arrays(power_list, center_freq, freq_window)
+        
+        # same formatting as str([frequency, cavity_length, power]) with spaces and brackets removed
+        trans_table = dict.fromkeys(map(ord, ' []'), None)
+        length_str = str([cavity_length]).translate(trans_table)
+        
+        return ''.join("%d,%s,%r\n" % (frequency, length_str, power)
+                       for frequency, power in zip(frequencies.astype(int).tolist(), powers.tolist()))
     
-        plot_points = []
-    
+    def power_list_to_arrays(self, power_list, center_freq, freq_window):
+        """
+        Array equivalent of power_list_to_str(), for ModeTrack's array interface.
+        
+        Returns:
+            (frequencies, powers) contiguous float64 NumPy arrays, frequencies is read only
+        """
+        
         max_length = round(center_freq) + freq_window / 2
         min_length = round(center_freq) - freq_window / 2
-        num_points = len(power_list)
-    
-        for idx, power in enumerate(power_list):
-            frequency = (idx + 1) * (max_length - min_length) / (num_points) + min_length
-            frequency = int(round(frequency))
-            plot_points.append([frequency, cavity_length, power])
+        
+        powers = np.array(power_list, dtype=np.float64)
+        
+        return _frequency_axis(len(powers), min_length, max_length), powers
     
-        freq_window_str = ''
-        for triple in plot_points:
-            temp_str = str(triple)
-            trans_table = dict.fromkeys(map(ord, ' []'), None)
-            temp_str = temp_str.translate(trans_table)
-            freq_window_str += temp_str + "\n"
+    def plot_points_to_arrays(self, formatted_points):
+        """
+        Split the output of make_plot_points() into columns, for ModeTrack's array interface.
+        The output of make_plot_arrays() is returned as is.
+        
+        Returns:
+            PlotArrays(frequencies, cavity_length, powers) where frequencies and powers are
+            contiguous float64 NumPy arrays
+        """
+        
+        if isinstance(formatted_points, PlotArrays):
+            return formatted_points
+        
+        points = np.array(formatted_points, dtype=np.float64)
+        
+        frequencies = np.ascontiguousarray(points[:, 0])
+        powers = np.ascontiguousarray(points[:, 2])
+        
+        return PlotArrays(frequencies, points[0, 1], powers)
     
-        return freq_window_str
+    def make_plot_arrays(self, raw_data, cavity_length, min_frequency, max_frequency):
+        """
+        Columnar equivalent of make_plot_points(), without building a Python list per point.
+        
+        Args:
+            see make_plot_points()
+            
+        Returns:
+            PlotArrays(frequencies, cavity_length, powers) where frequencies (MHz, read only)
+            and powers (dBm) are contiguous float64 NumPy arrays
+        """
+        
+        powers = self.parse_powers(raw_data)
+        frequencies = _frequency_axis(len(powers), min_frequency, max_frequency)
+        
+        return PlotArrays(frequencies, cavity_length, powers)
     
     def make_plot_points(self, raw_data, cavity_length, min_frequency, max_frequency):
         """Convert collected data into a format suitable for saving or processing.
         Output data will be a list of triples (Frequency(mHz),Cavity Length(in),Power(dBm))
     
         Args:
-            raw_data:Either a list of strings or a single string in comma seperated format
+            raw_data:Either a list of strings or a single string in comma seperated format,
+            or a list of NumPy arrays (or a single array) from a binary transfer
             cavity_length:The current length of the cavity in inches
             nominal_centers:RunTimeParameters class
     
@@ -55,28 +161,76 @@ class Convertor:
             plot_points, a list of data triples with the format described above
         """
         
-        # If input is a -list- of strings join together to form a single string
-        # If input is a single string, do nothing
-        total_str = ''.join(raw_data)
-        # remove end of field characters which would mess-up split
-        power_list = total_str.strip()
-        # Since we are expecting a comma seperated list of strings (or single string)
-        # we split on command or newlines to remove these special characters
-        power_list = re.split(',|\n', power_list)
-    
-        power_list = [float(y) for y in power_list]
-        num_points = len(power_list)
+        plot_arrays = self.make_plot_arrays(raw_data, cavity_length, min_frequency, max_frequency)
         
-        formatted_points = []
+        return [[frequency, cavity_length, power] for frequency, power
+                in zip(plot_arrays.frequencies.astype(int).tolist(), plot_arrays.powers.tolist())]
     
-        for idx, power in enumerate(power_list):
+def _as_windows(fit_data):
+    """
+    Power spectra in dBm, either a single window or one window per row, as a
+    2D float64 array of power in mW.
+    """
+    return 10. ** (np.atleast_2d(np.asarray(fit_data, dtype=np.float64)) / 10)
 
-            frequency = (idx + 1) * (max_frequency - min_frequency) / (num_points) + min_frequency
-            frequency = int(round(frequency))
-            formatted_points.append([frequency, cavity_length, power])
+def _half_power_points(mw_windows, center_freqs, freq_window):
+    """
+    Locate the half maximum power crossings on either side of the peak of each window,
+    linearly interpolating between the points either side of each crossing.
+    
+    Args:
+        mw_windows: 2D array of power in mW, one window per row
+        center_freqs: center frequency of each window in MHz, or one for all windows
+        freq_window: width of the windows in MHz
+        
+    Returns:
+        (max_power_frequency, midpoint, hwhm, max_power) arrays with one entry per window,
+        where max_power_frequency is the frequency of the highest point and midpoint lies
+        midway between the two crossings. Point i of a window lies at
+        center_freq - freq_window/2 + i*freq_window/num_points.
+    """
+    
+    num_windows, num_points = mw_windows.shape
+    rows = np.arange(num_windows)
+    indices = np.arange(num_points)
+    
+    max_index = np.argmax(mw_windows, axis=1)
+    max_power = mw_windows[rows, max_index]
+    half_power = max_power[:, np.newaxis] / 2
+    below = mw_windows < half_power
+    
+    # nearest point below half power on either side of the peak,
+    # the ends of the window if the power never drops that far
+    left = np.where(below & (indices < max_index[:, np.newaxis]), indices, -1).max(axis=1)
+    right = np.where(below & (indices > max_index[:, np.newaxis]), indices, num_points).min(axis=1)
+    
+    left_edge = left < 0
+    right_edge = right >= num_points
+    left = np.where(left_edge, 0, left)
+    right = np.where(right_edge, num_points - 1, right)
+    
+    # interpolate between the point below half power and its neighbour towards the peak
+    left_inner = mw_windows[rows, np.minimum(left + 1, num_points - 1)]
+    right_inner = mw_windows[rows, np.maximum(right - 1, 0)]
+    left_outer = mw_windows[rows, left]
+    right_outer = mw_windows[rows, right]
+    half_power = half_power[:, 0]
     
-        return formatted_points
+    with np.errstate(divide='ignore', invalid='ignore'):
+        left_crossing = left + (half_power - left_outer) / (left_inner - left_outer)
+        right_crossing = right - (half_power - right_outer) / (right_inner - right_outer)
+    left_crossing = np.where(left_edge, 0.0, left_crossing)
+    right_crossing = np.where(right_edge, num_points - 1.0, right_crossing)
     
+    bin_width = freq_window / num_points
+    min_frequency = np.asarray(center_freqs, dtype=np.float64) - freq_window / 2
+    
+    max_power_frequency = min_frequency + bin_width * max_index
+    midpoint = min_frequency + bin_width * (left_crossing + right_crossing) / 2
+    hwhm = bin_width * (right_crossing - left_crossing) / 2
+    
+    return max_power_frequency, midpoint, hwhm, max_power
+
 class NouveauLorentzianFitter:
     
     def __init__(self):
@@ -98,69 +252,38 @@ class NouveauLorentzianFitter:
             freq_window: tne width of the frequency window in MHz
             
         Returns:
-            data triple in the format [Q, Max Power Frequency (dBm), HWHM(MHz)]
+            data triple in the format [Q, Max Power Frequency (MHz), HWHM(MHz)]. The
+            HWHM is measured between the half power crossings, interpolated between
+            points, and Q is the max power frequency over the FWHM
         """
         return self.__determine_Q(fit_data, center_freq, freq_window)
     
-    def __get_min_delta_index(self, search_list, reference ):
+    def fit_batch(self, fit_data, center_freqs, freq_window):
         """
-        Compare all elements in a list to a reference and determine which element
-        is the closest to the reference.
-        The list under comparison MUST have a reference level of ZERO.
+        Same as __call__ for many windows at once, without printing.
         
         Args:
-            search_list, the list of data to be compared to the reference value
-            reference, the element to be compared against. Needs to be strictly positive.
+            fit_data: power spectra in dBm, one window per row
+            center_freqs: center frequency of each window, or one for all windows
+            freq_window: the width of the frequency windows in MHz
             
         Returns:
-            The index of whatever element was closest to 'reference'
-            If multiple elements are all equally close to 'reference' return the
-            element with the highest index (Python's behaviour, not mine)
-        """
-            
-        delta_list = [ abs(val - reference) for val in search_list ]
-        
-        min_delta = min ( delta_list )
-        return delta_list.index( min_delta )
-    
-    def __convert_to_mwatts(self, power_list):
+            array with one row [Q, Max Power Frequency (MHz), HWHM(MHz)] per window
         """
-        Convert a power spectrum from units of dBm to units of milliWatts
-        
-        Args:
-            power_list, list of power data in dBm
         
-        Returns:
-            List of power data in mW
-        """
-        return [10.**(dbm_power / 10) for dbm_power in power_list]
-    
-    def __set_zero_reference(self, power_list):
+        max_power_frequency, _, hwhm, _ = _half_power_points(_as_windows(fit_data), center_freqs, freq_window)
         
-        min_power = min (power_list)
-        return [ (power - min_power) for power in power_list]
+        return np.column_stack((max_power_frequency / (2 * hwhm), max_power_frequency, hwhm))
         
     def __determine_Q(self, freq_window, center_frequency, frequency_span ):
         
-        max_power_dbm = max( freq_window )
-        
-        mw_power_list = self.__convert_to_mwatts( freq_window )
-
-        max_power_mw = max ( mw_power_list )
-        
-        max_power_index = mw_power_list.index( max_power_mw )
-
-        half_max_power = max_power_mw / 2
-        
-        index_left_side = self.__get_min_delta_index( mw_power_list[:max_power_index], half_max_power )
-
-        index_right_side = self.__get_min_delta_index( mw_power_list[max_power_index:], half_max_power )
-        index_right_side += ( max_power_index )
-        
-        FWHM = frequency_span*abs(index_left_side - index_right_side)/len(freq_window)
+        mw_windows = _as_windows(freq_window)
+        max_power_frequency, _, hwhm, max_power_mw = _half_power_points(mw_windows, center_frequency,
+                                                                       frequency_span)
         
-        min_frequency = center_frequency - frequency_span / 2
-        max_power_frequency = ( max_power_index * frequency_span ) / (len( freq_window )) + min_frequency
+        max_power_frequency = max_power_frequency[0]
+        FWHM = 2 * hwhm[0]
+        max_power_dbm = 10 * np.log10(max_power_mw[0])
         
         # Print parameters to terminal
         self.print_purple("Parameters:")
@@ -185,6 +308,24 @@ class LorentzianFitter:
     def __call__(self, fit_data, center_freq, freq_window):
         return self.__fit_lorentzian(fit_data, center_freq, freq_window)
         
+    def fit_batch(self, fit_data, center_freqs, freq_window):
+        """
+        Fit a Lorentzian to many windows at once, without printing. The starting
+        values of every window are found together, see _half_power_points().
+        
+        Args:
+            fit_data: power spectra in dBm, one window per row
+            center_freqs: center frequency of each window, or one for all windows
+            freq_window: the width of the frequency windows in MHz
+            
+        Returns:
+            array with one row [Q, Center Frequency (MHz), HWHM(MHz)] per window
+        """
+        
+        p = self.__least_squares(_as_windows(fit_data), center_freqs, freq_window)
+        
+        return np.column_stack((p[:, 1] / (2 * p[:, 0]), p[:, 1], p[:, 0]))
+    
     def __lorentzian(self, x, p):
         """Calculate Lorentz Line Shape.
     
@@ -196,6 +337,21 @@ class LorentzianFitter:
         numerator = p[0] ** 2
         denominator = (x - p[1]) ** 2 + p[0] ** 2
         return p[2] * (numerator / denominator)
+    
+    def __jacobian(self, p, y, x, center_freq, freq_window):
+        """
+        Derivatives of __residuals() with respect to [HWHM, Center, Height],
+        one column per parameter, passed to leastsq as Dfun.
+        """
+        
+        delta = x - p[1]
+        denominator = delta ** 2 + p[0] ** 2
+        shape = p[0] ** 2 / denominator
+        
+        d_hwhm = 2 * p[2] * p[0] * delta ** 2 / denominator ** 2
+        d_center = 2 * p[2] * shape * delta / denominator
+        
+        return -np.column_stack((d_hwhm, d_center, shape))
 
     # check whether parameters [HWHM, center, height] are within reasonable bounds
     def __within_bounds(self, p, center_freq, freq_window):
@@ -225,33 +381,50 @@ class LorentzianFitter:
             err = y - self.__lorentzian(x, p)
             return err
         else:
-            return 1e6
+            # leastsq needs a residual per point, a large one rejects the step
+            return np.full(len(y), 1e6)
     
-    def __fit_lorentzian(self, fit_data, center_freq, freq_window):
+    def __least_squares(self, mw_windows, center_freqs, freq_window):
+        """
+        Fit a Lorentzian to the middle fifth of each window with leastsq, using the
+        analytic jacobian and starting from the half power points of the window.
+        
+        Returns:
+            2D array with one row [HWHM, Center, Height] per window
+        """
+        
+        num_windows, nwa_points = mw_windows.shape
+        center_freqs = np.broadcast_to(np.asarray(center_freqs, dtype=np.float64), (num_windows,))
+        
+        # get x values from center frequency and span
+        nwa_xw = (center_freqs[:, np.newaxis] - freq_window / 2
+                  + freq_window * np.arange(nwa_points) / nwa_points)
+        
+        # define middle values to fit to
+        middle = ((2 * nwa_points / 5 < np.arange(nwa_points)) & (np.arange(nwa_points) < 3 * nwa_points / 5))
+        x = nwa_xw[:, middle]
+        y = mw_windows[:, middle]
+        
+        # initial values for fit: [HWHM, peak center, height]
+        _, center, hwhm, height = _half_power_points(mw_windows, center_freqs, freq_window)
+        p = np.column_stack((hwhm, center, height))
+        
+        for window in range(num_windows):
+            p[window] = leastsq(self.__residuals, p[window], Dfun=self.__jacobian,
+                                args=(y[window], x[window], center_freqs[window], freq_window))[0]
+        
+        return p
     
-        nwa_points = len(fit_data)
+    def __fit_lorentzian(self, fit_data, center_freq, freq_window):
     
         print ("Fitting data")
         try:
-            nwa_yw = [float(y) for y in fit_data]
+            nwa_yw = _as_windows([float(y) for y in fit_data])
         except ValueError as exc:
             print ("Could not convert to float: ", exc)
+            raise
     
-        # convert from dBm to power (mW)
-        nwa_yw = [10.**(y / 10) for y in nwa_yw]
-        # get x values from center frequency and span
-        nwa_xw = [(center_freq - (freq_window / 2) + \
-                freq_window * (float(x) / nwa_points)) for x in range(nwa_points)]
-        # convert to arrays
-        nwa_xw = np.array(nwa_xw)
-        nwa_yw = np.array(nwa_yw)
-    
-        # define middle values to fit to
-        middle = ((2 * nwa_points / 5 < np.arange(nwa_points)) & (np.arange(nwa_points) < 3 * nwa_points / 5))
-        # initial values for fit: [HWHM, peak center, height]
-        p = [25, center_freq, nwa_yw[nwa_points / 2]]
-        
-        pbest = leastsq(self.__residuals, p, args=(nwa_yw[middle], nwa_xw[middle], center_freq, freq_window))[0]
+        pbest = self.__least_squares(nwa_yw, center_freq, freq_window)[0]
     
         fitted_hwhm = pbest[0]
         fitted_center_freq = pbest[1]
@@ -273,11 +446,317 @@ class LorentzianFitter:
     
         return output_triple
     
+class WriteBehindQueue:
+    """
+    Bounded queue of file writes carried out by a dedicated writer thread, so that
+    a slow disk or network mount does not stall data taking.
+    
+    Jobs are either writes of text or bytes to a file, see write(), or any other
+    callable, see submit(), eg a saver that manages its own files. Jobs run in the
+    order they were queued. The writer takes every job waiting in the queue as one
+    batch, and consecutive writes to the same file within a batch are made with a
+    single open. When the queue is full the caller blocks until there is room
+    (backpressure), the time spent waiting is reported by metrics().
+    
+    Files are flushed to disk with fsync according to 'fsync_policy':
+        'always': after every batch
+        'interval': at most once every 'fsync_interval' seconds, and on flush()
+        'never': left to the operating system
+    
+    Example usage:
+        writer = WriteBehindQueue(max_depth=16)
+        writer.write(path, out_str, 'w+', on_written=lambda: transfer(path))
+        writer.submit(lambda: saver(data, header))
+        writer.flush()
+    """
+    
+    def __init__(self, max_depth=16, fsync_policy='interval', fsync_interval=1.0):
+        """
+        Args:
+            max_depth: number of jobs that may be waiting before callers block
+            fsync_policy: 'always', 'interval' or 'never', see above
+            fsync_interval: seconds between fsyncs for the 'interval' policy
+        """
+        
+        if fsync_policy not in ('always', 'interval', 'never'):
+            raise ValueError("Unknown fsync policy: " + str(fsync_policy))
+        
+        self.fsync_policy = fsync_policy
+        self.fsync_interval = fsync_interval
+        
+        self.jobs = queue.Queue(max_depth)
+        self.metrics_lock = threading.Lock()
+        self.unsynced_paths = set()
+        self.last_fsync = time.time()
+        self.closed = False
+        
+        self.counters = {
+            'submitted': 0, 'completed': 0, 'errors': 0, 'batches': 0, 'bytes_written': 0,
+            'fsyncs': 0, 'max_depth': 0, 'total_latency': 0.0, 'max_latency': 0.0,
+            'backpressure_waits': 0, 'backpressure_time': 0.0}
+        
+        self.writer_thread = threading.Thread(target=self.__write_loop, daemon=True)
+        self.writer_thread.start()
+        
+        # the thread is a daemon so that it can not keep the interpreter alive,
+        # make sure queued writes reach the disk before it is stopped
+        atexit.register(self.close)
+    
+    def write(self, path, data, mode='a', on_written=None):
+        """
+        Queue a write of 'data' to the file at 'path'.
+        
+        Args:
+            path: file to write to
+            data: str, or bytes for a binary mode
+            mode: mode to open the file with, eg 'a' to append or 'w+' to replace
+            on_written: optional callable, run by the writer thread once the data has been written
+        """
+        self.__put(('write', path, data, mode, on_written))
+    
+    def submit(self, func):
+        """
+        Queue a call of 'func' on the writer thread.
+        """
+        self.__put(('call', func))
+    
+    def __put(self, job):
+        
+        if self.closed:
+            raise RuntimeError("WriteBehindQueue is closed")
+        
+        item = (time.perf_counter(), job)
+        try:
+            self.jobs.put_nowait(item)
+        except queue.Full:
+            start = time.perf_counter()
+            self.jobs.put(item)
+            with self.metrics_lock:
+                self.counters['backpressure_waits'] += 1
+                self.counters['backpressure_time'] += time.perf_counter() - start
+        
+        with self.metrics_lock:
+            self.counters['submitted'] += 1
+            self.counters['max_depth'] = max(self.counters['max_depth'], self.jobs.qsize())
+    
+    def __write_loop(self):
+        
+        while True:
+            batch = [self.jobs.get()]
+            while True:
+                try:
+                    batch.append(self.jobs.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = self.__run_batch(batch)
+            
+            for _ in batch:
+                self.jobs.task_done()
+            
+            if stop:
+                return
+    
+    def __run_batch(self, batch):
+        """
+        Run a batch of jobs.
+        
+        Returns:
+            True if the batch held the request to stop the writer thread
+        """
+        
+        stop = False
+        index = 0
+        
+        while index < len(batch):
+            submitted, job = batch[index]
+            
+            if job[0] == 'stop':
+                stop = True
+                index += 1
+                continue
+            
+            if job[0] == 'call':
+                self.__run_job(job[1])
+                self.__completed([submitted])
+                index += 1
+                continue
+            
+            # merge consecutive writes to the same file in the same mode, a file that
+            # is replaced only needs its last contents written
+            _, path, data, mode, on_written = job
+            chunks = [data]
+            callbacks = [on_written]
+            times = [submitted]
+            index += 1
+            
+            while index < len(batch):
+                next_job = batch[index][1]
+                if next_job[0] != 'write' or next_job[1] != path or next_job[3] != mode:
+                    break
+                
+                _, _, data, _, on_written = next_job
+                if 'a' in mode:
+                    chunks.append(data)
+                    callbacks.append(on_written)
+                else:
+                    chunks = [data]
+                    callbacks = [on_written]
+                times.append(batch[index][0])
+                index += 1
+            
+            contents = (b'' if 'b' in mode else '').join(chunks)
+            
+            if self.__run_job(lambda: self.__write_file(path, contents, mode)):
+                for callback in callbacks:
+                    if callback is not None:
+                        self.__run_job(callback)
+            self.__completed(times)
+        
+        with self.metrics_lock:
+            self.counters['batches'] += 1
+        
+        if self.fsync_policy == 'always' or stop or \
+                (self.fsync_policy == 'interval' and time.time() - self.last_fsync >= self.fsync_interval):
+            self.__fsync()
+        
+        return stop
+    
+    def __write_file(self, path, contents, mode):
+        
+        with open(path, mode) as out_file:
+            out_file.write(contents)
+        
+        if self.fsync_policy != 'never':
+            self.unsynced_paths.add(path)
+        
+        with self.metrics_lock:
+            self.counters['bytes_written'] += len(contents)
+    
+    def __fsync(self):
+        
+        for path in self.unsynced_paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                print("Could not fsync " + path + ": " + str(e))
+        
+        if len(self.unsynced_paths) > 0:
+            with self.metrics_lock:
+                self.counters['fsyncs'] += len(self.unsynced_paths)
+        
+        self.unsynced_paths.clear()
+        self.last_fsync = time.time()
+    
+    def __run_job(self, func):
+        """
+        Returns:
+            True if 'func' ran without raising an exception
+        """
+        try:
+            func()
+            return True
+        except Exception as e:
+            print("Write-behind job failed: " + str(e))
+            with self.metrics_lock:
+                self.counters['errors'] += 1
+            return False
+    
+    def __completed(self, submit_times):
+        
+        now = time.perf_counter()
+        with self.metrics_lock:
+            for submitted in submit_times:
+                latency = now - submitted
+                self.counters['completed'] += 1
+                self.counters['total_latency'] += latency
+                self.counters['max_latency'] = max(self.counters['max_latency'], latency)
+    
+    def flush(self):
+        """
+        Block until every job queued so far has run, and fsync written files
+        unless the policy is 'never'.
+        """
+        if self.closed:
+            return
+        
+        if self.fsync_policy != 'never':
+            self.submit(self.__fsync)
+        
+        done = threading.Event()
+        self.submit(done.set)
+        done.wait()
+    
+    def close(self):
+        """
+        Run every queued job, fsync written files and stop the writer thread.
+        Safe to call more than once.
+        """
+        if self.closed:
+            return
+        
+        self.closed = True
+        self.jobs.put((time.perf_counter(), ('stop',)))
+        self.writer_thread.join()
+    
+    def metrics(self):
+        """
+        Returns:
+            dictionary holding the current queue 'depth' and the counters kept since the
+            queue was created: jobs 'submitted', 'completed' and failed ('errors'),
+            'batches', 'bytes_written', files 'fsyncs', the largest depth seen ('max_depth'),
+            the 'mean_latency' and 'max_latency' from queuing a job to it completing (s),
+            and how often ('backpressure_waits') and for how long ('backpressure_time', s)
+            callers were blocked by a full queue
+        """
+        
+        with self.metrics_lock:
+            metrics = dict(self.counters)
+        
+        metrics['depth'] = self.jobs.qsize()
+        metrics['mean_latency'] = metrics['total_latency'] / max(metrics['completed'], 1)
+        del metrics['total_latency']
+        
+        return metrics
+    
+def _parse_data_header(header_string):
+    """
+    Parse the 'name;value' lines built by ModeTracker._build_data_header.
+    
+    Returns:
+        ordered dictionary of the values as floats, NaN where a value is not a number
+    """
+    
+    metadata = collections.OrderedDict()
+    if header_string is None:
+        return metadata
+    
+    for line in header_string.splitlines():
+        if not line:
+            continue
+        name, _, value = line.partition(';')
+        try:
+            metadata[name] = float(value)
+        except ValueError:
+            metadata[name] = float('nan')
+    
+    return metadata
+    
 class FlatFileSaver:
     
-    def __init__(self, root_dir ):
+    def __init__(self, root_dir, catalog = None ):
+        """
+        Args:
+            root_dir: folder, relative to this file, to make the run folder in
+            catalog: optional RunCatalog to record every saved spectrum in
+        """
         
         self.root_dir = root_dir
+        self.catalog = catalog
         self.directory = self.__get_folder_name()
         
         self.__make_empty_data_folder(self.directory)
@@ -309,6 +788,27 @@ class FlatFileSaver:
         else:
             return os.path.join(str(opt) + str(idx) + '.csv')
     
+    def _tag_header(self, header_string, iteration):
+        """
+        Add the iteration of the program to a data header, so that RunCatalog.rebuild()
+        files the spectrum under the same iteration as the saver did.
+        """
+        
+        header_string = '' if header_string is None else header_string
+        if header_string and not header_string.endswith("\n"):
+            header_string += "\n"
+        
+        return header_string + "iteration;" + str(iteration) + "\n"
+    
+    def _add_to_catalog(self, iteration, header_string, file_path, offset, data_format):
+        """
+        Record a saved spectrum in the catalog, if there is one. See RunCatalog.add()
+        """
+        
+        if self.catalog is not None:
+            self.catalog.add(self.directory, iteration, _parse_data_header(header_string),
+                             file_path, offset, data_format)
+    
     def _append_to_data( self, data , file_path, header_string = None):
         
         out_file = open(file_path, 'a')
@@ -329,9 +829,17 @@ class FlatFileSaver:
         
 class DigitizerSaver( FlatFileSaver ):
     
-    def __init__(self, root_dir, sa_type = 'R+F'):
+    def __init__(self, root_dir, sa_type = 'R+F', codec = 'zlib', level = None, catalog = None):
+        """
+        Args:
+            root_dir: folder, relative to this file, to make the run folder in
+            sa_type: 'R' raw text, 'F' formatted text, 'R+F' both, one file per spectrum,
+            or 'Z' for a single compressed stream of float32 spectra, see SpectrumStreamWriter
+            codec, level: compression used by 'Z', see SpectrumStreamWriter
+            catalog: optional RunCatalog to record every saved spectrum in
+        """
 
-        super(DigitizerSaver, self).__init__( root_dir )
+        super(DigitizerSaver, self).__init__( root_dir, catalog )
         
         if (sa_type == 'R'):
             self.__call_back = self.__save_raw_data
@@ -343,22 +851,50 @@ class DigitizerSaver( FlatFileSaver ):
             self.convertor = Convertor()
             self.__call_back = self.__save_raw_and_formatted
             
+        elif( sa_type == 'Z'):
+            self.convertor = Convertor()
+            self.stream = SpectrumStreamWriter(self.directory + 'SA.spectra', codec, level)
+            self.__call_back = self.__save_compressed
+            
         self.counter = 0
          
-    def __call__(self, data, header_string = None):
+    def __call__(self, data, header_string = None, iteration = None):
+        """
+        Args:
+            data: raw data from the signal analyzer, text or a NumPy array
+            header_string: 'name;value' lines as built by ModeTracker._build_data_header
+            iteration: iteration of the program the spectrum was taken in, catalogued
+            and added to the header. The number of spectra saved so far if not given.
+            
+        Returns:
+            number of spectra saved
+        """
+        
+        iteration = self.counter if iteration is None else iteration
         
-        self.__call_back( data, header_string )
+        self.__call_back( data, self._tag_header(header_string, iteration), iteration )
         self.counter += 1
         
         return self.counter
     
-    def __save_raw_data(self, raw_data, header_string):
+    def close(self):
+        
+        # only 'Z' keeps a file open between spectra
+        if hasattr(self, 'stream'):
+            self.stream.close()
+    
+    def __save_raw_data(self, raw_data, header_string, iteration):
         
         path = self._generate_save_file_name(self.counter, 'SA_R')
         file_path = self.directory + path
         
+        # binary transfers from the signal analyzer arrive as float32 arrays,
+        # printing them directly would abbreviate the data
+        if isinstance(raw_data, np.ndarray):
+            raw_data = ','.join(raw_data.astype(str))
+
         out_file = open(file_path, 'a')
-        
+
         print(header_string, end="\n", file=out_file)
         print(raw_data, end="\n", file=out_file)
         
@@ -367,19 +903,941 @@ class DigitizerSaver( FlatFileSaver ):
         
         out_file.close()
         
-    def __save_formatted_data( self, formatted_data, header_string ):
+        self._add_to_catalog(iteration, header_string, file_path, 0, 'R')
+        
+    def __save_formatted_data( self, formatted_data, header_string, iteration, add_to_catalog = True ):
         
         path = self._generate_save_file_name(self.counter, 'SA_F')
         file_path = self.directory + path
         
         self._append_to_data( formatted_data, file_path, header_string )
         
-    def __save_raw_and_formatted(self, raw_data, header_string ):
+        if add_to_catalog:
+            self._add_to_catalog(iteration, header_string, file_path, 0, 'F')
+        
+    def __save_compressed(self, raw_data, header_string, iteration):
+        
+        offset = self.stream.append(self.convertor.parse_powers(raw_data), header_string)
+        self._add_to_catalog(iteration, header_string, self.stream.path, offset, 'Z')
         
-        self.__save_raw_data( raw_data, header_string )
+        out_str = "Wrote spectrum " + str(self.counter) + " to " + self.stream.path
+        print (out_str)
+        
+    def __save_raw_and_formatted(self, raw_data, header_string, iteration ):
+        
+        self.__save_raw_data( raw_data, header_string, iteration )
         formatted_data = self.convertor.str_list_to_power_list(raw_data)
         
-        self.__save_formatted_data(formatted_data, header_string)
+        # the raw file is catalogued, both hold the same spectrum
+        self.__save_formatted_data(formatted_data, header_string, iteration, add_to_catalog = False)
+
+class NpySegment:
+    """
+    A .npy file that rows can be appended to.
+    
+    The header is given enough room for the largest shape the segment may reach,
+    so each append writes the new rows at the end of the file and then rewrites the
+    header in place with the new row count. The file is a valid .npy file holding
+    every complete row after each append, and can be read with np.load().
+    """
+    
+    def __init__(self, path, dtype, row_shape=(), max_rows=1, resume=False):
+        """
+        Args:
+            path: file to create, any existing file is replaced unless 'resume' is set
+            dtype: NumPy data type of the rows
+            row_shape: shape of each row, ie the array holds (rows,) + row_shape
+            max_rows: largest number of rows the header must have room for
+            resume: append to the rows already in 'path', if it exists. The file must have
+            been written by NpySegment with the same dtype, row_shape and max_rows.
+        """
+        
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.row_shape = tuple(row_shape)
+        self.rows = 0
+        
+        # .npy 1.0 header, padded so that the data starts on a 64 byte boundary
+        self.header_size = 64 * ((len(self.__header_dict(max_rows)) + 12 + 63) // 64)
+        
+        if resume and os.path.exists(path):
+            self.out_file = open(path, 'rb+')
+            self.__read_header()
+        else:
+            self.out_file = open(path, 'wb+')
+            self.__write_header()
+    
+    def __read_header(self):
+        
+        version = np.lib.format.read_magic(self.out_file)
+        if version != (1, 0):
+            raise ValueError(self.path + " was not written by NpySegment")
+        
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(self.out_file)
+        if dtype != self.dtype or tuple(shape[1:]) != self.row_shape or self.out_file.tell() != self.header_size:
+            raise ValueError(self.path + " does not hold rows of " + str(self.dtype) + " with shape "
+                             + str(self.row_shape))
+        
+        self.rows = shape[0]
+    
+    def __header_dict(self, rows):
+        
+        return "{'descr': %r, 'fortran_order': False, 'shape': %r, }" \
+            % (np.lib.format.dtype_to_descr(self.dtype), (rows,) + self.row_shape)
+    
+    def __write_header(self):
+        
+        header = self.__header_dict(self.rows)
+        header = header.ljust(self.header_size - 11) + '\n'
+        
+        self.out_file.seek(0)
+        self.out_file.write(b'\x93NUMPY\x01\x00' + struct.pack('<H', len(header)) + header.encode('latin1'))
+    
+    def append(self, rows):
+        """
+        Args:
+            rows: array of shape (n,) + row_shape, or row_shape for a single row
+        """
+        
+        rows = np.ascontiguousarray(rows, dtype=self.dtype)
+        
+        self.out_file.seek(self.header_size + self.rows * self.dtype.itemsize * int(np.prod(self.row_shape)))
+        self.out_file.write(rows.tobytes())
+        
+        self.rows += rows.size // int(np.prod(self.row_shape))
+        self.__write_header()
+        self.out_file.flush()
+    
+    def close(self):
+        self.out_file.close()
+
+class RunArchive:
+    """
+    Chunked binary archive of the power spectra taken during a run.
+    
+    The archive is a folder holding the run config as 'config.json' and pairs of
+    .npy segments, 'spectra_<n>.npy' with one float32 spectrum per row and
+    'metadata_<n>.npy' with one record per spectrum. Records hold the iteration,
+    a time stamp and the fields passed to append(), eg Q, center frequency, HWHM
+    and cavity length. A new pair of segments is started every 'chunk_size'
+    spectra, or when the spectrum length or metadata fields change, so each
+    append only ever writes to the end of the current segments.
+    
+    Example usage:
+        archive = RunArchive(path, config=data_dict)
+        archive.append(spectrum, {'Q': 1e4, 'cavity_length': 7.25})
+        spectra, metadata, config = load_run_archive(path)
+    """
+    
+    def __init__(self, directory, config=None, chunk_size=64):
+        """
+        Args:
+            directory: folder for the archive, created if needed. Segments already
+            in the folder are kept and new spectra go into new segments.
+            config: run config to store, eg ConfigTypes.data_dict
+            chunk_size: number of spectra per segment
+        """
+        
+        self.directory = directory
+        self.chunk_size = chunk_size
+        
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        
+        if config is not None:
+            with open(os.path.join(directory, 'config.json'), 'w') as config_file:
+                json.dump(config, config_file, indent=1, sort_keys=True, default=str)
+        
+        self.segment_index = len(_segment_names(directory))
+        self.spectra = None
+        self.metadata = None
+        self.iteration = 0
+    
+    def append(self, spectrum, metadata=None, iteration=None):
+        """
+        Args:
+            spectrum: power values, stored as float32
+            metadata: dictionary of numerical values describing the spectrum
+            iteration: iteration to record for the spectrum, its position in the
+            archive since it was opened if not given
+            
+        Returns:
+            total number of spectra appended since the archive was opened
+        """
+        
+        spectrum = np.ravel(np.asarray(spectrum, dtype=np.float32))
+        metadata = {} if metadata is None else metadata
+        
+        dtype = np.dtype([('iteration', '<i8'), ('timestamp', '<f8')]
+                         + [(str(key), '<f8') for key in metadata])
+        
+        if (self.spectra is None or self.spectra.rows >= self.chunk_size
+                or self.spectra.row_shape != spectrum.shape or self.metadata.dtype != dtype):
+            self.__start_segment(spectrum.shape, dtype)
+        
+        record = np.zeros(1, dtype=dtype)
+        record['iteration'] = self.iteration if iteration is None else iteration
+        record['timestamp'] = time.time()
+        for key, value in metadata.items():
+            record[str(key)] = value
+        
+        self.spectra.append(spectrum)
+        self.metadata.append(record)
+        self.iteration += 1
+        
+        return self.iteration
+    
+    def __start_segment(self, row_shape, dtype):
+        
+        self.close()
+        
+        name = str(self.segment_index).zfill(5) + '.npy'
+        self.spectra = NpySegment(os.path.join(self.directory, 'spectra_' + name),
+                                  np.float32, row_shape, self.chunk_size)
+        self.metadata = NpySegment(os.path.join(self.directory, 'metadata_' + name),
+                                   dtype, (), self.chunk_size)
+        self.segment_index += 1
+    
+    def close(self):
+        
+        if self.spectra is not None:
+            self.spectra.close()
+            self.metadata.close()
+            self.spectra = None
+            self.metadata = None
+
+def _segment_names(directory):
+    """
+    Names of the segments in a RunArchive folder, without the 'spectra_'
+    or 'metadata_' prefix, in the order they were written.
+    """
+    return sorted(name[len('spectra_'):] for name in os.listdir(directory)
+                  if name.startswith('spectra_') and name.endswith('.npy'))
+
+def load_run_archive(directory, mmap_mode=None):
+    """
+    Load everything stored in a RunArchive folder.
+    
+    Args:
+        directory: folder of the archive
+        mmap_mode: passed to np.load(), eg 'r' to leave spectra on disk until used
+        
+    Returns:
+        (spectra, metadata, config) where spectra is a list with one 2D float32 array per
+        segment (use np.concatenate() when all spectra have the same length), metadata is
+        a structured array with one record per spectrum and config is a dictionary,
+        or None if no config was stored
+    """
+    
+    names = _segment_names(directory)
+    
+    spectra = [np.load(os.path.join(directory, 'spectra_' + name), mmap_mode=mmap_mode) for name in names]
+    metadata = [np.load(os.path.join(directory, 'metadata_' + name)) for name in names]
+    
+    config = None
+    config_path = os.path.join(directory, 'config.json')
+    if os.path.exists(config_path):
+        with open(config_path) as config_file:
+            config = json.load(config_file)
+    
+    if len(metadata) == 0:
+        return spectra, np.zeros(0, dtype=[('iteration', '<i8'), ('timestamp', '<f8')]), config
+    
+    if all(records.dtype == metadata[0].dtype for records in metadata):
+        metadata = np.concatenate(metadata)
+    else:
+        # metadata fields changed during the run, keep the fields common to every segment
+        names = [name for name in metadata[0].dtype.names
+                 if all(name in records.dtype.names for records in metadata)]
+        metadata = np.concatenate([records[names].astype([(name, records.dtype[name]) for name in names])
+                                   for records in metadata])
+    
+    return spectra, metadata, config
+
+class ModeMapStore:
+    """
+    Mode or reflection map kept as a grid of power values, one row per sweep and
+    one column per frequency, that can be read without loading the whole map.
+    
+    The map is a folder holding 'powers.npy', a float32 grid (sweep x frequency bin),
+    'lengths.npy', the cavity length of each sweep, and 'frequencies.npy', the
+    frequency (MHz) of each bin. The first two are NpySegments, so appending a sweep
+    only writes to the end of each file, and both can be memory mapped.
+    
+    Example usage:
+        store = ModeMapStore(path)
+        store.append(frequencies, powers, cavity_length)
+        length, frequencies, powers = store.nearest(7.25, 3500, 3700)
+    """
+    
+    # room in the headers for this many sweeps
+    max_sweeps = 10 ** 9
+    
+    def __init__(self, directory):
+        """
+        Args:
+            directory: folder of the map, created if needed. Sweeps already stored
+            in the folder are kept and new sweeps are appended to them.
+        """
+        
+        self.directory = directory
+        
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+        
+        self.frequencies = None
+        self.powers = None
+        self.lengths = None
+        self.grid = None
+        self.length_order = None
+        self.sorted_lengths = None
+        
+        frequencies_path = os.path.join(directory, 'frequencies.npy')
+        if os.path.exists(frequencies_path):
+            self.__open(np.load(frequencies_path))
+    
+    def __open(self, frequencies):
+        
+        self.frequencies = frequencies
+        self.powers = NpySegment(os.path.join(self.directory, 'powers.npy'), np.float32,
+                                 (len(frequencies),), self.max_sweeps, resume=True)
+        self.lengths = NpySegment(os.path.join(self.directory, 'lengths.npy'), np.float64,
+                                  (), self.max_sweeps, resume=True)
+        
+        # an interrupted append may have written powers but not the length
+        self.powers.rows = self.lengths.rows = min(self.powers.rows, self.lengths.rows)
+    
+    def append(self, frequencies, powers, cavity_length):
+        """
+        Add one sweep to the map.
+        
+        Args:
+            frequencies: frequency (MHz) of each power value, must be the same for every sweep
+            powers: power values (dBm), stored as float32
+            cavity_length: cavity length (inches) of the sweep
+            
+        Returns:
+            number of sweeps in the map
+        """
+        
+        if self.frequencies is None:
+            frequencies = np.array(frequencies, dtype=np.float64)
+            np.save(os.path.join(self.directory, 'frequencies.npy'), frequencies)
+            self.__open(frequencies)
+        elif not np.array_equal(frequencies, self.frequencies):
+            raise ValueError("Sweep frequencies differ from those of the map in " + self.directory)
+        
+        self.powers.append(powers)
+        self.lengths.append(cavity_length)
+        
+        # the length index is rebuilt by the next lookup
+        self.length_order = None
+        
+        return self.lengths.rows
+    
+    def __len__(self):
+        return 0 if self.lengths is None else self.lengths.rows
+    
+    def grid_view(self):
+        """
+        Returns:
+            read only memory map of the whole grid, shape (sweeps, bins)
+        """
+        
+        if self.grid is None or len(self.grid) != len(self):
+            self.grid = np.load(self.powers.path, mmap_mode='r')[:len(self)]
+        return self.grid
+    
+    def cavity_lengths(self):
+        """
+        Returns:
+            cavity length of each sweep, in the order they were taken
+        """
+        return np.load(self.lengths.path)[:len(self)]
+    
+    def frequency_bins(self, min_frequency=None, max_frequency=None):
+        """
+        Returns:
+            slice of the bins whose frequency lies within [min_frequency, max_frequency],
+            either limit may be None
+        """
+        
+        first = 0 if min_frequency is None else np.searchsorted(self.frequencies, min_frequency, 'left')
+        last = len(self.frequencies) if max_frequency is None else \
+            np.searchsorted(self.frequencies, max_frequency, 'right')
+        return slice(int(first), int(last))
+    
+    def window(self, min_frequency=None, max_frequency=None, sweeps=slice(None)):
+        """
+        Part of the map, read from disk only when used.
+        
+        Args:
+            min_frequency, max_frequency: frequency range (MHz), see frequency_bins()
+            sweeps: index or slice of the sweeps to return, all sweeps by default
+            
+        Returns:
+            (lengths, frequencies, powers) with powers a memory mapped view of the grid
+        """
+        
+        bins = self.frequency_bins(min_frequency, max_frequency)
+        return self.cavity_lengths()[sweeps], self.frequencies[bins], self.grid_view()[sweeps, bins]
+    
+    def nearest_sweep(self, cavity_length):
+        """
+        Returns:
+            index of the sweep taken at the length closest to 'cavity_length'
+        """
+        
+        if len(self) == 0:
+            raise IndexError("Mode map in " + self.directory + " is empty")
+        
+        if self.length_order is None:
+            self.sorted_lengths = self.cavity_lengths()
+            self.length_order = np.argsort(self.sorted_lengths, kind='mergesort')
+            self.sorted_lengths = self.sorted_lengths[self.length_order]
+        
+        position = np.searchsorted(self.sorted_lengths, cavity_length)
+        candidates = [index for index in (position - 1, position) if 0 <= index < len(self.sorted_lengths)]
+        closest = min(candidates, key=lambda index: abs(self.sorted_lengths[index] - cavity_length))
+        
+        return int(self.length_order[closest])
+    
+    def nearest(self, cavity_length, min_frequency=None, max_frequency=None):
+        """
+        Sweep taken closest to 'cavity_length', limited to a frequency range.
+        
+        Returns:
+            (length, frequencies, powers) where length is the cavity length of the sweep
+        """
+        return self.window(min_frequency, max_frequency, self.nearest_sweep(cavity_length))
+    
+    def close(self):
+        
+        if self.powers is not None:
+            self.powers.close()
+            self.lengths.close()
+
+def import_mode_map(csv_path, directory, points_per_sweep):
+    """
+    Convert a mode map saved as 'frequency,length,power' lines, eg by MapBuilderCore,
+    into a ModeMapStore.
+    
+    Args:
+        csv_path: the text map
+        directory: folder for the new store
+        points_per_sweep: lines written per sweep, ie nwa_points times the number of
+        nominal centers. A trailing incomplete sweep is dropped.
+        
+    Returns:
+        the ModeMapStore
+    """
+    
+    points = np.loadtxt(csv_path, delimiter=',', ndmin=2)
+    num_sweeps = len(points) // points_per_sweep
+    points = points[:num_sweeps * points_per_sweep].reshape(num_sweeps, points_per_sweep, 3)
+    
+    store = ModeMapStore(directory)
+    for sweep in points:
+        store.append(sweep[:, 0], sweep[:, 2], sweep[0, 1])
+    
+    return store
+
+class ArchiveSaver( FlatFileSaver ):
+    """
+    Drop in replacement for DigitizerSaver that stores spectra in a RunArchive,
+    in the 'archive' folder of the run, rather than one text file per spectrum.
+    """
+    
+    def __init__(self, root_dir, config=None, chunk_size=64, catalog=None):
+
+        super(ArchiveSaver, self).__init__( root_dir, catalog )
+        
+        self.convertor = Convertor()
+        self.archive = RunArchive(os.path.join(self.directory, 'archive'), config, chunk_size)
+        self.counter = 0
+        
+    def __call__(self, data, header_string = None, iteration = None):
+        """
+        Args:
+            data: raw data from the signal analyzer, text or a NumPy array
+            header_string: 'name;value' lines as built by ModeTracker._build_data_header,
+            stored as the metadata of the spectrum
+            iteration: iteration of the program the spectrum was taken in, stored in
+            its metadata record and catalogued. The number of spectra saved so far if
+            not given.
+            
+        Returns:
+            number of spectra saved
+        """
+        
+        position = self.counter
+        iteration = position if iteration is None else iteration
+        
+        self.counter = self.archive.append(self.convertor.parse_powers(data), _parse_data_header(header_string),
+                                           iteration)
+        print("Wrote spectrum " + str(self.counter) + " to " + self.archive.directory)
+        
+        # spectra are located in the archive by their position
+        self._add_to_catalog(iteration, header_string, self.archive.directory, position, 'A')
+        
+        return self.counter
+    
+    def close(self):
+        self.archive.close()
+
+# filters applied to the float32 bytes of a spectrum before compression
+SPECTRUM_DELTA = 0x01
+SPECTRUM_SHUFFLE = 0x02
+
+SPECTRUM_CODECS = {'none': 0, 'zlib': 1, 'lzma': 2}
+
+# magic, version, filters, codec, reserved, points, header length, payload length
+_SPECTRUM_RECORD = struct.Struct('<4sBBBBIIQ')
+_SPECTRUM_MAGIC = b'SPEC'
+
+def _encode_spectrum(spectrum, filters, codec, level):
+    """
+    Compress a spectrum as float32.
+    
+    Delta filtering replaces each value's 32 bit pattern by its difference (modulo 2^32)
+    from the previous one, and shuffling groups the first byte of every value, then the
+    second byte and so on. Both are exactly reversible, and make the slowly varying sign
+    and exponent bytes of a spectrum easier to compress.
+    """
+    
+    bits = np.ascontiguousarray(spectrum, dtype='<f4').view('<u4')
+    
+    if filters & SPECTRUM_DELTA:
+        bits = np.diff(bits, prepend=np.uint32(0))
+    
+    if filters & SPECTRUM_SHUFFLE:
+        payload = bits.view(np.uint8).reshape(-1, 4).T.tobytes()
+    else:
+        payload = bits.tobytes()
+    
+    if codec == SPECTRUM_CODECS['zlib']:
+        return zlib.compress(payload, 6 if level is None else level)
+    if codec == SPECTRUM_CODECS['lzma']:
+        return lzma.compress(payload, preset=0 if level is None else level)
+    return payload
+
+def _decode_spectrum(payload, num_points, filters, codec):
+    """
+    Inverse of _encode_spectrum().
+    """
+    
+    if codec == SPECTRUM_CODECS['zlib']:
+        payload = zlib.decompress(payload)
+    elif codec == SPECTRUM_CODECS['lzma']:
+        payload = lzma.decompress(payload)
+    
+    if filters & SPECTRUM_SHUFFLE:
+        bits = np.frombuffer(payload, dtype=np.uint8).reshape(4, num_points).T.copy().view('<u4')[:, 0]
+    else:
+        bits = np.frombuffer(payload, dtype='<u4').copy()
+    
+    if filters & SPECTRUM_DELTA:
+        bits = np.cumsum(bits, dtype=np.uint32)
+    
+    return bits.view('<f4')
+
+class SpectrumStreamWriter:
+    """
+    Append-only file of compressed float32 spectra, each stored as its own record
+    so that any single spectrum can be read back without reading the others.
+    
+    Every record holds a fixed size header (see _SPECTRUM_RECORD), a free text header,
+    eg the one built by ModeTracker._build_data_header, and one compressed spectrum.
+    The offset of each record is also appended to '<path>.idx', which lets
+    SpectrumStreamReader find a record without scanning the stream.
+    """
+    
+    def __init__(self, path, codec='zlib', level=None, delta=False, shuffle=True):
+        """
+        Args:
+            path: file to append to, created if needed
+            codec: 'zlib', 'lzma' or 'none'
+            level: compression level for zlib (0-9, default 6) or preset for lzma
+            (0-9, default 0), higher levels compress better but more slowly
+            delta, shuffle: filters to apply before compression, see _encode_spectrum().
+            Delta filtering only pays off for smooth spectra, averaged noise
+            compresses better with shuffling alone
+        """
+        
+        if codec not in SPECTRUM_CODECS:
+            raise ValueError("Unknown codec: " + str(codec))
+        
+        self.path = path
+        self.codec = SPECTRUM_CODECS[codec]
+        self.level = level
+        self.filters = (SPECTRUM_DELTA if delta else 0) | (SPECTRUM_SHUFFLE if shuffle else 0)
+        
+        self.out_file = open(path, 'ab')
+        self.index_file = open(path + '.idx', 'ab')
+    
+    def append(self, spectrum, header_string=None):
+        """
+        Args:
+            spectrum: power values, stored as float32
+            header_string: optional text stored with the spectrum
+            
+        Returns:
+            offset of the record in the stream, in bytes
+        """
+        
+        spectrum = np.ravel(spectrum)
+        header = b'' if header_string is None else header_string.encode()
+        payload = _encode_spectrum(spectrum, self.filters, self.codec, self.level)
+        
+        offset = self.out_file.tell()
+        self.out_file.write(_SPECTRUM_RECORD.pack(_SPECTRUM_MAGIC, 1, self.filters, self.codec, 0,
+                                                  len(spectrum), len(header), len(payload)))
+        self.out_file.write(header)
+        self.out_file.write(payload)
+        self.out_file.flush()
+        
+        # the offset is only recorded once the record is complete
+        self.index_file.write(struct.pack('<Q', offset))
+        self.index_file.flush()
+        
+        return offset
+    
+    def close(self):
+        self.out_file.close()
+        self.index_file.close()
+
+class SpectrumStreamReader:
+    """
+    Random access to the spectra written by SpectrumStreamWriter.
+    
+    Example usage:
+        reader = SpectrumStreamReader(path)
+        spectrum = reader[10]
+        header = reader.header(10)
+    """
+    
+    def __init__(self, path):
+        
+        self.path = path
+        self.in_file = open(path, 'rb')
+        
+        if os.path.exists(path + '.idx'):
+            self.offsets = np.fromfile(path + '.idx', dtype='<u8')
+        else:
+            self.offsets = self.__scan()
+    
+    def __scan(self):
+        """
+        Find the offset of every complete record by walking the stream.
+        """
+        
+        offsets = []
+        file_size = os.path.getsize(self.path)
+        offset = 0
+        
+        while offset + _SPECTRUM_RECORD.size <= file_size:
+            self.in_file.seek(offset)
+            _, _, _, _, _, _, header_len, payload_len = _SPECTRUM_RECORD.unpack(self.in_file.read(_SPECTRUM_RECORD.size))
+            end = offset + _SPECTRUM_RECORD.size + header_len + payload_len
+            if end > file_size:
+                break
+            offsets.append(offset)
+            offset = end
+        
+        return np.array(offsets, dtype='<u8')
+    
+    def __len__(self):
+        return len(self.offsets)
+    
+    def __read_record(self, index):
+        
+        self.in_file.seek(int(self.offsets[index]))
+        magic, version, filters, codec, _, num_points, header_len, payload_len = \
+            _SPECTRUM_RECORD.unpack(self.in_file.read(_SPECTRUM_RECORD.size))
+        
+        if magic != _SPECTRUM_MAGIC or version != 1:
+            raise ValueError("No spectrum record at offset " + str(self.offsets[index]) + " of " + self.path)
+        
+        return filters, codec, num_points, header_len, payload_len
+    
+    def header(self, index):
+        """
+        Returns:
+            the text header stored with spectrum 'index'
+        """
+        
+        _, _, _, header_len, _ = self.__read_record(index)
+        return self.in_file.read(header_len).decode()
+    
+    def __getitem__(self, index):
+        """
+        Returns:
+            spectrum 'index' as a float32 array
+        """
+        
+        filters, codec, num_points, header_len, payload_len = self.__read_record(index)
+        self.in_file.seek(header_len, os.SEEK_CUR)
+        
+        return _decode_spectrum(self.in_file.read(payload_len), num_points, filters, codec)
+    
+    def close(self):
+        self.in_file.close()
+
+class RunCatalog:
+    """
+    SQLite index of the spectra saved in the run folders made by FlatFileSaver.
+    
+    Every spectrum has one row holding the run (name of its folder), the run's
+    start time, its iteration within the run, the cavity length, center frequency,
+    Q and HWHM from its data header, and where it is stored: the file, the
+    position within that file and the format of the file. Formats are 'R' and 'F'
+    for the text files of DigitizerSaver, 'Z' for a SpectrumStreamWriter stream,
+    where the position is the offset of the record, and 'A' for a RunArchive,
+    where it is the index of the spectrum. Files are stored relative to the folder
+    of the catalog, so the data folder can be moved together with its catalog.
+    
+    The catalog is filled by the savers it is passed to, and can be rebuilt from
+    the run folders with rebuild().
+    
+    Example usage:
+        catalog = RunCatalog('data/catalog.sqlite')
+        records = catalog.query(min_frequency=4090, max_frequency=4110, min_q=10000)
+        spectrum = catalog.load(records[0])
+    """
+    
+    # columns filled from the data header, with the header entry they are read from
+    HEADER_COLUMNS = collections.OrderedDict([('cavity_length', 'cavity_length'),
+                                              ('center_frequency', 'actual_center_freq'),
+                                              ('q', 'Q'),
+                                              ('hwhm', 'fitted_hwhm')])
+    
+    def __init__(self, path):
+        """
+        Args:
+            path: database file, created along with its folder if needed
+        """
+        
+        self.path = path
+        self.root = os.path.dirname(os.path.abspath(path))
+        
+        if not os.path.exists(self.root):
+            os.makedirs(self.root)
+        
+        # spectra are saved from the writer thread of ProgramCore
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        
+        with self.lock, self.connection:
+            self.connection.execute("""CREATE TABLE IF NOT EXISTS spectra (
+                                       run TEXT NOT NULL,
+                                       run_time REAL,
+                                       iteration INTEGER NOT NULL,
+                                       cavity_length REAL,
+                                       center_frequency REAL,
+                                       q REAL,
+                                       hwhm REAL,
+                                       file TEXT NOT NULL,
+                                       offset INTEGER NOT NULL,
+                                       format TEXT NOT NULL,
+                                       PRIMARY KEY (run, iteration))""")
+            for column in ('center_frequency', 'q', 'cavity_length', 'run_time'):
+                self.connection.execute("CREATE INDEX IF NOT EXISTS spectra_" + column +
+                                        " ON spectra (" + column + ")")
+    
+    def __row(self, run_directory, iteration, metadata, file_path, offset, data_format):
+        
+        run = os.path.basename(os.path.normpath(run_directory))
+        try:
+            run_time = time.mktime(time.strptime(run, "%S:%M:%H_%d.%m.%Y"))
+        except ValueError:
+            run_time = None
+        
+        values = [metadata.get(name) for name in self.HEADER_COLUMNS.values()]
+        
+        return (run, run_time, int(iteration), *values,
+                os.path.relpath(os.path.abspath(file_path), self.root), int(offset), data_format)
+    
+    def __insert(self, rows):
+        self.connection.executemany("INSERT OR REPLACE INTO spectra VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    
+    def add(self, run_directory, iteration, metadata, file_path, offset=0, data_format='R'):
+        """
+        Args:
+            run_directory: run folder the spectrum was saved in
+            iteration: number of the spectrum within the run
+            metadata: data header parsed by _parse_data_header()
+            file_path: file the spectrum is stored in
+            offset: position of the spectrum in the file, see RunCatalog
+            data_format: 'R', 'F', 'Z' or 'A', see RunCatalog
+        """
+        
+        row = self.__row(run_directory, iteration, metadata, file_path, offset, data_format)
+        with self.lock, self.connection:
+            self.__insert([row])
+    
+    def rebuild(self, root_dir=None):
+        """
+        Replace the contents of the catalog by the spectra found in the run folders
+        of 'root_dir'. Only the data headers are read, not the spectra themselves.
+        
+        Args:
+            root_dir: folder holding the run folders, the folder of the catalog by default
+        
+        Returns:
+            number of spectra catalogued
+        """
+        
+        root_dir = self.root if root_dir is None else root_dir
+        
+        rows = []
+        for run in sorted(os.listdir(root_dir)):
+            run_directory = os.path.join(root_dir, run)
+            if os.path.isdir(run_directory):
+                rows += [self.__row(run_directory, *entry) for entry in self.__scan_run(run_directory)]
+        
+        with self.lock, self.connection:
+            self.connection.execute("DELETE FROM spectra")
+            self.__insert(rows)
+        
+        return len(rows)
+    
+    def __scan_run(self, run_directory):
+        """
+        Yields:
+            (iteration, metadata, file_path, offset, data_format) for each spectrum in a run folder
+        """
+        
+        names = set(os.listdir(run_directory))
+        
+        for prefix, data_format in (('SA_R', 'R'), ('SA_F', 'F')):
+            for name in names:
+                number = name[len(prefix):-len('.csv')]
+                if not (name.startswith(prefix) and name.endswith('.csv') and number.isdigit()):
+                    continue
+                # R+F runs hold both files for each spectrum, catalogue the raw one
+                if data_format == 'F' and 'SA_R' + number + '.csv' in names:
+                    continue
+                file_path = os.path.join(run_directory, name)
+                metadata = _parse_data_header(self.__read_text_header(file_path))
+                yield self.__iteration(metadata, int(number)), metadata, file_path, 0, data_format
+        
+        if 'SA.spectra' in names:
+            reader = SpectrumStreamReader(os.path.join(run_directory, 'SA.spectra'))
+            for index, offset in enumerate(reader.offsets):
+                metadata = _parse_data_header(reader.header(index))
+                yield self.__iteration(metadata, index), metadata, reader.path, offset, 'Z'
+            reader.close()
+        
+        if 'archive' in names:
+            archive_directory = os.path.join(run_directory, 'archive')
+            _, metadata, _ = load_run_archive(archive_directory, mmap_mode='r')
+            for index, record in enumerate(metadata):
+                values = {name: float(record[name]) for name in metadata.dtype.names}
+                yield int(record['iteration']), values, archive_directory, index, 'A'
+    
+    def __iteration(self, metadata, default):
+        """
+        Returns:
+            the iteration added to a data header by FlatFileSaver._tag_header(), or
+            'default' for spectra saved without one
+        """
+        
+        iteration = metadata.get('iteration', float('nan'))
+        return default if np.isnan(iteration) else int(iteration)
+    
+    def __read_text_header(self, file_path):
+        """
+        Returns:
+            the leading 'name;value' lines of a text file written by DigitizerSaver,
+            the file is only read up to its first line of data
+        """
+        
+        header = []
+        with open(file_path) as in_file:
+            while True:
+                # raw files hold the whole spectrum on one line, only its start is read
+                line = in_file.readline(4096)
+                if not line or (line.strip() and ';' not in line):
+                    break
+                header.append(line.rstrip("\n"))
+        
+        return "\n".join(header)
+    
+    def query(self, min_frequency=None, max_frequency=None, min_q=None, max_q=None,
+              min_length=None, max_length=None, run=None):
+        """
+        Find the spectra matching every limit given, all limits are inclusive.
+        
+        Args:
+            min_frequency, max_frequency: limits on the center frequency, in the units of the header (MHz)
+            min_q, max_q: limits on Q
+            min_length, max_length: limits on the cavity length
+            run: only return spectra from this run folder
+        
+        Returns:
+            structured array with a record per spectrum and a field per column of
+            the catalog, ordered by run time and iteration. Missing values are NaN.
+        """
+        
+        limits = [('center_frequency >= ?', min_frequency), ('center_frequency <= ?', max_frequency),
+                  ('q >= ?', min_q), ('q <= ?', max_q),
+                  ('cavity_length >= ?', min_length), ('cavity_length <= ?', max_length),
+                  ('run = ?', run)]
+        limits = [(condition, value) for condition, value in limits if value is not None]
+        
+        statement = "SELECT * FROM spectra"
+        if limits:
+            statement += " WHERE " + " AND ".join(condition for condition, _ in limits)
+        statement += " ORDER BY run_time, run, iteration"
+        
+        with self.lock:
+            rows = self.connection.execute(statement, [value for _, value in limits]).fetchall()
+        
+        nan = float('nan')
+        rows = [tuple(nan if value is None else value for value in row) for row in rows]
+        
+        dtype = [('run', 'O'), ('run_time', '<f8'), ('iteration', '<i8')]
+        dtype += [(name, '<f8') for name in self.HEADER_COLUMNS]
+        dtype += [('file', 'O'), ('offset', '<i8'), ('format', 'O')]
+        
+        return np.array(rows, dtype=dtype)
+    
+    def load(self, record):
+        """
+        Args:
+            record: a record returned by query()
+        
+        Returns:
+            the power values of the spectrum as a float64 array
+        """
+        
+        file_path = os.path.join(self.root, record['file'])
+        data_format = record['format']
+        
+        if data_format == 'Z':
+            reader = SpectrumStreamReader(file_path)
+            spectrum = reader[int(np.searchsorted(reader.offsets, record['offset']))]
+            reader.close()
+        elif data_format == 'A':
+            spectra, _, _ = load_run_archive(file_path, mmap_mode='r')
+            index = int(record['offset'])
+            for segment in spectra:
+                if index < len(segment):
+                    spectrum = segment[index]
+                    break
+                index -= len(segment)
+            else:
+                raise IndexError("No spectrum " + str(record['offset']) + " in " + file_path)
+        else:
+            # the header lines are the only ones holding a ';'
+            with open(file_path) as in_file:
+                data = [line for line in in_file if line.strip() and ';' not in line]
+            spectrum = Convertor().parse_powers(data)
+        
+        return np.array(spectrum, dtype=np.float64)
+    
+    def close(self):
+        self.connection.close()
 
 class NetworkAnalyzerSaver( FlatFileSaver ):
     
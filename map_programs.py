@@ -17,6 +17,9 @@ class MapBuilderCore (core.ProgramCore):
         else:
             pass
         
+        # the map is also kept as a grid of powers next to the text file, see ModeMapStore
+        self.map_store = procs.ModeMapStore(os.path.splitext(self.file_name)[0] + "_grid")
+        
         atexit.register(self.__panic_cleanup)
     
     def __transfer_map(self):
@@ -27,54 +30,51 @@ class MapBuilderCore (core.ProgramCore):
         command = dir_path + "/data/transfer_map.sh " + path
         
         print( command )
-        subprocess.Popen(command, shell=True)
-        
-    def __transfer_power_spec(self, power_spec):
+        # queued behind the data written by __save_data
+        self.writer.submit(lambda: subprocess.Popen(command, shell=True))
         
-        power_list = self.convertor.str_list_to_power_list(power_spec)
+    def __transfer_power_spec(self, powers):
         
         dir_path = os.path.dirname(os.path.realpath(__file__))
         path = dir_path + "/data/current_power_spectrum.csv"
         
-        out_file = open(path, 'w+')
-        
-        out_str = ''
-        for power in power_list:
-            out_str += str(power) + "\n"
-            
-        print(out_str, end="", file=out_file)
-
-        out_file.close() 
+        out_str = ''.join(str(power) + "\n" for power in powers.tolist())
         
-        path += " " + dir_path + "/data/current_power_spectrum.jpeg"
         command = dir_path + "/data/transfer_power_spec.sh " + path
+        command += " " + dir_path + "/data/current_power_spectrum.jpeg"
 
-        subprocess.Popen(command, shell=True)
+        self.writer.write(path, out_str, 'w+', on_written=lambda: subprocess.Popen(command, shell=True))
         
-    def __save_data(self, formatted_data):
+    def __save_data(self, plot_arrays):
         
         path = self.file_name
         
-        out_file = open(path, 'a')
+        # same 'frequency,length,power' lines as written from Convertor.make_plot_points()
+        trans_table = dict.fromkeys(map(ord, ' []'), None)
+        out_str = ''.join(str([frequency, plot_arrays.cavity_length, power]).translate(trans_table) + "\n"
+                          for frequency, power in zip(plot_arrays.frequencies.astype(int).tolist(),
+                                                      plot_arrays.powers.tolist()))
         
-        for item in formatted_data:
-            out_str = str(item)
-            trans_table = dict.fromkeys(map(ord, ' []'), None)
-            out_str = out_str.translate(trans_table)
-        
-            print(out_str, end="\n", file=out_file)
-        
-        out_str = "Wrote data to " + path
-        
-        out_file.close()      
+        self.writer.write(path, out_str, 'a')
         
     def _get_nwa_data(self):
         nwa_data = self.get_data_nwa()
-        self.__transfer_power_spec(nwa_data)
-        
-        formatted_points = self.format_points(nwa_data)
-        self.__save_data(formatted_points)
-        self.__transfer_map()    
+        cavity_length = self.ardu_comm.get_cavity_length()
+        
+        # the sweep is parsed once, for the power spectrum, the text map and the store
+        plot_arrays = self.format_arrays(nwa_data, cavity_length)
+        self.__transfer_power_spec(plot_arrays.powers)
+        self.__save_data(plot_arrays)
+        
+        self.writer.submit(lambda: self.map_store.append(plot_arrays.frequencies, plot_arrays.powers, cavity_length))
+        self.__transfer_map()
+        
+    def close_all(self):
+        # ProgramCore.close_all() flushes the writer, so every queued sweep is in
+        # the store before it is closed
+        super(MapBuilderCore, self).close_all()
+        if hasattr(self, 'map_store'):
+            self.map_store.close()
 
     def __panic_cleanup(self):
 
@@ -3,6 +3,7 @@ import program_core as core
 import atexit
 import subprocess
 import os
+import concurrent.futures
 import data_processors as procs
 import modetrack as mt
 from socket_communicators import ArduComm
@@ -27,11 +28,18 @@ class ModeTracker(core.ProgramCore):
         self.center_frequency = 0.0
         self.hwhm = 0.0
         self.quality_factor = 0.0
+
+        # optional, sweep only the windows within this many MHz of the predicted
+        # mode position in reflection (0 always sweeps every window)
+        self.search_radius = float(self.data_dict.get('predictive_search_radius', 0))
+
+        self.background_powers = None
+        self.background_centers = None
         
     def prequel(self):
         self.prequel_reflection()
         
-    def _build_data_header(self):
+    def _build_data_header(self, cavity_length=None):
         """
         Orginal program saved the follow parameters:
         actual_center_freq,
@@ -40,7 +48,13 @@ class ModeTracker(core.ProgramCore):
         effective_volume,
         bfield, noise_temperature,
         sa_averages
+
+        Args:
+            cavity_length: cavity length to record, read from the Arduino if not given
         """
+        if cavity_length is None:
+            cavity_length = self.ardu_comm.get_cavity_length()
+
         header = ''
         header += "digitizer_span;" + str(self.digitizer_span) + "\n"
         header += "fft_length;" + str(self.fft_length) + "\n"
@@ -51,35 +65,115 @@ class ModeTracker(core.ProgramCore):
         header += "Q;" + str(self.quality_factor) + "\n"
         header += "actual_center_freq;" + str(self.center_frequency) + "\n"
         header += "fitted_hwhm;" + str(self.hwhm) + "\n"
-        header += "cavity_length;" + str(self.ardu_comm.get_cavity_length()) + "\n"
+        header += "cavity_length;" + str(cavity_length) + "\n"
         
         return header
     
     def set_bg_data(self, blank_data):
         
-        bg_str = ''
-        for triple in blank_data:
-            temp_str = str(triple)
-            # Create translation table.
-            trans_table = dict.fromkeys(map(ord, ' []'), None)
-            temp_str = temp_str.translate(trans_table)
-            bg_str += temp_str + "\n"
+        self.background_powers = self.convertor.plot_points_to_arrays(blank_data)[2]
+        self.background_centers = None
+        self.__set_background_windows(self.nominal_centers)
+        
+    def __set_background_windows(self, centers):
+        """
+        Send the part of the background covering the windows in 'centers' to ModeTrack,
+        which needs a background of the same length as the data being searched.
+        """
+        
+        if self.background_powers is None or centers == self.background_centers:
+            return
+        
+        points_per_window = len(self.background_powers) // len(self.nominal_centers)
+        first = self.nominal_centers.index(centers[0]) * points_per_window
+        last = first + len(centers) * points_per_window
         
-        # need to remove list item in list since it will be a blank line
         print("Background data sent to sub-process.")
-        self.m_track.SetBackground(bg_str[:-1])
+        self.m_track.SetBackgroundArray(self.background_powers[first:last])
+        self.background_centers = centers
 
-    def find_minima_peak(self, formatted_points):
-        data_str = ''
+    def find_minima_peak(self, formatted_points, centers=None):
+        """
+        Args:
+            formatted_points: output of format_arrays() or format_points()
+            centers: centers of the windows that were swept, defaults to all of nominal_centers
+        """
+        
+        if centers is None:
+            centers = self.nominal_centers
+        self.__set_background_windows(centers)
+        
+        frequencies, cavity_length, powers = self.convertor.plot_points_to_arrays(formatted_points)
+        return self.m_track.GetPeaksBiLatArray(frequencies, powers, cavity_length, 1)
+    
+    def __peek_minima_peaks(self, formatted_points, centers):
+        """
+        Same as find_minima_peak() but without refining the mode paths. Modes that
+        were only estimated rather than identified are given a frequency of 0.
+        
+        Returns:
+            (peaks, cavity_length) where peaks holds the frequency of modes 0 through 3,
+            to be passed on to ModeTrack.UpdateModePaths() if the result is kept
+        """
         
-        for triple in formatted_points:
-            temp_str = str(triple)
-            # Create translation table.
-            trans_table = dict.fromkeys(map(ord, ' []'), None)
-            temp_str = temp_str.translate(trans_table)
-            data_str += temp_str + "\n"
+        self.__set_background_windows(centers)
         
-        return self.m_track.GetPeaksBiLat(data_str[:-1], 1)
+        frequencies, cavity_length, powers = self.convertor.plot_points_to_arrays(formatted_points)
+        return self.m_track.GetMatchedPeaksBiLatArray(frequencies, powers, cavity_length), cavity_length
+    
+    def predict_mode(self, cavity_length):
+        """
+        Predict where the mode of desire will be found in reflection. ModeTrack refines
+        the path of each mode every time it identifies a peak, so the search radius
+        shrinks as the prediction improves.
+        
+        Returns:
+            (frequency, radius) the predicted frequency of the mode and the distance
+            from it that should be searched (MHz), radius is at most 'predictive_search_radius'
+        """
+        
+        frequency = self.m_track.PredictFrequency(1, cavity_length)
+        radius = min(self.search_radius, self.m_track.SearchRadius(1, cavity_length))
+        
+        return frequency, radius
+    
+    def locate_mode_reflection(self, cavity_length):
+        """
+        Take reflection data and find the mode of desire.
+        
+        When 'predictive_search_radius' is set only the windows within the search
+        radius of the predicted mode position are swept (see predict_mode()). If the
+        mode is not found there every window in nominal_centers is swept instead.
+        The mode paths are only refined by the sweep whose result is returned.
+        
+        Returns:
+            (mode_of_desire, nwa_data, centers) where nwa_data is the raw data and
+            centers are the centers of the windows that were swept. mode_of_desire
+            is 0 if the mode was not found.
+        """
+        
+        if self.search_radius > 0:
+            predicted, radius = self.predict_mode(cavity_length)
+            centers = self.windows_near(predicted, radius)
+            
+            if 0 < len(centers) < len(self.nominal_centers):
+                nwa_data = self.get_data_nwa(centers)
+                formatted_points = self.format_arrays(nwa_data, cavity_length, centers)
+                peaks, sweep_length = self.__peek_minima_peaks(formatted_points, centers)
+                mode_of_desire = peaks[1]
+                
+                if mode_of_desire > 0 and abs(mode_of_desire - predicted) <= radius:
+                    # keep the result, refining the mode paths as find_minima_peak() would
+                    self.m_track.UpdateModePaths(sweep_length, peaks)
+                    return mode_of_desire, nwa_data, centers
+                
+                self.print_yellow("Mode not found near " + str(round(predicted, 1)) + " MHz, sweeping all windows.")
+        
+        nwa_data = self.get_data_nwa()
+        formatted_points = self.format_arrays(nwa_data, cavity_length)
+        mode_of_desire = self.find_minima_peak(formatted_points)
+        
+        return mode_of_desire, nwa_data, self.nominal_centers
     
     def __derive_cavity_length(self):
         
@@ -93,10 +187,9 @@ class ModeTracker(core.ProgramCore):
         
     def __recenter_peak(self, power_list, mode_of_desire):
              
-        cavity_length = self.ardu_comm.get_cavity_length()
-        trans_window_str = self.convertor.power_list_to_str(power_list, mode_of_desire, self.freq_window, cavity_length)
+        frequencies, powers = self.convertor.power_list_to_arrays(power_list, mode_of_desire, self.freq_window)
         
-        return self.m_track.GetMaxPeak(trans_window_str[:-1])
+        return self.m_track.GetMaxPeakArray(frequencies, powers)
     
     def save_freq_window(self, freq_window_spec):
         
@@ -104,63 +197,89 @@ class ModeTracker(core.ProgramCore):
         
         dir_path = os.path.dirname(os.path.realpath(__file__))
         path = dir_path + "/data/current_freq_window.csv"
-        out_file = open(path, 'w+')
         
         out_str = ''
         for power in power_list:
             out_str += str(power) + "\n"
-            
-        print(out_str, end="", file=out_file)
-
-        out_file.close() 
         
-        path += " " + dir_path + "/data/current_freq_window.jpeg"
         command = dir_path + "/data/transfer_power_spec.sh " + path
+        command += " " + dir_path + "/data/current_freq_window.jpeg"
         
-        subprocess.Popen(command, shell=True)
+        self.writer.write(path, out_str, 'w+', on_written=lambda: subprocess.Popen(command, shell=True))
+
+    def measure_peak(self, mode_of_desire):
+        """
+        Take the transmission measurements needed to locate the mode of desire,
+        leaving the fit to fit_peak() so that it may be run off the acquisition loop.
+
+        Args:
+            mode_of_desire: frequency of the mode found in reflection (MHz)
+
+        Returns:
+            (new_mode_of_desire, final_window) where final_window is the raw
+            transmission data centered on the new mode, or (-1, None) if the mode
+            could not be found
+        """
 
-    def check_peak(self, mode_of_desire):
-        
         nwa_span = self.nwa_span
         freq_window = self.freq_window
 
         if (mode_of_desire == 0.0):
             self.print_red("Mode of desire not found.")
-            return
+            return -1, None
 
         self.print_purple("Checking peak.")
-        
+
         # since we identified the position of our mode using reflection measurements
         # we need to switch to transmission to find the 'real' position of the mode
         self.switch_comm.switch_to_transmission()
-        
-        self.nwa_comm.set_freq_window(mode_of_desire , freq_window)
-        initial_window = self.nwa_comm.take_data_single()
-        
-        initial_window = self.convertor.str_list_to_power_list(initial_window)
 
-        new_mode_of_desire = self.__recenter_peak(initial_window, mode_of_desire)
-        
-        if (new_mode_of_desire == 0):
-            return -1
+        try:
+            self.nwa_comm.set_freq_window(mode_of_desire , freq_window)
+            initial_window = self.nwa_comm.take_data_single()
+
+            initial_window = self.convertor.str_list_to_power_list(initial_window)
+
+            new_mode_of_desire = self.__recenter_peak(initial_window, mode_of_desire)
+
+            if (new_mode_of_desire == 0):
+                return -1, None
+
+            self.nwa_comm.set_freq_window(new_mode_of_desire , freq_window)
+            final_window = self.nwa_comm.take_data_single()
+
+            self.nwa_comm.set_freq_window(new_mode_of_desire , nwa_span)
+
+        finally:
+            # return to reflection measurements
+            self.switch_comm.switch_to_reflection()
+
+        return new_mode_of_desire, final_window
+
+    def fit_peak(self, final_window, mode_of_desire):
+        """
+        Fit a Lorentzian to the transmission data returned by measure_peak() and store
+        the quality factor, center frequency and HWHM. Does not touch any instrument.
+        """
 
-        self.nwa_comm.set_freq_window(new_mode_of_desire , freq_window)
-        final_window = self.nwa_comm.take_data_single()
-        self.save_freq_window(final_window)
-        
         final_window = self.convertor.str_list_to_power_list(final_window)
 
-        data_triple = self.fitter(final_window, new_mode_of_desire, freq_window)
-        
+        data_triple = self.fitter(final_window, mode_of_desire, self.freq_window)
+
         self.quality_factor = data_triple[0]
         self.center_frequency = data_triple[1]
         self.hwhm = data_triple[2]
 
-        self.nwa_comm.set_freq_window(new_mode_of_desire , nwa_span)
+    def check_peak(self, mode_of_desire):
+
+        new_mode_of_desire, final_window = self.measure_peak(mode_of_desire)
+
+        if (new_mode_of_desire <= 0):
+            return -1
+
+        self.save_freq_window(final_window)
+        self.fit_peak(final_window, new_mode_of_desire)
 
-        # return to reflection measurements
-        self.switch_comm.switch_to_reflection()
-        
         return new_mode_of_desire
     
     def get_data_sa(self, mode_of_desire):
@@ -179,22 +298,41 @@ class ModeTrackProgram(ModeTracker):
     def __init__(self, config_path):
         super(ModeTrackProgram, self).__init__(config_path)
         
-        self.sa_saver = procs.SignalAnalyzerSaver('data')
+        # optional, 'R', 'F', 'R+F' (the default) and 'Z' are the formats of
+        # DigitizerSaver, 'Z' being compressed with the optional 'sa_compression'
+        # codec ('zlib' or 'lzma'). 'archive' stores spectra in a binary RunArchive
+        sa_save_format = self.data_dict.get('sa_save_format', 'R+F')
+        
+        # optional, every saved spectrum is indexed in this SQLite catalog, relative
+        # to this folder, see data_processors.RunCatalog
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        self.catalog = procs.RunCatalog(os.path.join(dir_path, self.data_dict.get('run_catalog', 'data/catalog.sqlite')))
+        
+        if sa_save_format == 'archive':
+            self.sa_saver = procs.ArchiveSaver('data', self.data_dict, catalog=self.catalog)
+        else:
+            self.sa_saver = procs.DigitizerSaver('data', sa_save_format, self.data_dict.get('sa_compression', 'zlib'),
+                                                 catalog=self.catalog)
         self.nwa_saver = procs.NetworkAnalyzerSaver('data')
         
         atexit.register(self.panic_cleanup)
         
+    def close_all(self):
+        # ProgramCore.close_all() flushes the writer, so every queued spectrum has
+        # been saved before the saver's files are closed
+        super(ModeTrackProgram, self).close_all()
+        if hasattr(self, 'sa_saver'):
+            self.sa_saver.close()
+        
     def __derive_length_from_start(self):
         cavity_length = self.ardu_comm.get_cavity_length()
         start_length = self.start_length
         return cavity_length - start_length
         
     def find_mode_of_desire_reflection(self):
-        nwa_data = self.get_data_nwa()
-        self.save_power_spec(nwa_data)
-        
-        formatted_points = self.format_points(nwa_data)
-        mode_of_desire = self.find_minima_peak(formatted_points)
+        cavity_length = self.ardu_comm.get_cavity_length()
+        mode_of_desire, nwa_data, centers = self.locate_mode_reflection(cavity_length)
+        self.save_power_spec(nwa_data, cavity_length, centers)
         
         if (mode_of_desire <= 0.0):
             return -1
@@ -215,36 +353,32 @@ class ModeTrackProgram(ModeTracker):
         
     def set_background(self):
         nwa_data = self.get_data_nwa()
-        formatted_points = self.format_points(nwa_data)
+        formatted_points = self.format_arrays(nwa_data)
         self.set_bg_data(formatted_points)
     
-    def save_power_spec(self, power_spec):
+    def save_power_spec(self, power_spec, cavity_length=None, centers=None):
         
         power_list = self.convertor.str_list_to_power_list(power_spec)
-        formatted_points = self.format_points(power_spec)
-        self.nwa_saver(formatted_points)
+        formatted_points = self.format_points(power_spec, cavity_length, centers)
+        self.writer.submit(lambda: self.nwa_saver(formatted_points))
         
         dir_path = os.path.dirname(os.path.realpath(__file__))
         path = dir_path + "/data/current_power_spectrum.csv"
         
-        out_file = open(path, 'w+')
-        
         out_str = ''
         for power in power_list:
             out_str += str(power) + "\n"
-            
-        print(out_str, end="", file=out_file)
-
-        out_file.close() 
         
-        path += " " + dir_path + "/data/current_power_spectrum.jpeg"
         command = dir_path + "/data/transfer_power_spec.sh " + path
+        command += " " + dir_path + "/data/current_power_spectrum.jpeg"
 
-        subprocess.Popen(command, shell=True)
+        self.writer.write(path, out_str, 'w+', on_written=lambda: subprocess.Popen(command, shell=True))
         
     def transfer_terminal_output(self):
         self.print_status_info()
-        
+        self.upload_terminal_output()
+
+    def upload_terminal_output(self):
         dir_path = os.path.dirname(os.path.realpath(__file__)) + "/"
 
         cmd = "cat " + dir_path + "etig_log.txt" + " | " + dir_path + "ansi2html.sh"
@@ -262,14 +396,19 @@ class ModeTrackProgram(ModeTracker):
          
         subprocess.Popen(transfer_cmd, shell=True)
         
-    def save_sa_data (self, data):
-        header = self._build_data_header()
-        successful_data_collections = self.sa_saver(data, header)
-        total_power_spectra = self.iteration
+    def save_sa_data (self, data, cavity_length=None, iteration=None):
+        header = self._build_data_header(cavity_length)
+        iteration = self.iteration if iteration is None else iteration
+        total_power_spectra = iteration
+        
+        def save():
+            successful_data_collections = self.sa_saver(data, header, iteration)
+            
+            status_text = "Collected data for " + str(successful_data_collections) + " "
+            status_text += "out of " + str(total_power_spectra) + " power spectra."
+            self.print_blue(status_text)
         
-        status_text = "Collected data for " + str(successful_data_collections) + " "
-        status_text += "out of " + str(total_power_spectra) + " power spectra."
-        self.print_blue(status_text)
+        self.writer.submit(save)
 
     def program(self):
 
@@ -302,3 +441,121 @@ class ModeTrackProgram(ModeTracker):
         self.step_comm.reset_cavity(current_length)
         self.transfer_terminal_output()
         self.close_all()
+
+class PipelinedModeTrackProgram(ModeTrackProgram):
+    """
+    ModeTrackProgram that overlaps the work of consecutive iterations.
+
+    Every instrument is only ever driven from the main thread, in the same order as
+    ModeTrackProgram: status, reflection sweep, peak finding, transmission check
+    and signal analyzer integration. The switch is always returned to reflection
+    and the RF source turned back on before the next stage starts, and the cavity
+    is only moved once the signal analyzer is done with the current length.
+
+    Everything that does not need an instrument, the Lorentzian fit, saving data
+    and uploading plots and terminal output, is handed to a single background
+    worker and runs while the stepper motor moves to the next length and the next
+    reflection sweep is taken. At most one iteration of background work is in
+    flight, if it has not finished by the end of the following iteration the main
+    loop waits for it.
+    """
+
+    def __init__(self, config_path):
+        super(PipelinedModeTrackProgram, self).__init__(config_path)
+
+        self.timer = core.StageTimer()
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.background_task = None
+        self.background_iteration = None
+        self.move_pending = False
+
+    def __wait_for_background(self, iteration):
+        """
+        Block until the previous iteration's background work is done, then print
+        its stage timings.
+        """
+
+        if self.background_task is None:
+            return
+
+        with self.timer.stage(iteration, "wait for background"):
+            try:
+                self.background_task.result()
+            except Exception as e:
+                self.print_red("Background work for iteration " + str(self.background_iteration) + " failed: " + str(e))
+
+        self.timer.report(self.background_iteration)
+        self.background_task = None
+
+    def __run_background(self, iteration, jobs):
+        for name, job in jobs:
+            with self.timer.stage(iteration, name, background=True):
+                job()
+
+    def __wait_for_move(self, iteration):
+        if self.move_pending:
+            with self.timer.stage(iteration, "move"):
+                self.wait_for_move()
+            self.move_pending = False
+
+    def __iteration(self, iteration, jobs):
+        """
+        Take all measurements for the current cavity length, appending the work that
+        can be done off the main thread to jobs.
+        """
+
+        with self.timer.stage(iteration, "status"):
+            self.print_status_info()
+            cavity_length = self.ardu_comm.get_cavity_length()
+        jobs.append(("upload terminal", self.upload_terminal_output))
+
+        with self.timer.stage(iteration, "reflection"):
+            mode_of_desire, nwa_data, centers = self.locate_mode_reflection(cavity_length)
+        jobs.append(("save power spectrum", lambda: self.save_power_spec(nwa_data, cavity_length, centers)))
+
+        if (mode_of_desire <= 0):
+            return
+
+        with self.timer.stage(iteration, "transmission"):
+            mode_of_desire, final_window = self.measure_peak(mode_of_desire)
+        if (mode_of_desire <= 0):
+            return
+
+        with self.timer.stage(iteration, "signal analyzer"):
+            sa_data = self.get_data_sa(mode_of_desire)
+
+        jobs.append(("save frequency window", lambda: self.save_freq_window(final_window)))
+        jobs.append(("fit", lambda: self.fit_peak(final_window, mode_of_desire)))
+        jobs.append(("save signal analyzer", lambda: self.save_sa_data(sa_data, cavity_length, iteration)))
+
+    def program(self):
+
+        self.prequel()
+        self.set_background()
+        self.rapid_traverse()
+
+        for _ in range(0, self.num_of_iters):
+            iteration = self.iteration
+            jobs = []
+
+            self.__wait_for_move(iteration)
+            self.__iteration(iteration, jobs)
+
+            # instruments are done with this length, start moving to the next one
+            # while the background worker catches up
+            self.next_iteration(wait=False)
+            self.move_pending = True
+
+            self.__wait_for_background(iteration)
+            self.background_task = self.executor.submit(self.__run_background, iteration, jobs)
+            self.background_iteration = iteration
+
+        self.__wait_for_move(self.iteration)
+        self.__wait_for_background(self.iteration)
+        self.timer.report(self.iteration)
+        self.transfer_terminal_output()
+
+    def panic_cleanup(self):
+
+        self.executor.shutdown(wait=True)
+        super(PipelinedModeTrackProgram, self).panic_cleanup()
@@ -19,6 +19,8 @@
 #include <functional> // plus/minus
 #include <utility>//std::make_pair
 #include <map>//std::map
+#include <stdexcept>//std::invalid_argument
+#include <complex>//std::complex, std::polar
 
 //Boost Headers
 #include <boost/algorithm/string.hpp>//split() and is_any_of for parsing .csv files
@@ -119,10 +121,38 @@ double ModeTrack::GetPeaks(std::string data_str, int mode_number, Method filter_
     //cast string triples to double triples
     CastToType();
 
+    double frequency = FindMode(entries, mode_number, filter_method);
+
+    entries_strings.clear();
+    entries.clear();
+
+    return frequency;
+}
+
+//pair up frequency and power arrays passed in from Python as data triples
+inline std::vector<std::tuple<double,double,double>> MakeTriples(const double* frequencies, int num_frequencies,\
+        const double* powers, int num_powers, double length) {
+
+    if(num_frequencies != num_powers) {
+        throw std::invalid_argument("Need one frequency per power value.");
+    }
+
+    std::vector<std::tuple<double,double,double>> triples;
+    triples.reserve(num_powers);
+
+    for(int i = 0; i < num_powers; i++) {
+        triples.push_back(std::make_tuple(frequencies[i], length, powers[i]));
+    }
+
+    return triples;
+}
+
+double ModeTrack::FindMode(std::vector<std::tuple<double,double,double>>& points, int mode_number, Method filter_method) {
+
     std::vector<double> power_list;
 
     //seperate out power data
-    for (const auto& val : entries) {
+    for (const auto& val : points) {
         power_list.push_back(std::get<2>(val));
     }
 
@@ -134,10 +164,17 @@ double ModeTrack::GetPeaks(std::string data_str, int mode_number, Method filter_
     //check to see if any mode were identified
     //if not return the default value of 'zero'
     if(peak_list.size() >= 1) {
-        auto identified_peaks = CompareAndFill(peak_list, entries);
-
-        entries_strings.clear();
-        entries.clear();
+        std::map<uint,double> matched_peaks;
+        auto identified_peaks = CompareAndFill(peak_list, points, &matched_peaks);
+
+        //refine the path of every mode that was actually found
+        std::vector<double> peaks (estimated_paths.size(), 0.0);
+        for(const auto& peak : matched_peaks) {
+            if(peak.first < peaks.size()) {
+                peaks[peak.first] = peak.second;
+            }
+        }
+        UpdateModePaths(std::get<1>(points.at(0)), peaks);
 
         //check to see if requested mode number has been identified
         //if it has return the frequency at which it was found
@@ -148,12 +185,148 @@ double ModeTrack::GetPeaks(std::string data_str, int mode_number, Method filter_
             return 0.0;
         }
     } else {
+        for(auto& path : estimated_paths) {
+            path.Step(false);
+        }
+        return 0.0;
+    }
+}
 
-        entries_strings.clear();
-        entries.clear();
+std::vector<double> ModeTrack::FindMatchedPeaks(std::vector<std::tuple<double,double,double>>& points, Method filter_method) {
 
-        return 0.0;
+    std::vector<double> peaks (estimated_paths.size(), 0.0);
+    std::vector<double> power_list;
+
+    //seperate out power data
+    for (const auto& val : points) {
+        power_list.push_back(std::get<2>(val));
+    }
+
+    SubtractBackground(power_list,background);
+
+    auto peak_list = FindPeaks(power_list,filter_method);
+
+    if(peak_list.size() >= 1) {
+        std::map<uint,double> matched_peaks;
+        CompareAndFill(peak_list, points, &matched_peaks, false);
+
+        for(const auto& peak : matched_peaks) {
+            if(peak.first < peaks.size()) {
+                peaks[peak.first] = peak.second;
+            }
+        }
+    }
+
+    return peaks;
+}
+
+void ModeTrack::UpdateModePaths(double length, const std::vector<double>& peaks) {
+
+    //refine the path of every mode that was matched, then let every
+    //path drift before the next measurement
+    for(uint i = 0; i < estimated_paths.size(); i++) {
+        bool found = i < peaks.size() && peaks[i] > 0 && estimated_paths[i].Update(length, peaks[i]);
+        estimated_paths[i].Step(found);
+    }
+}
+
+double ModeTrack::GetPeaksGaussArray(const double* frequencies, int num_frequencies,\
+        const double* powers, int num_powers, double length, int mode_number) {
+
+    auto points = MakeTriples(frequencies, num_frequencies, powers, num_powers, length);
+    return FindMode(points, mode_number, Gauss);
+}
+
+double ModeTrack::GetPeaksBiLatArray(const double* frequencies, int num_frequencies,\
+        const double* powers, int num_powers, double length, int mode_number) {
+
+    auto points = MakeTriples(frequencies, num_frequencies, powers, num_powers, length);
+    return FindMode(points, mode_number, BiLat);
+}
+
+std::vector<double> ModeTrack::GetMatchedPeaksGaussArray(const double* frequencies, int num_frequencies,\
+        const double* powers, int num_powers, double length) {
+
+    auto points = MakeTriples(frequencies, num_frequencies, powers, num_powers, length);
+    return FindMatchedPeaks(points, Gauss);
+}
+
+std::vector<double> ModeTrack::GetMatchedPeaksBiLatArray(const double* frequencies, int num_frequencies,\
+        const double* powers, int num_powers, double length) {
+
+    auto points = MakeTriples(frequencies, num_frequencies, powers, num_powers, length);
+    return FindMatchedPeaks(points, BiLat);
+}
+
+double ModeTrack::GetMaxPeakArray(const double* frequencies, int num_frequencies,\
+        const double* powers, int num_powers) {
+
+    auto points = MakeTriples(frequencies, num_frequencies, powers, num_powers, 0.0);
+    return FindMaxPeak(points);
+}
+
+void ModeTrack::SetBackgroundArray(const double* powers, int num_powers) {
+    background.assign(powers, powers + num_powers);
+}
+
+std::vector<std::vector<double>> ModeTrack::GetPeaksBatch(const std::vector<std::vector<double>>& power_spectra,\
+        const std::vector<double>& frequencies, const std::vector<double>& lengths, Method filter_method) {
+
+    if(power_spectra.size() != lengths.size()) {
+        throw std::invalid_argument("Need one cavity length per power spectrum.");
     }
+
+    int num_spectra = power_spectra.size();
+
+    //one row per spectrum, format is frequency of mode 0,1,2,3 and zero if not found
+    std::vector<std::vector<double>> results (num_spectra, std::vector<double>(estimated_paths.size(), 0.0));
+
+    //spectra are independent of one another and mode paths are only read, so each
+    //spectrum can be handed to its own thread
+    #pragma omp parallel for schedule(dynamic)
+    for(int j = 0; j < num_spectra; j++) {
+
+        std::vector<double> power_list (power_spectra[j]);
+
+        if(power_list.size() != frequencies.size()) {
+            continue;
+        }
+
+        std::vector<std::tuple<double,double,double>> comparison_list;
+        comparison_list.reserve(power_list.size());
+        for(uint i = 0; i < power_list.size(); i++) {
+            comparison_list.push_back(std::make_tuple(frequencies[i], lengths[j], power_list[i]));
+        }
+
+        SubtractBackground(power_list,background);
+
+        auto peak_list = FindPeaks(power_list,filter_method);
+
+        if(peak_list.size() >= 1) {
+            //only report modes that were actually matched, not the estimates
+            //CompareAndFill uses to fill gaps between them
+            std::map<uint,double> matched_peaks;
+            CompareAndFill(peak_list, comparison_list, &matched_peaks, false);
+
+            for(const auto& peak : matched_peaks) {
+                if(peak.first < results[j].size()) {
+                    results[j][peak.first] = peak.second;
+                }
+            }
+        }
+    }
+
+    return results;
+}
+
+std::vector<std::vector<double>> ModeTrack::GetPeaksGaussBatch(const std::vector<std::vector<double>>& power_spectra,\
+        const std::vector<double>& frequencies, const std::vector<double>& lengths) {
+    return GetPeaksBatch(power_spectra, frequencies, lengths, Gauss);
+}
+
+std::vector<std::vector<double>> ModeTrack::GetPeaksBiLatBatch(const std::vector<std::vector<double>>& power_spectra,\
+        const std::vector<double>& frequencies, const std::vector<double>& lengths) {
+    return GetPeaksBatch(power_spectra, frequencies, lengths, BiLat);
 }
 
 double ModeTrack::GetPeaksGauss(std::string data_str, int mode_number) {
@@ -164,6 +337,28 @@ double ModeTrack::GetPeaksBiLat(std::string data_str, int mode_number) {
     return GetPeaks(data_str, mode_number, BiLat);
 }
 
+double ModeTrack::PredictFrequency(int mode_number, double length) {
+    return estimated_paths.at(mode_number).Predict(length);
+}
+
+double ModeTrack::PredictUncertainty(int mode_number, double length) {
+    return estimated_paths.at(mode_number).Uncertainty(length);
+}
+
+double ModeTrack::SearchRadius(int mode_number, double length) {
+    double radius = search_sigmas*PredictUncertainty(mode_number, length);
+    return std::min(max_search_radius, std::max(min_search_radius, radius));
+}
+
+bool ModeTrack::AddObservation(int mode_number, double length, double frequency) {
+    return estimated_paths.at(mode_number).Update(length, frequency);
+}
+
+void ModeTrack::ResetModePaths() {
+    estimated_paths.clear();
+    PopulateBestFitCurves();
+}
+
 void ModeTrack::SetLowerBound(double frequency) {
     upper_bound = frequency;
 }
@@ -179,10 +374,20 @@ double ModeTrack::GetMaxPeak(std::string data_str) {
     //cast string triples to double triples
     CastToType();
 
+    double frequency = FindMaxPeak(entries);
+
+    entries_strings.clear();
+    entries.clear();
+
+    return frequency;
+}
+
+double ModeTrack::FindMaxPeak(std::vector<std::tuple<double,double,double>>& points) {
+
     std::vector<double> power_list;
 
     //seperate out power data
-    for (const auto& val : entries) {
+    for (const auto& val : points) {
         power_list.push_back(std::get<2>(val));
     }
 
@@ -193,13 +398,10 @@ double ModeTrack::GetMaxPeak(std::string data_str) {
     if(peak_index == 0) {
         frequency = 0.0;
     } else {
-        auto data_triple = entries.at(peak_index);
+        auto data_triple = points.at(peak_index);
         frequency = std::get<0>(data_triple);
     }
 
-    entries_strings.clear();
-    entries.clear();
-
     return frequency;
 }
 
@@ -209,7 +411,9 @@ void ModeTrack::SetBackground(std::string background_str) {
     //cast string triples to double triples
     CastToType();
 
-    //seperate out power data and load into background data vector
+    //seperate out power data and load into background data vector,
+    //replacing any background set earlier
+    background.clear();
     for (const auto& val : entries) {
         background.push_back(std::get<2>(val));
     }
@@ -306,21 +510,19 @@ void ModeTrack::LoadFromConfig(const char* config_name) {
 
 std::vector<double> ModeTrack::Derivative(std::vector<double> &data_list) {
 
-    std::vector<double> der_list;
+    int list_size = data_list.size();
 
-    std::deque<double> data_deque (data_list.begin(),data_list.end());
     //Pad data_list with zeros at front and back
-    for (unsigned int i=0; i<2; i++) {
-        data_deque.push_front(0.0);
-        data_deque.push_back(0.0);
-    }
+    std::vector<double> padded (list_size + 4, 0.0);
+    std::copy(data_list.begin(), data_list.end(), padded.begin() + 2);
 
-    #pragma omp parallel for ordered schedule(dynamic)
-    for(unsigned int n=2; n<data_list.size()+2; n++) {
-        double der = (-data_deque.at(n+2)+8*data_deque.at(n+1)-8*data_deque.at(n-1)+data_deque.at(n-2))/12;
+    std::vector<double> der_list (list_size);
 
-        #pragma omp ordered
-        der_list.push_back(der);
+    #pragma omp parallel for schedule(static)
+    for(int n = 0; n < list_size; n++) {
+        //centre of the stencil, ie data_list[n]
+        const double* d = padded.data() + n + 2;
+        der_list[n] = (-d[2]+8*d[1]-8*d[-1]+d[-2])/12;
     }
     return(der_list);
 }
@@ -341,11 +543,10 @@ inline double gaussian(double x, double sigma) {
     return 1/(sqrt(M_PI_2)*sigma)*exp( -0.5 *pow(x/sigma,2.0));
 }
 
-//generate a gaussian kernel of radius 'r', suitable for convolutions
-//kernel will have a standard deviation of r/2.
-std::vector<double> ModeTrack::GaussKernel(int r) {
+//generate a gaussian kernel of radius 'r' and standard deviation 'sigma',
+//suitable for convolutions
+std::vector<double> ModeTrack::GaussKernel(int r, double sigma) {
 
-    double sigma = static_cast<double>(r)/2.0;
     std::vector<double> vals;
     for( int i = -r; i<= r ; i ++) {
         vals.push_back(gaussian(i,sigma));
@@ -381,39 +582,185 @@ std::vector<double> ModeTrack::Normalize(std::vector<double>& data_list) {
     return data_list;
 }
 
-std::vector<double> ModeTrack::Convolve(std::vector<double>& data_list,std::vector<double>& kernel) {
+std::vector<double> ModeTrack::Convolve(const std::vector<double>& data_list,const std::vector<double>& kernel) {
     int n = data_list.size();
     int k = kernel.size();
 
-    std::vector<double> convolved_list;
-
-    //Copy data_list into deque to speed up front/back insertions that will be needed
-    //for zero padding
-    std::deque<double> data_deque (data_list.begin(),data_list.end());
-    //Pad data_list with zeros at front and back
-    for (int i=1; i<=k; i++) {
-        data_deque.push_front(0.0);
-        data_deque.push_back(0.0);
-    }
+    //only outputs for which the kernel lies entirely within data_list are kept,
+    //so no zero padding is needed
+    std::vector<double> convolved_list (std::max(n-k,0));
 
-    for(int i = 2*k; i<n+k; i++) {
+    #pragma omp parallel for schedule(static)
+    for(int m = 0; m < n-k; m++) {
+        const double* d = data_list.data() + m + k;
         double conv_elem=0.0;
         for(int j = 0; j<k ; j++) {
-            conv_elem+=data_deque.at(i-j)*kernel.at(j);
+            conv_elem+=d[-j]*kernel[j];
         }
 
-        convolved_list.push_back(conv_elem);
-
+        convolved_list[m] = conv_elem;
     }
     return convolved_list;
 }
 
-//Convolve the input list 'data_list' with a gaussian kernel of radius 15
+//Convolve the input list 'data_list' with a gaussian kernel of radius 'gauss_radius'
 //serves as a low-pass filter that surpressed noise.
 std::vector<double> ModeTrack::GaussBlur(std::vector<double>& data_list) {
+    return GaussBlur(data_list, gauss_radius, gauss_sigma);
+}
+
+std::vector<double> ModeTrack::GaussBlur(const std::vector<double>& data_list, int radius, double sigma) {
+
+    const ConvolutionKernel& kernel = CachedGaussKernel(radius, sigma);
+
+    if(kernel.PreferFFT(data_list.size())) {
+        return kernel.FFTConvolve(data_list);
+    }
+    return Convolve(data_list,kernel.Taps());
+}
+
+const ConvolutionKernel& ModeTrack::CachedGaussKernel(int radius, double sigma) {
+
+    const ConvolutionKernel* kernel;
+
+    //entries are never removed, so the returned reference stays valid
+    //after the lock is released
+    #pragma omp critical(gauss_kernels)
+    {
+        auto key = std::make_pair(radius, sigma);
+        auto found = gauss_kernels.find(key);
+
+        if(found == gauss_kernels.end()) {
+            found = gauss_kernels.emplace(key, ConvolutionKernel(GaussKernel(radius, sigma))).first;
+        }
+        kernel = &found->second;
+    }
+
+    return *kernel;
+}
 
-    auto gauss_matrix = GaussKernel(15);
-    return Convolve(data_list,gauss_matrix);
+//product of two complex numbers, written out so that the compiler does not
+//call into the C99 routine that handles infinities and NaNs
+inline std::complex<double> Multiply(const std::complex<double>& a, const std::complex<double>& b) {
+    return std::complex<double>(a.real()*b.real()-a.imag()*b.imag(), a.real()*b.imag()+a.imag()*b.real());
+}
+
+ConvolutionKernel::ConvolutionKernel(const std::vector<double>& taps) : taps(taps) {
+
+    //each block of input is (fft_size - taps.size() + 1) points long, so a few
+    //times the kernel length keeps the overlap between blocks small
+    fft_size = 64;
+    while(fft_size < 4*taps.size()) {
+        fft_size *= 2;
+    }
+
+    for(std::size_t j = 0; j < fft_size/2; j++) {
+        twiddles.push_back(std::polar(1.0, -2.0*M_PI*j/fft_size));
+    }
+
+    spectrum.assign(fft_size, 0.0);
+    std::copy(taps.begin(), taps.end(), spectrum.begin());
+    FFT(spectrum);
+}
+
+const std::vector<double>& ConvolutionKernel::Taps() const {
+    return taps;
+}
+
+bool ConvolutionKernel::PreferFFT(std::size_t data_size) const {
+
+    std::size_t k = taps.size();
+    if(data_size <= k) {
+        return false;
+    }
+
+    double direct_cost = static_cast<double>(data_size - k)*k;
+
+    //two blocks are transformed together, see FFTConvolve()
+    std::size_t block = fft_size - k + 1;
+    double pairs = ceil(data_size/(2.0*block));
+    double fft_cost = pairs*butterfly_cost*fft_size*(log2(fft_size) + 1);
+
+    return fft_cost < direct_cost;
+}
+
+std::vector<double> ConvolutionKernel::FFTConvolve(const std::vector<double>& data_list) const {
+
+    int n = data_list.size();
+    int k = taps.size();
+
+    if(n <= k) {
+        return std::vector<double>();
+    }
+
+    //full linear convolution, only the first n points are needed
+    std::vector<double> full (n, 0.0);
+    std::vector<std::complex<double>> buffer (fft_size);
+
+    int block = fft_size - k + 1;
+    double scale = 1.0/fft_size;
+
+    //the kernel is real, so two consecutive blocks can be convolved at once
+    //by placing them in the real and imaginary parts of the same FFT
+    for(int start = 0; start < n; start += 2*block) {
+
+        std::fill(buffer.begin(), buffer.end(), 0.0);
+        for(int i = 0; i < block && start + i < n; i++) {
+            buffer[i].real(data_list[start + i]);
+        }
+        for(int i = 0; i < block && start + block + i < n; i++) {
+            buffer[i].imag(data_list[start + block + i]);
+        }
+
+        FFT(buffer);
+        //inverse transform by conjugating before and after a forward transform
+        for(std::size_t i = 0; i < fft_size; i++) {
+            buffer[i] = std::conj(Multiply(buffer[i], spectrum[i]));
+        }
+        FFT(buffer);
+
+        for(int i = 0; i < static_cast<int>(fft_size) && start + i < n; i++) {
+            full[start + i] += buffer[i].real()*scale;
+        }
+        for(int i = 0; i < static_cast<int>(fft_size) && start + block + i < n; i++) {
+            full[start + block + i] -= buffer[i].imag()*scale;
+        }
+    }
+
+    //same alignment as ModeTrack::Convolve()
+    return std::vector<double>(full.begin() + k, full.end());
+}
+
+//in place iterative radix-2 FFT, data must hold fft_size points
+void ConvolutionKernel::FFT(std::vector<std::complex<double>>& data) const {
+
+    std::size_t n = data.size();
+
+    //bit reversal permutation
+    for(std::size_t i = 1, j = 0; i < n; i++) {
+        std::size_t bit = n >> 1;
+        for(; j & bit; bit >>= 1) {
+            j ^= bit;
+        }
+        j ^= bit;
+
+        if(i < j) {
+            std::swap(data[i], data[j]);
+        }
+    }
+
+    for(std::size_t len = 2; len <= n; len <<= 1) {
+        std::size_t half = len/2;
+        std::size_t stride = n/len;
+
+        for(std::size_t i = 0; i < n; i += len) {
+            for(std::size_t j = 0; j < half; j++) {
+                auto t = Multiply(twiddles[j*stride], data[i + j + half]);
+                data[i + j + half] = data[i + j] - t;
+                data[i + j] += t;
+            }
+        }
+    }
 }
 
 void ModeTrack::DebugSaveInfo(std::vector<double> filtered_list,ModeTrack::Method method) {
@@ -464,14 +811,12 @@ std::vector<double> ModeTrack::FindPeaks(std::vector<double>& data_list, ModeTra
 
     std::vector<double> peak_list;
 
-    #pragma omp parallel for ordered schedule(dynamic)
+    //a single comparison per point, cheaper to do serially than to share out between threads
     for(int i = 0; i<f_prime_size; i++) {
 
-        if(f_prime.at(i)<3*sigma && f_prime.at(i+1)>3*sigma) {
+        if(f_prime[i]<3*sigma && f_prime[i+1]>3*sigma) {
 
             if(i+1 < max_size - 4 && i+1 > 4) {
-
-                #pragma omp ordered
                 peak_list.push_back(static_cast<double>(i+1));
             }
         }
@@ -541,30 +886,110 @@ uint ModeTrack::FindMaxima(std::vector<double>& data_list) {
     return peak_index;
 }
 
-inline double QuadraticSpline(double a, double b, double c, double x) {
-    return a*pow(x,2.0)+b*x+c;
+ModePath::ModePath(double a, double b, double c, double prior_sigma, double reference_length) {
+
+    coeffs = {{a, b, c}};
+
+    //split the prior uncertainty evenly between the three terms of the quadratic
+    //at the reference length, and likewise for the process noise
+    auto basis = Basis(reference_length);
+
+    for(uint i = 0; i < 3; i++) {
+        covariance[i].fill(0.0);
+        covariance[i][i] = pow(prior_sigma/basis[i],2.0)/3.0;
+        process_noise[i] = pow(process_sigma/basis[i],2.0)/3.0;
+    }
+}
+
+std::array<double,3> ModePath::Basis(double length) {
+    return {{length*length, length, 1.0}};
 }
 
-double ModeTrack::GenerateSpline(int mode_number, double length) {
+double ModePath::Predict(double length) const {
 
-    double a = std::get<0>(estimated_paths.at(mode_number));
-    double b = std::get<1>(estimated_paths.at(mode_number));
-    double c = std::get<2>(estimated_paths.at(mode_number));
+    auto basis = Basis(length);
 
-    return QuadraticSpline(a,b,c,length);
+    return coeffs[0]*basis[0]+coeffs[1]*basis[1]+coeffs[2]*basis[2];
+}
+
+double ModePath::Uncertainty(double length) const {
+
+    auto basis = Basis(length);
+
+    double variance = measurement_sigma*measurement_sigma;
+    for(uint i = 0; i < 3; i++) {
+        for(uint j = 0; j < 3; j++) {
+            variance += basis[i]*covariance[i][j]*basis[j];
+        }
+    }
+
+    return sqrt(variance);
+}
+
+bool ModePath::Update(double length, double frequency) {
+
+    auto basis = Basis(length);
+
+    //covariance times basis, and the variance of the innovation
+    std::array<double,3> p_basis;
+    double innovation_variance = measurement_sigma*measurement_sigma;
+
+    for(uint i = 0; i < 3; i++) {
+        p_basis[i] = covariance[i][0]*basis[0]+covariance[i][1]*basis[1]+covariance[i][2]*basis[2];
+        innovation_variance += basis[i]*p_basis[i];
+    }
+
+    double innovation = frequency - Predict(length);
+
+    //a single bad match would otherwise be accepted in full
+    if(fabs(innovation) > gate_sigmas*sqrt(innovation_variance)) {
+        return false;
+    }
+
+    //standard Kalman update with gain p_basis/innovation_variance
+    for(uint i = 0; i < 3; i++) {
+        double gain = p_basis[i]/innovation_variance;
+        coeffs[i] += gain*innovation;
+
+        for(uint j = 0; j < 3; j++) {
+            covariance[i][j] -= gain*p_basis[j];
+        }
+    }
+
+    observations++;
+
+    return true;
+}
+
+void ModePath::Step(bool found) {
+
+    missed_steps = found ? 0 : missed_steps + 1;
+
+    for(uint i = 0; i < 3; i++) {
+        covariance[i][i] += process_noise[i]*(1 + missed_steps)*(1 + missed_steps);
+    }
+}
+
+unsigned int ModePath::Observations() const {
+    return observations;
+}
+
+double ModeTrack::GenerateSpline(int mode_number, double length) {
+    return estimated_paths.at(mode_number).Predict(length);
 }
 
 void ModeTrack::PopulateBestFitCurves() {
 
-    auto mode_one_coeffs = std::make_tuple(47.9998,-1041.54,8950.56);
-    auto mode_two_coeffs = std::make_tuple(44.2758,-1055.35,9610.61);
-    auto mode_three_coeffs = std::make_tuple(45.8298,-1139.8,10626.7);
-    auto mode_four_coeffs = std::make_tuple(37.697,-1038.49,10780.2);
+    //start out twice as uncertain as the fixed search radius used to be,
+    //so that until peaks are identified the search radius is max_search_radius
+    double prior_sigma = 2.0*max_search_radius/search_sigmas;
+    //middle of the range of cavity lengths covered by the old mode map (inches)
+    double reference_length = 7.5;
 
-    estimated_paths.push_back(mode_one_coeffs);
-    estimated_paths.push_back(mode_two_coeffs);
-    estimated_paths.push_back(mode_three_coeffs);
-    estimated_paths.push_back(mode_four_coeffs);
+    estimated_paths.push_back(ModePath(47.9998,-1041.54,8950.56,prior_sigma,reference_length));
+    estimated_paths.push_back(ModePath(44.2758,-1055.35,9610.61,prior_sigma,reference_length));
+    estimated_paths.push_back(ModePath(45.8298,-1139.8,10626.7,prior_sigma,reference_length));
+    estimated_paths.push_back(ModePath(37.697,-1038.49,10780.2,prior_sigma,reference_length));
 }
 
 template<typename T>
@@ -613,7 +1038,8 @@ inline void c_print(T text,int color) {
 //peak_list: list of indices (in frequency space) where peaks were found for a particular cavity length
 //comparison_list: of data triples at the same cavity length
 std::map<uint,double> ModeTrack::CompareAndFill(std::vector<double>& peak_list,\
-        std::vector<std::tuple<double,double,double>>& comparison_list) {
+        std::vector<std::tuple<double,double,double>>& comparison_list,\
+        std::map<uint,double>* matched_peaks, bool verbose) {
 
     //format is <peak index,<delta_mu,frequency>>
     //where delta_mu is defined below
@@ -641,11 +1067,13 @@ std::map<uint,double> ModeTrack::CompareAndFill(std::vector<double>& peak_list,\
         auto min_val = *minima;
         auto min_position = std::distance(std::begin(results), minima);
 
-        std::cout<<"Smallest frequency seperation: "<<min_val;
-        std::cout<<" at Peak: "<<min_position<<std::endl;
+        if(verbose) {
+            std::cout<<"Smallest frequency seperation: "<<min_val;
+            std::cout<<" at Peak: "<<min_position<<std::endl;
+        }
 
-        if(min_val >= max_search_radius) {
-            c_print("Identified peak was too far from any estimated value.",0);
+        if(min_val >= SearchRadius(min_position, length)) {
+            if(verbose) c_print("Identified peak was too far from any estimated value.",0);
             continue;
         }
 
@@ -671,6 +1099,12 @@ std::map<uint,double> ModeTrack::CompareAndFill(std::vector<double>& peak_list,\
 
     }
 
+    if(matched_peaks != nullptr) {
+        for(const auto& peak : found_peaks) {
+            (*matched_peaks)[peak.first] = peak.second.second;
+        }
+    }
+
     //initalize map to default "error" value of all zeros
     //if this initial value is returned it will caused GetPeaks
     //to return a value of 0.0f which is interpreted as the
@@ -692,19 +1126,23 @@ std::map<uint,double> ModeTrack::CompareAndFill(std::vector<double>& peak_list,\
         //fill in data using estimated peak position.
         if( found_peaks.count(i) != 0 ) {
 
-            std::cout<<"Match for peak: "<<i<<", ";
             double peak_frequency = found_peaks[i].second;
-//            std::cout<<"Using real value of: "<<peak_frequency<<std::endl;
-            std::string message_str = "Using real value of: "+boost::lexical_cast<std::string>(peak_frequency)+"MHz";
-            c_print(message_str,2);
+            if(verbose) {
+                std::cout<<"Match for peak: "<<i<<", ";
+//                std::cout<<"Using real value of: "<<peak_frequency<<std::endl;
+                std::string message_str = "Using real value of: "+boost::lexical_cast<std::string>(peak_frequency)+"MHz";
+                c_print(message_str,2);
+            }
             identified_peaks[i] = peak_frequency;
 
         } else {
-            std::cout<<"No match for peak: "<<i<<", ";
             double peak_frequency = GenerateSpline(i,g_length);
-//            std::cout<<"Filling with estimate of: "<<peak_frequency<<std::endl;
-            std::string message_str = "Filling with estimate of: "+boost::lexical_cast<std::string>(peak_frequency)+"MHz";
-            c_print(message_str,8);
+            if(verbose) {
+                std::cout<<"No match for peak: "<<i<<", ";
+//                std::cout<<"Filling with estimate of: "<<peak_frequency<<std::endl;
+                std::string message_str = "Filling with estimate of: "+boost::lexical_cast<std::string>(peak_frequency)+"MHz";
+                c_print(message_str,8);
+            }
             identified_peaks[i] = peak_frequency;
         }
     }
@@ -713,44 +1151,126 @@ std::map<uint,double> ModeTrack::CompareAndFill(std::vector<double>& peak_list,\
 
 }
 
+//gaussian(x, sigma) tabulated at 'steps_per_sigma' points per standard deviation
+//and evaluated by linear interpolation, out to 'max_sigmas' standard deviations
+//beyond which it is taken to be zero. Used for the range kernel of BilateralFilter,
+//whose argument is only known once the data is, in place of a call to exp per pair of points.
+class GaussianTable {
+  public:
+    explicit GaussianTable(double sigma) : scale(steps_per_sigma/sigma) {
+        int size = static_cast<int>(max_sigmas*steps_per_sigma) + 2;
+        values.reserve(size);
+        for(int i = 0; i < size - 1; i++) {
+            values.push_back(gaussian(i/scale, sigma));
+        }
+        //guard entry so that interpolating at the last step reads zero
+        values.push_back(0.0);
+    }
+
+    double operator()(double x) const {
+        double pos = std::fabs(x)*scale;
+        if(pos >= max_sigmas*steps_per_sigma) {
+            return 0.0;
+        }
+        int i = static_cast<int>(pos);
+        double frac = pos - i;
+        return values[i] + frac*(values[i+1] - values[i]);
+    }
+
+  private:
+    static constexpr int steps_per_sigma = 128;
+    static constexpr double max_sigmas = 8.0;
+    double scale;
+    std::vector<double> values;
+};
+
 std::vector<double> ModeTrack::BilateralFilter(std::vector<double>& data_list,double sigma_s, double sigma_r) {
 
     int list_size = data_list.size();
 
     int radius = static_cast<int>(ceil(5/2*sigma_s));
 
-    //Copy data_list into deque to speed up front/back insertions that will be needed
-    //for zero padding
-    std::deque<double> data_deque (data_list.begin(),data_list.end());
     //Pad data_list with zeros at front and back
-    for (int i=1; i<=radius; i++) {
-        data_deque.push_front(0.0);
-        data_deque.push_back(0.0);
+    std::vector<double> padded (list_size + 2*radius, 0.0);
+    std::copy(data_list.begin(), data_list.end(), padded.begin() + radius);
+
+    //the spatial weight depends only on the distance between points
+    std::vector<double> spatial_weights (radius + 1);
+    for(int i = 0; i <= radius; i++) {
+        spatial_weights[i] = gaussian(i,sigma_s);
     }
 
-    std::vector<double> convolved_list;
+    const GaussianTable range_weight (sigma_r);
+
+    std::vector<double> convolved_list (list_size);
 
-    #pragma omp parallel for ordered schedule(dynamic)
-    for(int p = radius; p < list_size + radius; p++) {
+    #pragma omp parallel for schedule(static)
+    for(int p = 0; p < list_size; p++) {
+
+        const double* centre = padded.data() + p + radius;
 
         double conv_element = 0.0;
         double norm_weight = 0.0;
 
-        for(int q = p -radius; q <= p + radius ; q++) {
+        for(int q = -radius; q <= radius ; q++) {
 
-            double pos_weight = abs(p-q);
-            double intens_weight = data_deque.at(p)-data_deque.at(q);
-            double val_sigma_s = gaussian(pos_weight,sigma_s);
-            double val_sigma_r = gaussian(intens_weight,sigma_r);
-            norm_weight +=val_sigma_s*val_sigma_r;
-            conv_element +=val_sigma_s*val_sigma_r*data_deque.at(q);
+            double weight = spatial_weights[abs(q)]*range_weight(centre[0]-centre[q]);
+            norm_weight += weight;
+            conv_element += weight*centre[q];
 
         }
 
-        #pragma omp ordered
-        convolved_list.push_back(conv_element/norm_weight);
+        convolved_list[p] = conv_element/norm_weight;
     }
 
     return convolved_list;
 }
 
+void ModeTrack::BilateralFilterArray(const double* powers, int num_powers, double* filtered, int num_filtered,
+                                     double sigma_s, double sigma_r) {
+
+    if(num_filtered != num_powers) {
+        throw std::invalid_argument("BilateralFilterArray: output must be the same size as the input");
+    }
+
+    std::vector<double> power_list (powers, powers + num_powers);
+    auto filtered_list = BilateralFilter(power_list, sigma_s, sigma_r);
+    std::copy(filtered_list.begin(), filtered_list.end(), filtered);
+}
+
+void ModeTrack::SetGaussKernel(int radius, double sigma) {
+
+    if(radius < 1 || !(sigma > 0.0)) {
+        throw std::invalid_argument("SetGaussKernel: radius and sigma must be positive");
+    }
+
+    gauss_radius = radius;
+    gauss_sigma = sigma;
+}
+
+void ModeTrack::GaussBlurArray(const double* powers, int num_powers, double* filtered, int num_filtered,
+                               int radius, double sigma) {
+
+    if(radius < 1 || !(sigma > 0.0)) {
+        throw std::invalid_argument("GaussBlurArray: radius and sigma must be positive");
+    }
+    if(num_filtered != std::max(num_powers - 2*radius - 1, 0)) {
+        throw std::invalid_argument("GaussBlurArray: output must be 2*radius+1 points shorter than the input");
+    }
+
+    std::vector<double> power_list (powers, powers + num_powers);
+    auto filtered_list = GaussBlur(power_list, radius, sigma);
+    std::copy(filtered_list.begin(), filtered_list.end(), filtered);
+}
+
+void ModeTrack::DerivativeArray(const double* powers, int num_powers, double* derivative, int num_derivative) {
+
+    if(num_derivative != num_powers) {
+        throw std::invalid_argument("DerivativeArray: output must be the same size as the input");
+    }
+
+    std::vector<double> power_list (powers, powers + num_powers);
+    auto der_list = Derivative(power_list);
+    std::copy(der_list.begin(), der_list.end(), derivative);
+}
+
@@ -4,6 +4,130 @@
 #include <tuple>
 #include <vector>
 #include <map>
+#include <array>
+#include <string>
+#include <complex>
+
+/*!
+ * \brief Quadratic model of a single mode's frequency as a function of cavity length
+ *
+ * The coefficients of \f$ f(x) = a x^2+b x+c \f$ are treated as the state of a
+ * Kalman filter, starting from the coefficients found by examining an old mode map.
+ * Each identified peak refines the coefficients. Process noise is added once per
+ * measurement by Step(), whether or not the mode was found, so the model can follow
+ * a path that drifts away from the old mode map. The noise grows with the number of
+ * measurements since the mode was last found, so a path that has lost its mode widens
+ * its search until the mode is found again.
+ */
+class ModePath {
+  public:
+    /*!
+     * \param a,b,c initial coefficients, ie the path found from an old mode map
+     * \param prior_sigma uncertainty (MHz) of the initial path at reference_length
+     * \param reference_length typical cavity length (inches), used to spread
+     * prior_sigma over the three coefficients
+     */
+    ModePath(double a, double b, double c, double prior_sigma, double reference_length);
+
+    /*!
+     * \brief Predicted frequency (MHz) of the mode at cavity length 'length'
+     */
+    double Predict(double length) const;
+
+    /*!
+     * \brief One standard deviation uncertainty (MHz) of a peak found at 'length',
+     * including the measurement noise
+     */
+    double Uncertainty(double length) const;
+
+    /*!
+     * \brief Refine the path using a peak identified at 'frequency' (MHz)
+     * for cavity length 'length'
+     *
+     * Peaks further than gate_sigmas times Uncertainty() from the predicted
+     * frequency are rejected and leave the path unchanged.
+     *
+     * \return true if the peak was used
+     */
+    bool Update(double length, double frequency);
+
+    /*!
+     * \brief Predict step, called once per measurement after any Update()
+     *
+     * \param found whether the mode was found in the measurement
+     */
+    void Step(bool found);
+
+    /*!
+     * \brief Number of peaks used to refine the path
+     */
+    unsigned int Observations() const;
+
+  private:
+    //
+    std::array<double,3> coeffs;
+    //
+    std::array<std::array<double,3>,3> covariance;
+    //
+    std::array<double,3> process_noise;
+    //
+    unsigned int observations = 0;
+    //measurements since the mode was last found
+    unsigned int missed_steps = 0;
+    //uncertainty (MHz) of the frequency of an identified peak
+    double measurement_sigma = 5.0;
+    //drift (MHz) of the path allowed per measurement, multiplied by
+    //1+missed_steps while the mode is not being found
+    double process_sigma = 1.0;
+    //peaks further than this many standard deviations from the prediction are rejected
+    double gate_sigmas = 5.0;
+    //
+    static std::array<double,3> Basis(double length);
+};
+
+/*!
+ * \brief Convolution kernel, prepared for both direct and FFT convolution
+ *
+ * The FFT of the kernel is computed once, so that long inputs can be convolved
+ * by overlap-add in \f$ O(n \log k) \f$ rather than \f$ O(n k) \f$ operations.
+ */
+class ConvolutionKernel {
+  public:
+    /*!
+     * \param taps kernel values
+     */
+    explicit ConvolutionKernel(const std::vector<double>& taps);
+
+    /*!
+     * \brief Kernel values
+     */
+    const std::vector<double>& Taps() const;
+
+    /*!
+     * \brief Whether FFTConvolve() is expected to be faster than a direct
+     * convolution for an input of 'data_size' points
+     */
+    bool PreferFFT(std::size_t data_size) const;
+
+    /*!
+     * \brief Same result as ModeTrack::Convolve(), computed by overlap-add FFT convolution
+     */
+    std::vector<double> FFTConvolve(const std::vector<double>& data_list) const;
+
+  private:
+    //
+    std::vector<double> taps;
+    //length of each FFT, a power of two
+    std::size_t fft_size;
+    //exp(-2 pi i j/fft_size) for j < fft_size/2
+    std::vector<std::complex<double>> twiddles;
+    //FFT of the zero padded taps
+    std::vector<std::complex<double>> spectrum;
+    //relative cost of one FFT butterfly and one multiply-add of a direct convolution
+    static constexpr double butterfly_cost = 5.0;
+    //
+    void FFT(std::vector<std::complex<double>>& data) const;
+};
 
 /*!
  * \brief Base Class for mode tracking algorithims; designed to be wrapped with Swig
@@ -93,10 +217,204 @@ class ModeTrack {
      */
     double GetMaxPeak(std::string data_str);
 
+    /*!
+     * \brief Set background data from an array of power values
+     *
+     * Same as SetBackground() but without converting data to and from strings.
+     * The values are copied.
+     *
+     * \param powers power values, one per frequency
+     * \param num_powers number of values in powers
+     */
+    void SetBackgroundArray(const double* powers, int num_powers);
+
+    /*!
+     * \brief Same as GetPeaksGauss() but taking arrays rather than a string
+     *
+     * \param frequencies frequency (MHz) of each power value
+     * \param num_frequencies number of values in frequencies
+     * \param powers power values to be searched through
+     * \param num_powers number of values in powers, must equal num_frequencies
+     * \param length cavity length (inches) at which the data was taken
+     * \param mode_number Identify which mode should be tracked.
+     * Choices are 0,1,2 and 3.
+     *
+     * \return The frequency of the requested mode in MHz, or 0 if not found.
+     */
+    double GetPeaksGaussArray(const double* frequencies, int num_frequencies,
+                              const double* powers, int num_powers, double length, int mode_number);
+
+    /*!
+     * \brief Same as GetPeaksBiLat() but taking arrays rather than a string,
+     * see GetPeaksGaussArray()
+     */
+    double GetPeaksBiLatArray(const double* frequencies, int num_frequencies,
+                              const double* powers, int num_powers, double length, int mode_number);
+
+    /*!
+     * \brief Same as GetMaxPeak() but taking arrays rather than a string,
+     * see GetPeaksGaussArray()
+     */
+    double GetMaxPeakArray(const double* frequencies, int num_frequencies,
+                           const double* powers, int num_powers);
+
+    /*!
+     * \brief Identify minima peaks in many power spectra at once
+     * using Gaussian filtering
+     *
+     * Equivalent to calling GetPeaksGauss() once per spectrum and mode, but
+     * without converting data to and from strings, and with spectra analysed in
+     * parallel. This is intended for re-analysis of a whole mode map or reflection
+     * map. The paths of the modes are not refined by the peaks identified here.
+     *
+     * \param power_spectra One list of power values per measurement, eg one row
+     * per iteration of a reflection map. Background is subtracted as in GetPeaksGauss().
+     * \param frequencies Frequency (MHz) of each power value, shared by all spectra.
+     * Spectra of a different length are skipped.
+     * \param lengths Cavity length (inches) of each spectrum.
+     *
+     * \return One row per spectrum holding the frequency of modes 0 through 3 in MHz.
+     * Modes that were not found are given a value of 0. Unlike GetPeaksGauss(), modes
+     * missed between two found modes are not filled in with their estimated frequency,
+     * so every non-zero value is a peak that was identified in the spectrum.
+     */
+    std::vector<std::vector<double>> GetPeaksGaussBatch(const std::vector<std::vector<double>>& power_spectra,
+            const std::vector<double>& frequencies, const std::vector<double>& lengths);
+
+    /*!
+     * \brief Identify minima peaks in many power spectra at once
+     * using Bilateral filtering
+     *
+     * See GetPeaksGaussBatch(), this function differs only by the method used to filter data.
+     */
+    std::vector<std::vector<double>> GetPeaksBiLatBatch(const std::vector<std::vector<double>>& power_spectra,
+            const std::vector<double>& frequencies, const std::vector<double>& lengths);
+
+    /*!
+     * \brief Identify minima peaks in a single power spectrum using Gaussian
+     * filtering, without refining the paths of the modes
+     *
+     * Takes the same arrays as GetPeaksGaussArray(). The search is only run once,
+     * a caller that decides to keep the result passes it on to UpdateModePaths(),
+     * which has the same effect on the mode paths as GetPeaksGaussArray().
+     *
+     * \return The frequency of modes 0 through 3 in MHz. Modes that were not
+     * matched to a peak are given a value of 0, missed modes are not filled in
+     * with their estimated frequency.
+     */
+    std::vector<double> GetMatchedPeaksGaussArray(const double* frequencies, int num_frequencies,
+                                                  const double* powers, int num_powers, double length);
+
+    /*!
+     * \brief Same as GetMatchedPeaksGaussArray() but using Bilateral filtering
+     */
+    std::vector<double> GetMatchedPeaksBiLatArray(const double* frequencies, int num_frequencies,
+                                                  const double* powers, int num_powers, double length);
+
+    /*!
+     * \brief Refine the path of every mode with the peaks matched in one measurement,
+     * then let every path drift before the next measurement.
+     *
+     * \param length Cavity length (inches) of the measurement
+     * \param peaks Frequency of each mode in MHz, 0 if the mode was not matched,
+     * eg the output of GetMatchedPeaksBiLatArray()
+     */
+    void UpdateModePaths(double length, const std::vector<double>& peaks);
+
+    /*!
+     * \brief Set the Gaussian kernel used by GetPeaksGauss() and GetMaxPeak()
+     *
+     * \param radius kernel radius in points, the kernel has 2*radius+1 points.
+     * The default is 15.
+     * \param sigma standard deviation in points, the default is radius/2
+     */
+    void SetGaussKernel(int radius, double sigma);
+
+    /*!
+     * \brief Smooth a list of power values with a Gaussian kernel
+     *
+     * Kernels are cached, and long inputs are convolved by FFT, so this is
+     * suitable for full Signal Analyzer spectra or stitched multi-window maps.
+     * As in GetPeaksGauss(), the result is the convolution with the kernel where it
+     * lies entirely inside the input, so it is 2*radius+1 points shorter than the input.
+     *
+     * \param powers power values to be smoothed
+     * \param num_powers number of values in powers
+     * \param filtered filled with the smoothed values
+     * \param num_filtered number of values in filtered, must equal num_powers-2*radius-1
+     * \param radius kernel radius in points
+     * \param sigma kernel standard deviation in points
+     */
+    void GaussBlurArray(const double* powers, int num_powers, double* filtered, int num_filtered,
+                        int radius, double sigma);
+
+    /*!
+     * \brief Apply the Bilateral filter used by GetPeaksBiLat() to a list of power values
+     *
+     * The range kernel is evaluated from a table, so results agree with an exact
+     * evaluation to within a few parts per million of the spread of the data.
+     *
+     * \param powers power values to be filtered
+     * \param num_powers number of values in powers
+     * \param filtered filled with the filtered values
+     * \param num_filtered number of values in filtered, must equal num_powers
+     * \param sigma_s "Spatial" standard deviation in points, GetPeaksBiLat() uses 10
+     * \param sigma_r "Range" standard deviation in units of power, GetPeaksBiLat() uses 2
+     */
+    void BilateralFilterArray(const double* powers, int num_powers, double* filtered, int num_filtered,
+                              double sigma_s, double sigma_r);
+
+    /*!
+     * \brief Forth order approximation of the derivative of a list of power values,
+     * as used when identifying peaks. See BilateralFilterArray() for the arguments.
+     */
+    void DerivativeArray(const double* powers, int num_powers, double* derivative, int num_derivative);
+
     void SetLowerBound(double frequency);
     //
     void SetUpperBound(double frequency);
 
+    /*!
+     * \brief Predicted frequency of a mode, see ModePath.
+     *
+     * \param mode_number Choices are 0,1,2 and 3.
+     * \param length Cavity length in inches.
+     * \return Predicted frequency in MHz.
+     */
+    double PredictFrequency(int mode_number, double length);
+
+    /*!
+     * \brief One standard deviation uncertainty (MHz) of PredictFrequency().
+     */
+    double PredictUncertainty(int mode_number, double length);
+
+    /*!
+     * \brief Largest distance (MHz) from the predicted frequency at which an
+     * identified peak is still matched to a mode.
+     *
+     * This is search_sigmas times PredictUncertainty(), kept between
+     * min_search_radius and max_search_radius. The radius shrinks as the
+     * path of the mode is refined by identified peaks.
+     */
+    double SearchRadius(int mode_number, double length);
+
+    /*!
+     * \brief Refine the path of a mode with a peak found by other means,
+     * eg a transmission measurement.
+     *
+     * Peaks identified by GetPeaksGauss() and GetPeaksBiLat() are added automatically.
+     * See ModePath::Update().
+     *
+     * \return true if the peak was used, false if it was rejected as too far
+     * from the predicted frequency
+     */
+    bool AddObservation(int mode_number, double length, double frequency);
+
+    /*!
+     * \brief Forget all identified peaks and return to the paths found from an old mode map.
+     */
+    void ResetModePaths();
+
   private:
     //
     enum Method { Gauss, BiLat };
@@ -104,6 +422,16 @@ class ModeTrack {
     double lower_bound = 0.0f, upper_bound = 0.0f;
     //
     double max_search_radius = 436.344;
+    //
+    double min_search_radius = 20.0;
+    //
+    double search_sigmas = 5.0;
+    //radius and standard deviation (in points) of the Gaussian kernel used by GaussBlur()
+    int gauss_radius = 15;
+    //
+    double gauss_sigma = 7.5;
+    //Gaussian kernels keyed by (radius, sigma), see CachedGaussKernel()
+    std::map<std::pair<int,double>,ConvolutionKernel> gauss_kernels;
 
 
     /*!
@@ -128,13 +456,12 @@ class ModeTrack {
     //first entry in vector corresponds to the first mode, etc.
 
     /*!
-     * \brief quadratic best-fit coeffecients for each of the four modes.
+     * \brief frequency vs. length path for each of the four modes.
      *
-     * format is \f$ f(x) = a x^2+b x+c\f$ and tuple is populated with (a,b,c)
      * first entry in vector corresponds to the first mode (ie mode 0)
      * second entry corresponds to mode 1 etc.
      */
-    std::vector<std::tuple<double,double,double>> estimated_paths;
+    std::vector<ModePath> estimated_paths;
 
     /*!
      * \brief opens file specified and loads values into enteries_strings
@@ -161,9 +488,10 @@ class ModeTrack {
 
 
     /*!
-     * \brief Load cubic spline coeffecients for modes 0 through 3
+     * \brief Load quadratic coeffecients for modes 0 through 3
      *
-     * These values were attained by examining an old mode map.
+     * These values were attained by examining an old mode map, and are
+     * used as the starting point for each ModePath.
      */
     void PopulateBestFitCurves();
 
@@ -199,20 +527,36 @@ class ModeTrack {
      * \param kernel Convolution kernel, must be smaller than data_list
      * \return Convolution of data_list and kernel
      */
-    std::vector<double> Convolve(std::vector<double> &data_list,std::vector<double>& kernel);
+    std::vector<double> Convolve(const std::vector<double> &data_list,const std::vector<double>& kernel);
 
     //convolve list with a gaussian vector
 
     /*!
      * \brief Compute the convulution of data_list with a Gaussian kernel
      *
-     * The Gaussian kernel will have radius of 15 and sigma = 15/2.
+     * The Gaussian kernel has radius gauss_radius and sigma gauss_sigma,
+     * by default 15 and 15/2. See SetGaussKernel().
      *
      * \param data_list
      * \return
      */
     std::vector<double> GaussBlur(std::vector<double> &data_list);
 
+    /*!
+     * \brief Same as above for a kernel of the given radius and sigma.
+     *
+     * Switches to FFT convolution where ConvolutionKernel::PreferFFT() says so.
+     */
+    std::vector<double> GaussBlur(const std::vector<double> &data_list, int radius, double sigma);
+
+    /*!
+     * \brief Gaussian kernel of the given radius and sigma, generated by GaussKernel()
+     * on first use and kept in gauss_kernels.
+     *
+     * Safe to call from several OpenMP threads at once, eg by GetPeaksGaussBatch().
+     */
+    const ConvolutionKernel& CachedGaussKernel(int radius, double sigma);
+
     /*!
      * \brief Find minima peaks in a list
      * \param data_list
@@ -240,17 +584,24 @@ class ModeTrack {
      * be estimated using the GenerateSpline() function. For example if peaks
      * 0 and 3 were found, the position of peaks 1 and 2 would be estimated.
      *
+     * A peak is only matched to a mode if it lies within SearchRadius() of
+     * the estimated position.
+     *
      * \param peak_list List of peaks identified by FindPeaks() functions
      * \param comparison_list List of data triples generated by GenerateSpline() function
+     * \param matched_peaks If not null, filled with the peaks that were matched
+     * to a mode (ie not estimated), same format as the return value
+     * \param verbose Print each match to stdout
      * \return Dictionary of identified peaks, with the format of
      * [peak index]:frequency(MHz)
      */
-    std::map<uint,double> CompareAndFill(std::vector<double>& peak_list, std::vector<std::tuple<double, double, double> > &comparison_list);
+    std::map<uint,double> CompareAndFill(std::vector<double>& peak_list, std::vector<std::tuple<double, double, double> > &comparison_list,
+                                         std::map<uint,double>* matched_peaks = nullptr, bool verbose = true);
 
     //Generate estimated peak position from best fit parameters
 
     /*!
-     * \brief GenerateSpline
+     * \brief Estimated frequency of a mode, from its ModePath
      * \param mode_number
      * \param length
      * \return
@@ -260,14 +611,15 @@ class ModeTrack {
     //generate a gaussian kernel
     //used by 'GaussBlur' function
     /*!
-     * \brief Generate a Gaussian kernel of radius r and sigma = r/2
-     * Kernel is generated by sampling Gaussian function with sigma = r/2
-     * a total of r times.
+     * \brief Generate a Gaussian kernel of radius r and standard deviation sigma
+     * Kernel is generated by sampling Gaussian function with standard deviation sigma
+     * a total of 2r+1 times.
      *
      * \param r The radius of the generated kernel
+     * \param sigma The standard deviation of the kernel
      * \return Gassian Kernel
      */
-    std::vector<double> GaussKernel(int r);
+    std::vector<double> GaussKernel(int r, double sigma);
 
     /*!
      * \brief ParseString
@@ -295,6 +647,15 @@ class ModeTrack {
     //
     double GetPeaks(std::string data_str, int mode_number, Method filter_method);
     //
+    double FindMode(std::vector<std::tuple<double,double,double>>& points, int mode_number, Method filter_method);
+    //
+    std::vector<double> FindMatchedPeaks(std::vector<std::tuple<double,double,double>>& points, Method filter_method);
+    //
+    double FindMaxPeak(std::vector<std::tuple<double,double,double>>& points);
+    //
+    std::vector<std::vector<double>> GetPeaksBatch(const std::vector<std::vector<double>>& power_spectra,
+            const std::vector<double>& frequencies, const std::vector<double>& lengths, Method filter_method);
+    //
     void DebugSaveInfo(std::vector<double> filtered_list,Method method);
     //
     bool CheckBounds(double frequency);
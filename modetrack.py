@@ -90,6 +90,296 @@ except AttributeError:
     _newclass = 0
 
 
+class SwigPyIterator(_object):
+    __swig_setmethods__ = {}
+    __setattr__ = lambda self, name, value: _swig_setattr(self, SwigPyIterator, name, value)
+    __swig_getmethods__ = {}
+    __getattr__ = lambda self, name: _swig_getattr(self, SwigPyIterator, name)
+
+    def __init__(self, *args, **kwargs):
+        raise AttributeError("No constructor defined - class is abstract")
+    __repr__ = _swig_repr
+    __swig_destroy__ = _modetrack.delete_SwigPyIterator
+    __del__ = lambda self: None
+
+    def value(self):
+        return _modetrack.SwigPyIterator_value(self)
+
+    def incr(self, n=1):
+        return _modetrack.SwigPyIterator_incr(self, n)
+
+    def decr(self, n=1):
+        return _modetrack.SwigPyIterator_decr(self, n)
+
+    def distance(self, x):
+        return _modetrack.SwigPyIterator_distance(self, x)
+
+    def equal(self, x):
+        return _modetrack.SwigPyIterator_equal(self, x)
+
+    def copy(self):
+        return _modetrack.SwigPyIterator_copy(self)
+
+    def next(self):
+        return _modetrack.SwigPyIterator_next(self)
+
+    def __next__(self):
+        return _modetrack.SwigPyIterator___next__(self)
+
+    def previous(self):
+        return _modetrack.SwigPyIterator_previous(self)
+
+    def advance(self, n):
+        return _modetrack.SwigPyIterator_advance(self, n)
+
+    def __eq__(self, x):
+        return _modetrack.SwigPyIterator___eq__(self, x)
+
+    def __ne__(self, x):
+        return _modetrack.SwigPyIterator___ne__(self, x)
+
+    def __iadd__(self, n):
+        return _modetrack.SwigPyIterator___iadd__(self, n)
+
+    def __isub__(self, n):
+        return _modetrack.SwigPyIterator___isub__(self, n)
+
+    def __add__(self, n):
+        return _modetrack.SwigPyIterator___add__(self, n)
+
+    def __sub__(self, *args):
+        return _modetrack.SwigPyIterator___sub__(self, *args)
+    def __iter__(self):
+        return self
+SwigPyIterator_swigregister = _modetrack.SwigPyIterator_swigregister
+SwigPyIterator_swigregister(SwigPyIterator)
+
+class DoubleVector(_object):
+    __swig_setmethods__ = {}
+    __setattr__ = lambda self, name, value: _swig_setattr(self, DoubleVector, name, value)
+    __swig_getmethods__ = {}
+    __getattr__ = lambda self, name: _swig_getattr(self, DoubleVector, name)
+    __repr__ = _swig_repr
+
+    def iterator(self):
+        return _modetrack.DoubleVector_iterator(self)
+    def __iter__(self):
+        return self.iterator()
+
+    def __nonzero__(self):
+        return _modetrack.DoubleVector___nonzero__(self)
+
+    def __bool__(self):
+        return _modetrack.DoubleVector___bool__(self)
+
+    def __len__(self):
+        return _modetrack.DoubleVector___len__(self)
+
+    def __getslice__(self, i, j):
+        return _modetrack.DoubleVector___getslice__(self, i, j)
+
+    def __setslice__(self, *args):
+        return _modetrack.DoubleVector___setslice__(self, *args)
+
+    def __delslice__(self, i, j):
+        return _modetrack.DoubleVector___delslice__(self, i, j)
+
+    def __delitem__(self, *args):
+        return _modetrack.DoubleVector___delitem__(self, *args)
+
+    def __getitem__(self, *args):
+        return _modetrack.DoubleVector___getitem__(self, *args)
+
+    def __setitem__(self, *args):
+        return _modetrack.DoubleVector___setitem__(self, *args)
+
+    def pop(self):
+        return _modetrack.DoubleVector_pop(self)
+
+    def append(self, x):
+        return _modetrack.DoubleVector_append(self, x)
+
+    def empty(self):
+        return _modetrack.DoubleVector_empty(self)
+
+    def size(self):
+        return _modetrack.DoubleVector_size(self)
+
+    def swap(self, v):
+        return _modetrack.DoubleVector_swap(self, v)
+
+    def begin(self):
+        return _modetrack.DoubleVector_begin(self)
+
+    def end(self):
+        return _modetrack.DoubleVector_end(self)
+
+    def rbegin(self):
+        return _modetrack.DoubleVector_rbegin(self)
+
+    def rend(self):
+        return _modetrack.DoubleVector_rend(self)
+
+    def clear(self):
+        return _modetrack.DoubleVector_clear(self)
+
+    def get_allocator(self):
+        return _modetrack.DoubleVector_get_allocator(self)
+
+    def pop_back(self):
+        return _modetrack.DoubleVector_pop_back(self)
+
+    def erase(self, *args):
+        return _modetrack.DoubleVector_erase(self, *args)
+
+    def __init__(self, *args):
+        this = _modetrack.new_DoubleVector(*args)
+        try:
+            self.this.append(this)
+        except Exception:
+            self.this = this
+
+    def push_back(self, x):
+        return _modetrack.DoubleVector_push_back(self, x)
+
+    def front(self):
+        return _modetrack.DoubleVector_front(self)
+
+    def back(self):
+        return _modetrack.DoubleVector_back(self)
+
+    def assign(self, n, x):
+        return _modetrack.DoubleVector_assign(self, n, x)
+
+    def resize(self, *args):
+        return _modetrack.DoubleVector_resize(self, *args)
+
+    def insert(self, *args):
+        return _modetrack.DoubleVector_insert(self, *args)
+
+    def reserve(self, n):
+        return _modetrack.DoubleVector_reserve(self, n)
+
+    def capacity(self):
+        return _modetrack.DoubleVector_capacity(self)
+    __swig_destroy__ = _modetrack.delete_DoubleVector
+    __del__ = lambda self: None
+DoubleVector_swigregister = _modetrack.DoubleVector_swigregister
+DoubleVector_swigregister(DoubleVector)
+
+class DoubleMatrix(_object):
+    __swig_setmethods__ = {}
+    __setattr__ = lambda self, name, value: _swig_setattr(self, DoubleMatrix, name, value)
+    __swig_getmethods__ = {}
+    __getattr__ = lambda self, name: _swig_getattr(self, DoubleMatrix, name)
+    __repr__ = _swig_repr
+
+    def iterator(self):
+        return _modetrack.DoubleMatrix_iterator(self)
+    def __iter__(self):
+        return self.iterator()
+
+    def __nonzero__(self):
+        return _modetrack.DoubleMatrix___nonzero__(self)
+
+    def __bool__(self):
+        return _modetrack.DoubleMatrix___bool__(self)
+
+    def __len__(self):
+        return _modetrack.DoubleMatrix___len__(self)
+
+    def __getslice__(self, i, j):
+        return _modetrack.DoubleMatrix___getslice__(self, i, j)
+
+    def __setslice__(self, *args):
+        return _modetrack.DoubleMatrix___setslice__(self, *args)
+
+    def __delslice__(self, i, j):
+        return _modetrack.DoubleMatrix___delslice__(self, i, j)
+
+    def __delitem__(self, *args):
+        return _modetrack.DoubleMatrix___delitem__(self, *args)
+
+    def __getitem__(self, *args):
+        return _modetrack.DoubleMatrix___getitem__(self, *args)
+
+    def __setitem__(self, *args):
+        return _modetrack.DoubleMatrix___setitem__(self, *args)
+
+    def pop(self):
+        return _modetrack.DoubleMatrix_pop(self)
+
+    def append(self, x):
+        return _modetrack.DoubleMatrix_append(self, x)
+
+    def empty(self):
+        return _modetrack.DoubleMatrix_empty(self)
+
+    def size(self):
+        return _modetrack.DoubleMatrix_size(self)
+
+    def swap(self, v):
+        return _modetrack.DoubleMatrix_swap(self, v)
+
+    def begin(self):
+        return _modetrack.DoubleMatrix_begin(self)
+
+    def end(self):
+        return _modetrack.DoubleMatrix_end(self)
+
+    def rbegin(self):
+        return _modetrack.DoubleMatrix_rbegin(self)
+
+    def rend(self):
+        return _modetrack.DoubleMatrix_rend(self)
+
+    def clear(self):
+        return _modetrack.DoubleMatrix_clear(self)
+
+    def get_allocator(self):
+        return _modetrack.DoubleMatrix_get_allocator(self)
+
+    def pop_back(self):
+        return _modetrack.DoubleMatrix_pop_back(self)
+
+    def erase(self, *args):
+        return _modetrack.DoubleMatrix_erase(self, *args)
+
+    def __init__(self, *args):
+        this = _modetrack.new_DoubleMatrix(*args)
+        try:
+            self.this.append(this)
+        except Exception:
+            self.this = this
+
+    def push_back(self, x):
+        return _modetrack.DoubleMatrix_push_back(self, x)
+
+    def front(self):
+        return _modetrack.DoubleMatrix_front(self)
+
+    def back(self):
+        return _modetrack.DoubleMatrix_back(self)
+
+    def assign(self, n, x):
+        return _modetrack.DoubleMatrix_assign(self, n, x)
+
+    def resize(self, *args):
+        return _modetrack.DoubleMatrix_resize(self, *args)
+
+    def insert(self, *args):
+        return _modetrack.DoubleMatrix_insert(self, *args)
+
+    def reserve(self, n):
+        return _modetrack.DoubleMatrix_reserve(self, n)
+
+    def capacity(self):
+        return _modetrack.DoubleMatrix_capacity(self)
+    __swig_destroy__ = _modetrack.delete_DoubleMatrix
+    __del__ = lambda self: None
+DoubleMatrix_swigregister = _modetrack.DoubleMatrix_swigregister
+DoubleMatrix_swigregister(DoubleMatrix)
+
 class ModeTrack(_object):
     __swig_setmethods__ = {}
     __setattr__ = lambda self, name, value: _swig_setattr(self, ModeTrack, name, value)
@@ -120,6 +410,60 @@ class ModeTrack(_object):
 
     def GetMaxPeak(self, data_str):
         return _modetrack.ModeTrack_GetMaxPeak(self, data_str)
+
+    def SetBackgroundArray(self, powers):
+        return _modetrack.ModeTrack_SetBackgroundArray(self, powers)
+
+    def GetPeaksGaussArray(self, frequencies, powers, length, mode_number):
+        return _modetrack.ModeTrack_GetPeaksGaussArray(self, frequencies, powers, length, mode_number)
+
+    def GetPeaksBiLatArray(self, frequencies, powers, length, mode_number):
+        return _modetrack.ModeTrack_GetPeaksBiLatArray(self, frequencies, powers, length, mode_number)
+
+    def GetMaxPeakArray(self, frequencies, powers):
+        return _modetrack.ModeTrack_GetMaxPeakArray(self, frequencies, powers)
+
+    def GetPeaksGaussBatch(self, power_spectra, frequencies, lengths):
+        return _modetrack.ModeTrack_GetPeaksGaussBatch(self, power_spectra, frequencies, lengths)
+
+    def GetPeaksBiLatBatch(self, power_spectra, frequencies, lengths):
+        return _modetrack.ModeTrack_GetPeaksBiLatBatch(self, power_spectra, frequencies, lengths)
+
+    def GetMatchedPeaksGaussArray(self, frequencies, powers, length):
+        return _modetrack.ModeTrack_GetMatchedPeaksGaussArray(self, frequencies, powers, length)
+
+    def GetMatchedPeaksBiLatArray(self, frequencies, powers, length):
+        return _modetrack.ModeTrack_GetMatchedPeaksBiLatArray(self, frequencies, powers, length)
+
+    def UpdateModePaths(self, length, peaks):
+        return _modetrack.ModeTrack_UpdateModePaths(self, length, peaks)
+
+    def BilateralFilterArray(self, powers, filtered, sigma_s, sigma_r):
+        return _modetrack.ModeTrack_BilateralFilterArray(self, powers, filtered, sigma_s, sigma_r)
+
+    def DerivativeArray(self, powers, derivative):
+        return _modetrack.ModeTrack_DerivativeArray(self, powers, derivative)
+
+    def SetGaussKernel(self, radius, sigma):
+        return _modetrack.ModeTrack_SetGaussKernel(self, radius, sigma)
+
+    def GaussBlurArray(self, powers, filtered, radius, sigma):
+        return _modetrack.ModeTrack_GaussBlurArray(self, powers, filtered, radius, sigma)
+
+    def PredictFrequency(self, mode_number, length):
+        return _modetrack.ModeTrack_PredictFrequency(self, mode_number, length)
+
+    def PredictUncertainty(self, mode_number, length):
+        return _modetrack.ModeTrack_PredictUncertainty(self, mode_number, length)
+
+    def SearchRadius(self, mode_number, length):
+        return _modetrack.ModeTrack_SearchRadius(self, mode_number, length)
+
+    def AddObservation(self, mode_number, length, frequency):
+        return _modetrack.ModeTrack_AddObservation(self, mode_number, length, frequency)
+
+    def ResetModePaths(self):
+        return _modetrack.ModeTrack_ResetModePaths(self)
 ModeTrack_swigregister = _modetrack.ModeTrack_swigregister
 ModeTrack_swigregister(ModeTrack)
 
@@ -1,13 +1,88 @@
-%module modetrack
+// threads="1" releases the GIL around each wrapped call (see %thread below), so Python
+// threads such as the Arduino sampler keep running while peaks are found. A ModeTrack
+// instance must still only be used by one thread at a time.
+%module(threads="1") modetrack
 
 %{
 #include "modetrack.h"
 %}
 
+// the container and iterator support code builds Python objects, it must keep the GIL
+%nothread;
+
 %include "std_string.i"
+%include "std_vector.i"
+%include "exception.i"
+
+%template(DoubleVector) std::vector<double>;
+%template(DoubleMatrix) std::vector<std::vector<double> >;
+%thread;
 
 %apply const std::string& {std::string* c_str};
 
+// Accept any object exposing a C-contiguous buffer of float64 values (eg a NumPy
+// array) for a (const double*, int) argument pair. The buffer is read in place.
+%typemap(arginit) (const double* IN_ARRAY1, int DIM1) {
+    view$argnum.obj = NULL;
+}
+%typemap(in) (const double* IN_ARRAY1, int DIM1) (Py_buffer view) {
+    if (PyObject_GetBuffer($input, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) != 0) {
+        SWIG_fail;
+    }
+    if (view.itemsize != sizeof(double) || view.format == NULL || (strcmp(view.format, "d") != 0 && strcmp(view.format, "<d") != 0 && strcmp(view.format, "=d") != 0)) {
+        PyErr_SetString(PyExc_TypeError, "expected a contiguous float64 array");
+        SWIG_fail;
+    }
+    $1 = (double*) view.buf;
+    $2 = (int) (view.len / sizeof(double));
+}
+%typemap(freearg) (const double* IN_ARRAY1, int DIM1) {
+    if (view$argnum.obj != NULL) {
+        PyBuffer_Release(&view$argnum);
+    }
+}
+
+// Same as above for an output argument, the buffer must also be writable and is
+// filled in place.
+%typemap(arginit) (double* INPLACE_ARRAY1, int DIM1) {
+    view$argnum.obj = NULL;
+}
+%typemap(in) (double* INPLACE_ARRAY1, int DIM1) (Py_buffer view) {
+    if (PyObject_GetBuffer($input, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE) != 0) {
+        SWIG_fail;
+    }
+    if (view.itemsize != sizeof(double) || view.format == NULL || (strcmp(view.format, "d") != 0 && strcmp(view.format, "<d") != 0 && strcmp(view.format, "=d") != 0)) {
+        PyErr_SetString(PyExc_TypeError, "expected a writable contiguous float64 array");
+        SWIG_fail;
+    }
+    $1 = (double*) view.buf;
+    $2 = (int) (view.len / sizeof(double));
+}
+%typemap(freearg) (double* INPLACE_ARRAY1, int DIM1) {
+    if (view$argnum.obj != NULL) {
+        PyBuffer_Release(&view$argnum);
+    }
+}
+
+%apply (const double* IN_ARRAY1, int DIM1) {
+    (const double* frequencies, int num_frequencies),
+    (const double* powers, int num_powers)
+};
+
+%apply (double* INPLACE_ARRAY1, int DIM1) {
+    (double* filtered, int num_filtered),
+    (double* derivative, int num_derivative)
+};
+
+// turn C++ exceptions (eg mismatched batch inputs) into Python exceptions
+%exception {
+    try {
+        $action
+    } catch (const std::exception& e) {
+        SWIG_exception(SWIG_ValueError, e.what());
+    }
+}
+
 class ModeTrack
 {
 public:
@@ -18,4 +93,31 @@ public:
     double GetPeaksGauss(std::string data_str,int mode_number);
     double GetPeaksBiLat(std::string data_str,int mode_number);
     double GetMaxPeak(std::string data_str);
+    void SetBackgroundArray(const double* powers, int num_powers);
+    double GetPeaksGaussArray(const double* frequencies, int num_frequencies,
+                              const double* powers, int num_powers, double length, int mode_number);
+    double GetPeaksBiLatArray(const double* frequencies, int num_frequencies,
+                              const double* powers, int num_powers, double length, int mode_number);
+    double GetMaxPeakArray(const double* frequencies, int num_frequencies,
+                           const double* powers, int num_powers);
+    std::vector<std::vector<double> > GetPeaksGaussBatch(const std::vector<std::vector<double> >& power_spectra,
+            const std::vector<double>& frequencies, const std::vector<double>& lengths);
+    std::vector<std::vector<double> > GetPeaksBiLatBatch(const std::vector<std::vector<double> >& power_spectra,
+            const std::vector<double>& frequencies, const std::vector<double>& lengths);
+    std::vector<double> GetMatchedPeaksGaussArray(const double* frequencies, int num_frequencies,
+                                                  const double* powers, int num_powers, double length);
+    std::vector<double> GetMatchedPeaksBiLatArray(const double* frequencies, int num_frequencies,
+                                                  const double* powers, int num_powers, double length);
+    void UpdateModePaths(double length, const std::vector<double>& peaks);
+    void BilateralFilterArray(const double* powers, int num_powers, double* filtered, int num_filtered,
+                              double sigma_s, double sigma_r);
+    void DerivativeArray(const double* powers, int num_powers, double* derivative, int num_derivative);
+    void SetGaussKernel(int radius, double sigma);
+    void GaussBlurArray(const double* powers, int num_powers, double* filtered, int num_filtered,
+                        int radius, double sigma);
+    double PredictFrequency(int mode_number, double length);
+    double PredictUncertainty(int mode_number, double length);
+    double SearchRadius(int mode_number, double length);
+    bool AddObservation(int mode_number, double length, double frequency);
+    void ResetModePaths();
 };
@@ -5,6 +5,62 @@ import data_processors as procs
 import color_printer as cp
 
 import time
+import threading
+import contextlib
+
+class StageTimer:
+    """
+    Record how long each stage of an iteration takes, for stages run by the main
+    acquisition loop as well as those handed off to a background thread.
+
+    Stages run by the main loop happen one after another, so together they form the
+    critical path of an iteration. Background stages overlap with the main loop and only
+    add to an iteration's duration when the main loop has to wait for them.
+
+    Example usage:
+        timer = StageTimer()
+        with timer.stage(iteration, "reflection"):
+            ...
+        timer.report(iteration)
+    """
+
+    def __init__(self):
+        # format is iteration:[(stage name, background, duration)]
+        self.stages = {}
+        self.lock = threading.Lock()
+
+        self.print_blue = cp.ColorPrinter("Blue")
+
+    @contextlib.contextmanager
+    def stage(self, iteration, name, background=False):
+        start = time.time()
+        try:
+            yield
+        finally:
+            duration = time.time() - start
+            with self.lock:
+                self.stages.setdefault(iteration, []).append((name, background, duration))
+
+    def report(self, iteration):
+        """
+        Print the timings recorded for 'iteration' and forget them.
+        """
+        with self.lock:
+            stages = self.stages.pop(iteration, [])
+
+        if not stages:
+            return
+
+        main_total = sum(duration for _, background, duration in stages if not background)
+        background_total = sum(duration for _, background, duration in stages if background)
+
+        out_str = "Stage timings for iteration " + str(iteration) + ":"
+        for name, background, duration in stages:
+            out_str += "\n  " + name + (" (background)" if background else "") + ": " + str(round(duration, 3)) + " s"
+        out_str += "\nCritical path: " + str(round(main_total, 3)) + " s"
+        out_str += ", overlapped background work: " + str(round(background_total, 3)) + " s"
+
+        self.print_blue(out_str)
 
 class ProgramCore(config_classes.ConfigTypes):
 
@@ -22,19 +78,38 @@ class ProgramCore(config_classes.ConfigTypes):
         nwa_points = self.data_dict['nwa_points']
         nwa_span = self.data_dict['nwa_span']
         nwa_power = self.data_dict['nwa_power']
+        # optional, 'ascii' (default) or 'binary'
+        nwa_format = self.data_dict.get('nwa_format', 'ascii')
+        # optional, longest time to wait for the analyzer during any phase of a measurement
+        nwa_wait_ceiling = self.data_dict.get('nwa_wait_ceiling')
+        # required for binary transfers, dB per count of the analyzer's binary output
+        nwa_binary_db_per_count = self.data_dict.get('nwa_binary_db_per_count')
+        if nwa_binary_db_per_count is not None:
+            nwa_binary_db_per_count = float(nwa_binary_db_per_count)
 
         sg_sock = self.sock_dict['sg']
         switch_sock = self.sock_dict['switch']
         ardu_sock = self.sock_dict['ardu']
         step_addr = self.addr_dict['step']
 
-        self.nwa_comm = sc.NetworkAnalyzerComm(nwa_sock, nwa_points, nwa_span, nwa_power)
+        self.nwa_comm = sc.NetworkAnalyzerComm(nwa_sock, nwa_points, nwa_span, nwa_power, nwa_format, nwa_wait_ceiling,
+                                               nwa_binary_db_per_count)
         self.sg_comm = sc.SignalGeneratorComm(sg_sock)
         self.switch_comm = sc.SwitchComm(switch_sock)
         self.ardu_comm = sc.ArduComm(ardu_sock)
+        # optional, poll the cavity length in the background every 'ardu_sample_interval'
+        # seconds. Off unless set, every reading then goes to the Arduino
+        sample_interval = float(self.data_dict.get('ardu_sample_interval', 0))
+        if sample_interval > 0:
+            self.ardu_comm.start_sampler(sample_interval)
         self.step_comm = sc.StepperMotorComm(step_addr)
 
         self.convertor = procs.Convertor()
+        # files are written by a background thread, optional 'write_behind_depth',
+        # 'fsync_policy' and 'fsync_interval' config entries, see WriteBehindQueue
+        self.writer = procs.WriteBehindQueue(int(self.data_dict.get('write_behind_depth', 16)),
+                                             self.data_dict.get('fsync_policy', 'interval'),
+                                             float(self.data_dict.get('fsync_interval', 1.0)))
 
         self.nominal_centers = self.data_dict['nominal_centers']
         self.num_of_iters = int(self.data_dict['num_of_iters'])
@@ -46,6 +121,18 @@ class ProgramCore(config_classes.ConfigTypes):
 
         self.iteration = 0
 
+    def close_all(self):
+        # close_all can be called by ConfigTypes before the stepper has been set up
+        if hasattr(self, 'step_comm'):
+            self.step_comm.close()
+        if hasattr(self, 'ardu_comm'):
+            self.ardu_comm.stop_sampler()
+        # make sure queued data reaches the disk, the writer keeps running so
+        # that anything saved during cleanup is written too
+        if hasattr(self, 'writer'):
+            self.writer.flush()
+        super(ProgramCore, self).close_all()
+
     def retract_cavity(self):
 
         tune_length = float(self.data_dict['len_of_tune'])
@@ -54,10 +141,12 @@ class ProgramCore(config_classes.ConfigTypes):
     def __move_to_start_cavity_length(self):
         current_length = float(self.ardu_comm.get_cavity_length())
         self.step_comm.set_to_initial_length(self.start_length, current_length)
+        self.ardu_comm.mark_stale()
 
     def __move_to_initial_cavity_length(self):
         current_length = float(self.ardu_comm.get_cavity_length())
         self.step_comm.set_to_initial_length(self.initial_length, current_length)
+        self.ardu_comm.mark_stale()
 
     def rapid_traverse(self):
         self.__move_to_initial_cavity_length()
@@ -73,24 +162,76 @@ class ProgramCore(config_classes.ConfigTypes):
         self.__move_to_start_cavity_length()
 
 
-    def get_data_nwa(self):
+    def get_data_nwa(self, centers=None):
+        """
+        Sweep the network analyzer over several frequency windows.
+
+        Args:
+            centers: centers of the windows to sweep, defaults to all of nominal_centers
+        """
+        if centers is None:
+            centers = self.nominal_centers
+
         total_data_list = []
-        total_data_list.extend(self.nwa_comm.collect_data(self.nominal_centers))
+        total_data_list.extend(self.nwa_comm.collect_data(centers))
 
         return total_data_list
 
-    def format_points(self, raw_data):
+    def windows_near(self, frequency, radius):
+        """
+        Find the frequency windows in nominal_centers that overlap frequency +/- radius.
+
+        Args:
+            frequency: frequency to search around (MHz)
+            radius: distance from frequency that must be covered (MHz)
+
+        Returns:
+            List of window centers, adjacent to one another in nominal_centers,
+            empty if no window overlaps
+        """
+        half_span = self.nwa_span / 2
+
+        return [center for center in self.nominal_centers
+                if float(center) - half_span < frequency + radius
+                and float(center) + half_span > frequency - radius]
+
+    def format_points(self, raw_data, cavity_length=None, centers=None):
+        """
+        Args:
+            raw_data: data returned by get_data_nwa()
+            cavity_length: cavity length to record, read from the Arduino if not given
+            centers: centers of the windows that were swept, defaults to all of nominal_centers
+
+        Returns:
+            list of [frequency, cavity length, power] triples, see Convertor.make_plot_points()
+        """
+
+        return self.__format(self.convertor.make_plot_points, raw_data, cavity_length, centers)
+
+    def format_arrays(self, raw_data, cavity_length=None, centers=None):
+        """
+        Same as format_points() but returning columns as NumPy arrays,
+        see Convertor.make_plot_arrays()
+        """
+
+        return self.__format(self.convertor.make_plot_arrays, raw_data, cavity_length, centers)
+
+    def __format(self, make_points, raw_data, cavity_length, centers):
+
+        if centers is None:
+            centers = self.nominal_centers
 
         nwa_span = float(self.data_dict['nwa_span'])
-        last_center = float(self.nominal_centers[-1])
-        first_center = float(self.nominal_centers[0])
+        last_center = float(centers[-1])
+        first_center = float(centers[0])
 
         max_frequency = last_center + nwa_span / 2
         min_frequency = first_center - nwa_span / 2
 
-        cavity_length = self.ardu_comm.get_cavity_length()
+        if cavity_length is None:
+            cavity_length = self.ardu_comm.get_cavity_length()
 
-        return self.convertor.make_plot_points(raw_data, cavity_length, min_frequency, max_frequency)
+        return make_points(raw_data, cavity_length, min_frequency, max_frequency)
 
     def print_status_info(self):
         cavity_length = self.ardu_comm.get_cavity_length()
@@ -99,14 +240,41 @@ class ProgramCore(config_classes.ConfigTypes):
         time_stamp = time.strftime("%H:%M:%S")
         self.print_blue("Current time: " + str(time_stamp))
 
-    def next_iteration(self):
+        metrics = self.writer.metrics()
+        out_str = "Write queue depth: " + str(metrics['depth']) + " (max " + str(metrics['max_depth']) + ")"
+        out_str += ", mean write latency: " + str(round(1e3 * metrics['mean_latency'], 1)) + " ms"
+        out_str += " (max " + str(round(1e3 * metrics['max_latency'], 1)) + " ms)"
+        if metrics['backpressure_waits'] > 0:
+            out_str += ", blocked " + str(metrics['backpressure_waits']) + " times for "
+            out_str += str(round(metrics['backpressure_time'], 2)) + " s"
+        self.print_blue(out_str)
+
+    def next_iteration(self, wait=True):
+        """
+        Move the cavity to the length for the next iteration.
+
+        Args:
+            wait: if false return as soon as the move has started, wait_for_move()
+            must then be called before taking any more measurements
+        """
 
         len_of_tune = self.data_dict['len_of_tune']
         revs = float(self.data_dict['revs_per_iter'])
 
+        self.nwa_comm.report_command_counts()
+
         self.iteration += 1
 
         iters = self.iteration
         num_of_iters = self.num_of_iters
 
-        self.step_comm.walk_loop(len_of_tune, revs, iters, num_of_iters)
+        self.step_comm.walk_loop(len_of_tune, revs, iters, num_of_iters, wait)
+        if wait:
+            self.ardu_comm.mark_stale()
+
+    def wait_for_move(self):
+        """
+        Wait for a move started with next_iteration(wait=False) to finish.
+        """
+        self.step_comm.wait_for_move()
+        self.ardu_comm.mark_stale()
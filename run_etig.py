@@ -9,6 +9,7 @@ parser = argparse.ArgumentParser(description='Control code for Electric Tiger.')
 parser.add_argument('-M', '--mode_map', help='Build a mode map (i.e. map of transmitted power.)', action='store_true')
 parser.add_argument('-R', '--reflection_map', help='Build a map of reflected power.', action='store_true')
 parser.add_argument('-T', '--modetrack', help='Main program for collecting data.', action='store_true')
+parser.add_argument('-P', '--pipelined_modetrack', help='Main program for collecting data, overlapping cavity moves with analysis.', action='store_true')
 args = parser.parse_args()
 
 
@@ -24,6 +25,8 @@ def main():
 		meta_tig = map_builders.ReflectionMapProgram(argv)
 	elif(args.modetrack):
 		meta_tig = mode_tracker.ModeTrackProgram(argv)
+	elif(args.pipelined_modetrack):
+		meta_tig = mode_tracker.PipelinedModeTrackProgram(argv)
 		
 	meta_tig.program()
 
@@ -9,10 +9,235 @@ modern incarnation, 'socket_connect_2'
 import socket
 import sys
 import select
+import threading
+import collections
 import time  # sleep
-import datetime as dt
+import numpy as np
 import color_printer as cp
 
+class TerminatorFramer:
+    """
+    Framing rule for responses that end with a terminator sequence, e.g.
+    a line feed, or the character the Prologix controller appends on EOI
+    when '++eot_enable 1' and '++eot_char' are set.
+    
+    Example usage:
+        framer = TerminatorFramer(b'\n')
+        framer(b'7.5\r\n7.5') -> 5
+        framer(b'7.5') -> 0
+        
+    Framing rules are called with the receive buffer and the number of valid
+    bytes in it, so that large responses can be framed without copying.
+    """
+    
+    def __init__(self, terminator=b'\n'):
+        """
+        Args:
+            terminator: byte sequence that marks the end of a response
+        """
+        self.terminator = terminator
+        
+    def __call__(self, data, length=None, start=0):
+        """
+        Args:
+            data: bytes (or bytearray) received so far
+            length: number of valid bytes in data, defaults to len(data)
+            start: offset of the newest chunk of data, earlier bytes have
+            already been searched for the terminator
+            
+        Returns:
+            Length of the complete response (terminator included), or 0 if
+            the terminator has not been received yet
+        """
+        if length is None:
+            length = len(data)
+        # back up in case the terminator was split across two chunks
+        start = max(0, start - len(self.terminator) + 1)
+        
+        idx = data.find(self.terminator, start, length)
+        if idx < 0:
+            return 0
+        return idx + len(self.terminator)
+    
+class BlockFramer:
+    """
+    Framing rule for IEEE-488.2 definite-length arbitrary blocks,
+    i.e. '#<n><length><length bytes of data>'.
+    
+    Responses that do not begin with '#' (plain ASCII responses such as
+    the reply to '*OPC?') as well as indefinite-length blocks ('#0...')
+    are framed by a terminator instead.
+    """
+    
+    def __init__(self, terminator=b'\n'):
+        """
+        Args:
+            terminator: byte sequence that marks the end of non-block responses
+        """
+        self.terminator_framer = TerminatorFramer(terminator)
+        
+    def __call__(self, data, length=None, start=0):
+        """
+        Args:
+            data: bytes (or bytearray) received so far
+            length: number of valid bytes in data, defaults to len(data)
+            start: offset of the newest chunk of data
+            
+        Returns:
+            Length of the complete response, or 0 if more data is needed.
+            For definite-length blocks a trailing terminator is not included.
+        """
+        if length is None:
+            length = len(data)
+        
+        if length == 0:
+            return 0
+        
+        if data[0:1] != b'#':
+            return self.terminator_framer(data, length, start)
+        
+        # need the '#' and the digit count before anything else can be decided
+        if length < 2:
+            return 0
+        
+        num_digits = int(data[1:2])
+        if num_digits == 0:
+            return self.terminator_framer(data, length, start)
+        
+        header_length = 2 + num_digits
+        if length < header_length:
+            return 0
+        
+        frame_length = header_length + int(data[2:header_length])
+        if length < frame_length:
+            return 0
+        return frame_length
+    
+class LengthFramer:
+    """
+    Framing rule for responses of a known, fixed length, e.g. binary data
+    read from the Prologix controller with '++read eoi'.
+    """
+    
+    def __init__(self, num_bytes):
+        """
+        Args:
+            num_bytes: length of a complete response in bytes
+        """
+        self.num_bytes = num_bytes
+        
+    def __call__(self, data, length=None, start=0):
+        """
+        Args:
+            data: bytes (or bytearray) received so far
+            length: number of valid bytes in data, defaults to len(data)
+            start: offset of the newest chunk of data (unused)
+            
+        Returns:
+            Length of the complete response, or 0 if more data is needed
+        """
+        if length is None:
+            length = len(data)
+            
+        if length < self.num_bytes:
+            return 0
+        return self.num_bytes
+    
+class ReceiveBuffer:
+    """
+    Reusable receive buffer for socket reads.
+    
+    Data is read straight into a preallocated bytearray with recv_into(),
+    avoiding both the quadratic cost of repeatedly concatenating strings and
+    decoding every chunk. When the buffer fills up its capacity is doubled, so
+    the buffer quickly settles at the size of the largest response seen.
+    
+    Bytes received after the end of a frame (see data()) are kept for the next
+    read, see next_frame().
+    """
+    
+    def __init__(self, size=65536, min_free=4096):
+        """
+        Args:
+            size: initial capacity of the buffer in bytes
+            min_free: the buffer is grown whenever less than this many bytes
+            of free space remain before a read
+        """
+        self.buffer = bytearray(size)
+        self.view = memoryview(self.buffer)
+        self.min_free = min_free
+        self.length = 0
+        # length of the frame last returned by data()
+        self.frame_length = 0
+        
+    def reset(self):
+        """
+        Discard the current contents, the allocated memory is kept for reuse.
+        """
+        self.length = 0
+        self.frame_length = 0
+        
+    def next_frame(self):
+        """
+        Discard the frame last returned by data(), moving any bytes received after
+        it to the start of the buffer.
+        
+        Returns:
+            Number of bytes kept
+        """
+        remaining = self.length - self.frame_length
+        self.buffer[:remaining] = self.buffer[self.frame_length:self.length]
+        
+        self.length = remaining
+        self.frame_length = 0
+        
+        return remaining
+    
+    def recv_into(self, sock):
+        """
+        Receive as many bytes as are available (and fit) from a socket,
+        appending them to the current contents.
+        
+        Args:
+            sock: Socket to read from
+            
+        Returns:
+            Number of bytes received, 0 if the remote end closed the connection
+        """
+        if len(self.buffer) - self.length < self.min_free:
+            self.__grow()
+            
+        num_bytes = sock.recv_into(self.view[self.length:])
+        self.length += num_bytes
+        
+        return num_bytes
+    
+    def data(self, length=None):
+        """
+        Get a view of the received bytes without copying them.
+        
+        Note that the view is only valid until the next read into this
+        buffer, callers that need to keep the data should copy it with bytes().
+        
+        Args:
+            length: number of bytes to include, defaults to everything received
+            
+        Returns:
+            memoryview of the received bytes
+        """
+        if length is None:
+            length = self.length
+        self.frame_length = length
+        return self.view[:length]
+    
+    def __grow(self):
+        
+        new_buffer = bytearray(2 * len(self.buffer))
+        new_buffer[:self.length] = self.view[:self.length]
+        
+        self.buffer = new_buffer
+        self.view = memoryview(self.buffer)
+
 class SocketComm:
     """
     Object that handles basic network socket operations.
@@ -21,12 +246,20 @@ class SocketComm:
     def __init__(self):
         """
         Initialize color printers.
+        
+        Instrument classes should set self.framer to a framing rule (see
+        TerminatorFramer and BlockFramer) so that reads return as soon as a
+        complete response has arrived. If no framing rule is set reads wait
+        until the socket has been quiet for the requested timeout.
         """
         
         self.print_green = cp.ColorPrinter("Green")
         self.print_purple = cp.ColorPrinter("Purple")
         self.print_yellow = cp.ColorPrinter("Yellow")
         self.print_red = cp.ColorPrinter("Red")
+        
+        self.framer = None
+        self.recv_buffer = ReceiveBuffer()
 
     def _socket_connect(self, host, port):
         """
@@ -118,25 +351,94 @@ class SocketComm:
 
 
     # read data and store in a string
-    def _read_data(self, sock, printlen=False, timeout=2):
+    def _read_data(self, sock, printlen=False, timeout=2, framer=None, errors='strict'):
         """
         Read a string from a socket object.
         
+        If a framing rule is available (either passed in as 'framer' or set
+        as self.framer by the instrument class) reading stops as soon as a
+        complete response has been received. Otherwise reading continues until
+        the socket has been quiet for 'timeout' seconds.
+        
         Args:
             sock: Socket to read from
             printlen: if true show the number of bytes read
             timeout: max time to wait for the socket to respond
+            framer: optional framing rule, overrides self.framer
+            errors: handling of bytes that are not valid UTF-8, see bytes.decode()
             
         Returns:
             data: The data read from the socket as a string
         """
-        data = ''
-        while(select.select([sock], [], [], timeout) != ([], [], [])):
-            buff = sock.recv(2048)
-            data += buff.decode()
+        data = str(self._read_bytes(sock, timeout, framer), 'utf-8', errors)
         if printlen: print ("received", len(data), "bytes")
         return data
     
+    def _read_bytes(self, sock, timeout=2, framer=None):
+        """
+        Read a response from a socket object as raw bytes.
+        
+        If a framing rule is available (either passed in as 'framer' or set
+        as self.framer by the instrument class) reading stops as soon as a
+        complete response has been received, 'timeout' is then only an upper
+        bound on how long to wait for the next chunk of data. Otherwise reading
+        continues until the socket has been quiet for 'timeout' seconds.
+        
+        Any bytes received after the end of the frame in the same chunk are kept,
+        and returned first by the next read. _flush_input() discards them along
+        with anything else waiting on the socket.
+        
+        Args:
+            sock: Socket to read from
+            timeout: max time to wait for the socket to respond
+            framer: optional framing rule, overrides self.framer
+            
+        Returns:
+            data: memoryview of the response, only valid until the next read
+            on this object (see ReceiveBuffer.data())
+        """
+        if framer is None:
+            framer = self.framer
+            
+        recv_buffer = self.recv_buffer
+        frame_length = 0
+        
+        # the end of the last frame may have arrived with a complete frame after it
+        if recv_buffer.next_frame() and framer is not None:
+            frame_length = framer(recv_buffer.buffer, recv_buffer.length, 0)
+            if frame_length:
+                return recv_buffer.data(frame_length)
+        
+        while(select.select([sock], [], [], timeout) != ([], [], [])):
+            start = recv_buffer.length
+            if not recv_buffer.recv_into(sock):
+                # remote end closed the connection
+                break
+            if framer is not None:
+                frame_length = framer(recv_buffer.buffer, recv_buffer.length, start)
+                if frame_length:
+                    break
+            
+        if frame_length:
+            return recv_buffer.data(frame_length)
+        return recv_buffer.data()
+    
+    def _flush_input(self, sock):
+        """
+        Discard any bytes already waiting on a socket.
+        
+        Used before sending a query so that a late or 'doubled' response
+        to a previous query is not mistaken for the new response.
+        
+        Args:
+            sock: Socket to flush
+        """
+        self.recv_buffer.reset()
+        
+        while(select.select([sock], [], [], 0) != ([], [], [])):
+            if not sock.recv(2048):
+                break
+    
     def _read_data_safe(self, sock, time_out = 2):
         """
         Read a string from a socket. If an emptry string (or no string)
@@ -164,9 +466,23 @@ class SocketComm:
 class NetworkAnalyzerComm (SocketComm):
     """
     Object to communicate with the HP8757 C Network Analyzer.
+    
+    Data can be transferred either as ASCII text (the default), or in the analyzer's
+    binary format where every point is sent as a 16 bit big-endian integer. Binary
+    transfers are roughly four times shorter and are decoded directly into NumPy arrays.
+    
+    Between the phases of a measurement the analyzer waits a fixed time, which can
+    be shortened with 'wait_ceiling'. The time spent waiting in each phase is printed
+    after every sweep.
     """
+    
+    # Instrument settings that persist until changed, identified by the first two
+    # characters of the command. Re-sending an unchanged setting is skipped.
+    # Actions (TS1, C1OD, ++read, ...) are always sent.
+    SHADOWED_SETTINGS = ('PT', 'CF', 'DF', 'ST', 'RF', 'PL', 'SW', 'FD', 'SP')
 
-    def __init__(self, nwa_sock, nwa_points, nwa_span, nwa_power):
+    def __init__(self, nwa_sock, nwa_points, nwa_span, nwa_power, nwa_format='ascii', wait_ceiling=None,
+                 binary_db_per_count=None):
         """
         Handle all set-up tasks necessary so the Analyzer can receive commands and output data.
         
@@ -178,10 +494,55 @@ class NetworkAnalyzerComm (SocketComm):
             nwa_points: Number of data points the NA will output when collecting a -single- set of data
             nwa_span: How wide the frequency window is for a -single- set of data, in MHz
             nwa_power: Power to set the RF source to, in dBm
+            nwa_format: Data transfer format, either 'ascii' or 'binary'
+            wait_ceiling: Time (in seconds) to wait during any phase of a measurement.
+            By default each phase is given the fixed delay that was originally used.
+            binary_db_per_count: Resolution of one count of binary (FD1) output in dB,
+            from the programming guide of the analyzer in use. Required for binary transfers.
         """
         super(NetworkAnalyzerComm, self).__init__()
         
         self.nwa_sock = nwa_sock
+        self.binary_data = (nwa_format == 'binary')
+        
+        if self.binary_data and binary_db_per_count is None:
+            raise ValueError("Binary transfers need the resolution of the binary output (dB per count)")
+        self.binary_db_per_count = binary_db_per_count
+        
+        if self.binary_data:
+            # binary data may contain any byte value, so read until EOI
+            # and frame on the number of points requested
+            self.read_cmd = "++read eoi"
+            self.framer = LengthFramer(2 * int(nwa_points))
+            # binary output is roughly four times shorter than ASCII
+            self.output_delay = 0.25
+        else:
+            # data is requested with '++read 10', so the Prologix controller
+            # stops reading (and the response ends) at the first line feed
+            self.read_cmd = "++read 10"
+            self.framer = TerminatorFramer(b'\n')
+            # data output takes ~0.8 seconds in ASCII mode
+            self.output_delay = 1
+            
+        # time to wait for each phase, format is phase:seconds
+        self.wait_ceilings = {'settle': 1, 'window': 2, 'sweep': 3, 'output': self.output_delay}
+        if wait_ceiling is not None:
+            self.wait_ceilings = dict.fromkeys(self.wait_ceilings, float(wait_ceiling))
+            
+        # time actually spent waiting during the most recent measurement,
+        # format is phase:seconds
+        self.wait_times = {}
+        
+        # last known settings for each instrument behind the Prologix controller,
+        # format is GPIB address:{setting:command}
+        self.shadow_state = {}
+        # GPIB address the Prologix controller is currently set to, None if unknown
+        self.gpib_addr = None
+        # commands waiting to be sent to the current GPIB address
+        self.pending_commands = []
+        
+        self.commands_sent = 0
+        self.commands_skipped = 0
 
         self.__set_GPIB()
         self.__set_network_analyzer(nwa_points)
@@ -196,13 +557,14 @@ class NetworkAnalyzerComm (SocketComm):
         self.print_purple("Setting GPIB converter")
         
         # Set to network analyzer GPIB address
-        self._send_command(self.nwa_sock, "++addr 16")
+        self.__gpib_command("++addr 16")
         # Disable Auto-Read
-        self._send_command(self.nwa_sock, "++auto 0")
+        self.__gpib_command("++auto 0")
         # Enable EOI assertion at end of commands
-        self._send_command(self.nwa_sock, "++eoi 1")
+        self.__gpib_command("++eoi 1")
         # Append CR+LF to instrument commands
-        self._send_command(self.nwa_sock, "++eos 0")
+        self.__gpib_command("++eos 0")
+        self.__flush_commands()
         
         self.print_green("GPIB converter set.")
 
@@ -219,21 +581,26 @@ class NetworkAnalyzerComm (SocketComm):
 
         self.print_purple("Setting network analyzer")
         # set active channel to 1
-        self._send_command(self.nwa_sock, "C1")
+        self.__gpib_command("C1")
         # turn cursor off
-        self._send_command(self.nwa_sock, "CU0")
+        self.__gpib_command("CU0")
         # set cursor delta off
-        self._send_command(self.nwa_sock, "CD0")
-        # set data format to ascii
-        self._send_command(self.nwa_sock, "FD0")
+        self.__gpib_command("CD0")
+        if self.binary_data:
+            # set data format to binary
+            self.__gpib_command("FD1")
+        else:
+            # set data format to ascii
+            self.__gpib_command("FD0")
         # set number of points to nwa_points
-        self._send_command(self.nwa_sock, "SP" + str(nwa_points))
+        self.__gpib_command("SP" + str(nwa_points))
         
         if do_avg == True:
             # turn on averaging if requested
-            self._send_command(self.nwa_sock, "AF16")
+            self.__gpib_command("AF16")
         
         # self._send_command(nwa_sock, "++read 10")
+        self.__flush_commands()
         
         self.print_green("Network analyzer set")
 
@@ -250,23 +617,25 @@ class NetworkAnalyzerComm (SocketComm):
         
         self.print_purple("setting up RF source")
         # set passthrough mode to RF source
-        self._send_command(self.nwa_sock, "PT19")
+        self.__gpib_command("PT19")
         # change GPIB address to passthrough
-        self._send_command(self.nwa_sock, "++addr 17")
+        self.__gpib_command("++addr 17")
         # RF output on
         print ("turning on RF")
-        self._send_command(self.nwa_sock, "RF1")
+        self.__gpib_command("RF1")
         # set center frequency
         print ("setting frequency span " + str(nwa_span) + " MHz")
         # set frequency span
-        self._send_command(self.nwa_sock, "DF " + str(nwa_span) + "MZ")
+        self.__gpib_command("DF " + str(nwa_span) + "MZ")
         # set power level
-        self._send_command(self.nwa_sock, "PL " + str(nwa_power) + "DB")
+        self.__gpib_command("PL " + str(nwa_power) + "DB")
         
         # provide short delay so network analyzer can set-up
+        self.__flush_commands()
         time.sleep(1)
         # return to network analyzer
-        self._send_command(self.nwa_sock, "++addr 16")
+        self.__gpib_command("++addr 16")
+        self.__flush_commands()
 
     def collect_data(self, freq_centers):
         """
@@ -278,7 +647,8 @@ class NetworkAnalyzerComm (SocketComm):
             Note that the frequency span used is set by the constructor parameter 'freq_span'
             
         Returns:
-            Comma seperated power spectrum, returned as a single string
+            List of comma seperated power spectra, one string per frequency window,
+            or one NumPy array (in dBm) per window for binary transfers
         """
         
         tmp_list = []
@@ -286,41 +656,41 @@ class NetworkAnalyzerComm (SocketComm):
         for idx, val in enumerate(freq_centers):
             self.print_purple("Setting RF source " + str(idx + 1))
             # set passthrough mode to source
-            self._send_command(self.nwa_sock, "PT19")
+            self.__gpib_command("PT19")
             # change GPIB address to passthrough, send commands to signal sweeper
-            self._send_command(self.nwa_sock, "++addr 17")
+            self.__gpib_command("++addr 17")
         
             # set center frequency
             print ("setting center frequency to", val, " MHz")
-            self._send_command(self.nwa_sock, "CF " + str(val) + "MZ")
+            self.__gpib_command("CF " + str(val) + "MZ")
             # set signal sweep time to 100ms (fastest possible)
-            self._send_command(self.nwa_sock, "ST100MS")
-            # provide short delay
-            time.sleep(1)
+            self.__gpib_command("ST100MS")
+            # wait for the source to settle
+            self.__wait_until_ready('settle')
         
             # return to network analyzer
-            self._send_command(self.nwa_sock, "++addr 16")
+            self.__gpib_command("++addr 16")
         
             # turn off swept mode
-            self._send_command(self.nwa_sock, "SW0")
+            self.__gpib_command("SW0")
             # set analyzer to perform exactly one sweep
-            self._send_command(self.nwa_sock, "TS1")
+            self.__gpib_command("TS1")
             # give network analyzer time to complete sweep
-            # this delay time needs to be much longer that what would appear obvious,
             # if the analyzer does not have time to complete a sweep we will gather the most recent
             # data set (usually the last data set or garbage)
-            time.sleep(3)
+            self.__wait_until_ready('sweep')
         
             print ("Transferring data " + str(idx + 1))
             # take measurement
             # Input A absolute power measurement
-            self._send_command(self.nwa_sock, "C1IA")
-            self._send_command(self.nwa_sock, "C1OD")
+            self.__gpib_command("C1IA")
+            self.__gpib_command("C1OD")
             # allow time for data to be sent ( data output takes ~0.8 seconds in ASCII mode )
-            time.sleep(1)
-            self._send_command(self.nwa_sock, "++read 10")
+            self.__wait_until_ready('output')
+            self.__gpib_command(self.read_cmd)
         
-            tmp_list.append(self._read_data(self.nwa_sock, printlen=True))
+            tmp_list.append(self.__read_sweep(printlen=True))
+            self.__log_wait_times()
         
         return tmp_list
 
@@ -334,21 +704,21 @@ class NetworkAnalyzerComm (SocketComm):
         """
         
         # set passthrough mode to source
-        self._send_command(self.nwa_sock, "PT19")
+        self.__gpib_command("PT19")
         # change GPIB address to passthrough, send commands to signal sweeper
-        self._send_command(self.nwa_sock, "++addr 17")
+        self.__gpib_command("++addr 17")
         
         # set center frequency to frequency specified
         print ("Setting center frequency to", frequency, " MHz")
-        self._send_command(self.nwa_sock, "CF " + str(round(frequency)) + "MZ")
-        time.sleep(1)
+        self.__gpib_command("CF " + str(round(frequency)) + "MZ")
         
         # set frequency window around center to specified span
-        self._send_command(self.nwa_sock, "DF " + str(span) + "MZ")
-        time.sleep(1)
+        self.__gpib_command("DF " + str(span) + "MZ")
+        self.__wait_until_ready('window')
         
         # return to network analyzer
-        self._send_command(self.nwa_sock, "++addr 16")
+        self.__gpib_command("++addr 16")
+        self.__flush_commands()
         
     def take_data_single(self):
         """
@@ -357,35 +727,106 @@ class NetworkAnalyzerComm (SocketComm):
         """
         
         # set passthrough mode to source
-        self._send_command(self.nwa_sock, "PT19")
+        self.__gpib_command("PT19")
         # change GPIB address to passthrough, send commands to signal sweeper
-        self._send_command(self.nwa_sock, "++addr 17")
+        self.__gpib_command("++addr 17")
         
         # set signal sweep time to 100ms (fastest possible)
-        self._send_command(self.nwa_sock, "ST100MS")
-        # provide short delay
-        time.sleep(1)
+        self.__gpib_command("ST100MS")
+        # wait for the source to settle
+        self.__wait_until_ready('settle')
         
         # return to network analyzer
-        self._send_command(self.nwa_sock, "++addr 16")
+        self.__gpib_command("++addr 16")
         
         # turn off swept mode
-        self._send_command(self.nwa_sock, "SW0")
+        self.__gpib_command("SW0")
         # set analyzer to perform exactly one sweep
-        self._send_command(self.nwa_sock, "TS1")
+        self.__gpib_command("TS1")
         # give network analyzer time to complete sweeps
-        time.sleep(3)
+        self.__wait_until_ready('sweep')
         
         print ("Transferring data...")
         # take measurement
         # Input A absolute power measurement
-        self._send_command(self.nwa_sock, "C1IA")
-        self._send_command(self.nwa_sock, "C1OD")
+        self.__gpib_command("C1IA")
+        self.__gpib_command("C1OD")
         # data output takes ~0.8 seconds in ASCII mode
-        time.sleep(1)
-        self._send_command(self.nwa_sock, "++read 10")
+        self.__wait_until_ready('output')
+        # nothing received before the sweep may be taken as part of it
+        self._flush_input(self.nwa_sock)
+        self.__gpib_command(self.read_cmd)
+        
+        if self.binary_data:
+            sweep = self.__read_sweep()
+        else:
+            self.__flush_commands()
+            sweep = self._read_data_safe( self.nwa_sock )
+            
+        self.__log_wait_times()
+        return sweep
+    
+    def __wait_until_ready(self, phase):
+        """
+        Wait the ceiling for 'phase', long enough for the instrument to finish it.
+        
+        Args:
+            phase: one of 'settle', 'window', 'sweep' or 'output'
+            
+        Returns:
+            The time spent waiting, in seconds
+        """
+        ceiling = self.wait_ceilings[phase]
+        
+        # the queued commands must reach the instrument before the wait starts
+        self.__flush_commands()
+        time.sleep(ceiling)
+        
+        self.wait_times[phase] = self.wait_times.get(phase, 0.0) + ceiling
+        return ceiling
+    
+    def __log_wait_times(self):
+        """
+        Print the time spent waiting in each phase of the last measurement.
+        """
+        for phase, elapsed in self.wait_times.items():
+            print ("Waited " + str(round(elapsed, 3)) + " s for " + phase)
+            
+        self.wait_times = {}
+    
+    def __read_sweep(self, printlen=False):
+        """
+        Read a single sweep from the Network Analyzer.
+        
+        Args:
+            printlen: if true show the number of bytes read
+            
+        Returns:
+            The sweep as a comma seperated string in ASCII mode, or as a
+            NumPy array of powers (in dBm) in binary mode
+        """
+        
+        self.__flush_commands()
+        
+        if not self.binary_data:
+            return self._read_data(self.nwa_sock, printlen=printlen)
+        
+        raw_data = self._read_bytes(self.nwa_sock)
         
-        return self._read_data_safe( self.nwa_sock )
+        while len(raw_data) < self.framer.num_bytes:
+            # Incomplete sweep, wait one second, then ask the Prologix for the data again
+            time.sleep(1)
+            self.print_red ("Failed to read sweep from socket, retrying...")
+            self.__gpib_command(self.read_cmd)
+            self.__flush_commands()
+            raw_data = self._read_bytes(self.nwa_sock)
+            
+        if printlen: print ("received", len(raw_data), "bytes")
+        
+        # decode straight from the receive buffer, astype() makes the copy that
+        # outlives the buffer
+        counts = np.frombuffer(raw_data, dtype='>i2')
+        return counts.astype(np.float64) * self.binary_db_per_count
     
     def __set_RF_source(self, turn_on):
         """
@@ -398,17 +839,79 @@ class NetworkAnalyzerComm (SocketComm):
             True = On, False = Off
         """
         
-        self._send_command(self.nwa_sock, "PT19")  # set passthrough mode to source
-        self._send_command(self.nwa_sock, "++addr 17")  # change GPIB address to passthrough
+        self.__gpib_command("PT19")  # set passthrough mode to source
+        self.__gpib_command("++addr 17")  # change GPIB address to passthrough
         
         if (turn_on == True):
-            self._send_command(self.nwa_sock, "RF1")  # turn on RF
+            self.__gpib_command("RF1")  # turn on RF
         elif (turn_on == False):
-            self._send_command(self.nwa_sock, "RF0")  # turn off RF
+            self.__gpib_command("RF0")  # turn off RF
         else:
             self.print_red("Bad command RF source not set.")
             
-        self._send_command(self.nwa_sock, "++addr 16")  # change back GPIB address to network analyzer
+        self.__gpib_command("++addr 16")  # change back GPIB address to network analyzer
+        self.__flush_commands()
+        
+    def __gpib_command(self, cmd):
+        """
+        Queue a command for the instrument at the current GPIB address.
+        
+        '++addr' commands that would not change the address, and settings (see
+        SHADOWED_SETTINGS) that match the last value sent to the same address are
+        dropped. Commands are not sent until __flush_commands() is called, or the
+        GPIB address changes, so consecutive commands for one address go out in a
+        single batch.
+        
+        Args:
+            cmd: The command to be sent, without terminator
+        """
+        if cmd.startswith("++addr"):
+            gpib_addr = int(cmd.split()[1])
+            if gpib_addr == self.gpib_addr:
+                self.commands_skipped += 1
+                return
+            self.__flush_commands()
+            self.gpib_addr = gpib_addr
+            
+        elif cmd[:2] in self.SHADOWED_SETTINGS:
+            shadow = self.shadow_state.setdefault(self.gpib_addr, {})
+            if shadow.get(cmd[:2]) == cmd:
+                self.commands_skipped += 1
+                return
+            shadow[cmd[:2]] = cmd
+            
+        self.pending_commands.append(cmd)
+        
+    def __flush_commands(self):
+        """
+        Send all queued commands in a single batch.
+        """
+        if not self.pending_commands:
+            return
+        
+        self._send_command_long(self.nwa_sock, "\n".join(self.pending_commands))
+        self.commands_sent += len(self.pending_commands)
+        self.pending_commands = []
+        
+    def reset_shadow_state(self):
+        """
+        Forget all cached instrument settings, e.g. after the instruments have been
+        adjusted by hand. Every setting will be sent again the next time it is used.
+        """
+        self.__flush_commands()
+        self.shadow_state = {}
+        self.gpib_addr = None
+        
+    def report_command_counts(self):
+        """
+        Print the number of commands sent and skipped since the last report, then
+        reset the counters. Intended to be called once per iteration.
+        """
+        print ("GPIB commands sent: " + str(self.commands_sent)
+               + ", skipped: " + str(self.commands_skipped))
+        
+        self.commands_sent = 0
+        self.commands_skipped = 0
     
     def turn_off_RF_source(self):
         """
@@ -429,12 +932,36 @@ class NetworkAnalyzerComm (SocketComm):
 class StepperMotorComm (SocketComm):
     """
     Object to sends commands to an Applied Motion products stepper motor.
+    
+    A single connection to the drive is kept open for the lifetime of the object
+    and is re-established automatically if it is lost. The motion profile last sent
+    to the drive is remembered so that it is only re-sent when it changes.
+    
+    Moves are started with move(), which predicts how long the move will take from
+    the trapezoidal AC/DE/VE profile and (optionally) waits until the drive reports
+    that the motor has stopped.
     """
+    
+    STEPS_PER_REV = 200
+    # bit of the SCL status code (SC) that is set while the motor is moving
+    STATUS_MOVING = 0x0010
+    # interval at which the drive status is polled while waiting for a move to finish
+    POLL_INTERVAL = 0.05
 
     def __init__(self, addr_dict):
         super(StepperMotorComm, self).__init__()
         self.step_addr = self.__get_step_addr(addr_dict)
         
+        # drive replies are terminated with a carriage return
+        self.framer = TerminatorFramer(b'\r')
+        
+        self.step_sock = None
+        # speed (AC/DE/VE) the drive is currently configured for, None if unknown
+        self.traverse_speed = None
+        
+        # time (from time.time()) at which the current move is expected to finish
+        self.move_end_time = 0.0
+        
     def __get_step_addr(self, addr_dict):
 
         ip_addrs = addr_dict[0]
@@ -443,6 +970,18 @@ class StepperMotorComm (SocketComm):
         return [ip_addrs, port]
 
     def __get_step_sock(self):
+        """
+        Get the socket for the current stepper session, connecting (or reconnecting
+        if the drive has closed the connection) as needed.
+        
+        Returns:
+            Socket object on success, None on failure
+        """
+        
+        if self.step_sock is not None and self.__is_connected(self.step_sock):
+            return self.step_sock
+        
+        self.close()
 
         ip_addrs = self.step_addr[0]
         port = self.step_addr[1]
@@ -453,24 +992,232 @@ class StepperMotorComm (SocketComm):
             sock = self._socket_connect(ip_addrs, int(port))
             st = "Successfully connected to " + inst_name
             self.print_green(st)
-            return sock
         except (IOError, ValueError) as exc:
             # some exception handling overlaps with _socket_connect, but we need to handle ValueError in the case of a bad port number
             st = "Problem generating socket object for " + inst_name + "!" + "Error was: " + str(exc)
             self.print_red(st)
-            return -1
+            return None
+        
+        self.step_sock = sock
+        self.traverse_speed = None
+        
+        # set 200 steps/rev, only needs to be done once per session
+        self.__send_scl("MR0")
+        
+        return sock
+    
+    def __is_connected(self, sock):
+        """
+        Check whether the drive is still connected, discarding any replies
+        it has sent in the meantime.
+        """
+        try:
+            while(select.select([sock], [], [], 0) != ([], [], [])):
+                if not sock.recv(2048):
+                    # remote end closed the connection
+                    return False
+        except OSError:
+            return False
+        return True
+    
+    def __send_scl(self, cmd):
+        """
+        Send a command to the drive, reconnecting and retrying once if the
+        connection has been lost.
+        
+        Args:
+            cmd: SCL command, without header or terminator
+        """
+        
+        for _ in range(2):
+            sock = self.__get_step_sock()
+            if sock is None:
+                self.print_red("Stepper motor not connected, could not send " + cmd)
+                return
+            try:
+                sock.sendall(("\0\a" + cmd + "\r").encode())
+                return
+            except OSError as exc:
+                self.print_yellow("Lost connection to stepper motor (" + str(exc) + "), reconnecting...")
+                self.close()
+                
+        self.print_red("Error sending command " + cmd + " to stepper motor")
+        
+    def __query_scl(self, cmd, timeout=0.5):
+        """
+        Send a query to the drive and return the value it reports.
+        
+        Replies to earlier commands (acknowledgements such as '%') that arrive
+        before the answer are skipped.
+        
+        Args:
+            cmd: SCL query, e.g. 'SC' or 'IP'
+            timeout: max time to wait for the drive to respond
+            
+        Returns:
+            The reported value as a string, e.g. '0009' for 'SC=0009', or None if
+            the drive did not answer
+        """
+        
+        self.__send_scl(cmd)
+        if self.step_sock is None:
+            return None
+        
+        prefix = cmd + "="
+        deadline = time.time() + timeout
+        
+        while time.time() < deadline:
+            response = self._read_data(self.step_sock, timeout=max(0.0, deadline - time.time()))
+            if not response:
+                return None
+            idx = response.find(prefix)
+            if idx >= 0:
+                return response[idx + len(prefix):].strip()
+            
+        return None
+    
+    def is_moving(self):
+        """
+        Ask the drive whether the motor is moving.
+        
+        Returns:
+            True or False, or None if the drive status could not be read
+        """
+        status = self.__query_scl("SC")
+        
+        try:
+            return bool(int(status, 16) & self.STATUS_MOVING)
+        except (TypeError, ValueError):
+            return None
+        
+    def predict_move_time(self, revs, traverse_speed):
+        """
+        Predict how long a move will take from a trapezoidal velocity profile.
+        
+        The drive is configured with acceleration, deceleration and velocity all
+        equal to traverse_speed (rev/s^2 and rev/s). Short moves never reach full
+        speed, giving a triangular profile instead.
+        
+        Args:
+            revs: length of the move in revolutions (sign is ignored)
+            traverse_speed: speed setting used for the move
+            
+        Returns:
+            Predicted duration of the move in seconds
+        """
+        
+        distance = abs(float(revs))
+        accel = decel = velocity = float(traverse_speed)
+        
+        # distance covered while speeding up to and slowing down from full speed
+        ramp_distance = velocity ** 2 / (2 * accel) + velocity ** 2 / (2 * decel)
+        
+        if distance >= ramp_distance:
+            return velocity / accel + velocity / decel + (distance - ramp_distance) / velocity
+        
+        peak_velocity = (2 * distance * accel * decel / (accel + decel)) ** 0.5
+        return peak_velocity / accel + peak_velocity / decel
+    
+    def move(self, revs, traverse_speed, wait=True):
+        """
+        Move the motor by a number of revolutions.
+        
+        Args:
+            revs: length of the move in revolutions, negative values retract the cavity
+            traverse_speed: speed setting to use for the move
+            wait: if true do not return until the move has finished, otherwise return
+            immediately so that other work can be done while the motor moves
+            (call wait_for_move() before relying on the new position)
+            
+        Returns:
+            Predicted duration of the move in seconds
+        """
+        
+        self.__set_stepper_motor(traverse_speed)
+        
+        nsteps = int(round(revs * self.STEPS_PER_REV))
+        self.__send_scl("FL" + str(nsteps))
+        
+        move_time = self.predict_move_time(revs, traverse_speed)
+        self.move_end_time = time.time() + move_time
+        
+        if wait:
+            self.wait_for_move()
+            
+        return move_time
+    
+    def wait_for_move(self, ceiling=None):
+        """
+        Wait until the last move started with move() has finished.
+        
+        Sleeps until shortly before the predicted end of the move, then polls the
+        drive status until the motor has stopped. If the drive status cannot be read
+        fall back to waiting for the predicted duration only.
+        
+        Args:
+            ceiling: longest time to keep polling past the predicted end of the move,
+            defaults to the predicted duration plus two seconds
+        """
+        
+        remaining = self.move_end_time - time.time()
+        if ceiling is None:
+            ceiling = max(remaining, 0.0) + 2.0
+        deadline = self.move_end_time + ceiling
+        
+        # no point polling while the motor is certainly still moving
+        if remaining > self.POLL_INTERVAL:
+            time.sleep(remaining - self.POLL_INTERVAL)
+            
+        while True:
+            moving = self.is_moving()
+            
+            if moving is None:
+                # drive did not report status, rely on the prediction
+                time.sleep(max(0.0, self.move_end_time - time.time()))
+                return
+            
+            if not moving:
+                return
+            
+            if time.time() >= deadline:
+                self.print_yellow("Stepper motor still moving after " + str(round(ceiling, 3))
+                                  + " seconds past predicted end of move")
+                return
+            
+            time.sleep(self.POLL_INTERVAL)
+        
+    def close(self):
+        """
+        Close the stepper session, a new one will be opened on the next command.
+        """
+        if self.step_sock is not None:
+            try:
+                self.step_sock.close()
+            except OSError:
+                pass
+            
+        self.step_sock = None
+        self.traverse_speed = None
+        # bytes left over from the old connection
+        self.recv_buffer.reset()
+        
+    def __set_stepper_motor(self, traverse_speed):
 
-    def __set_stepper_motor(self, step_sock, traverse_speed):
+        # a lost connection must be noticed here, since a new session resets
+        # the profile the drive is known to have
+        self.__get_step_sock()
+        if traverse_speed == self.traverse_speed:
+            return
 
         self.print_purple("Setting stepper motor")
-        # set 200 steps/rev
-        self._send_command_scl(step_sock, "MR0")
         # set acceleration
-        self._send_command_scl(step_sock, "AC" + str(traverse_speed))
+        self.__send_scl("AC" + str(traverse_speed))
         # set deceleration
-        self._send_command_scl(step_sock, "DE" + str(traverse_speed))
+        self.__send_scl("DE" + str(traverse_speed))
         # set velocity
-        self._send_command_scl(step_sock, "VE" + str(traverse_speed))
+        self.__send_scl("VE" + str(traverse_speed))
+        
+        self.traverse_speed = traverse_speed
         
         self.print_green("Stepper motor set.")
         
@@ -478,63 +1225,45 @@ class StepperMotorComm (SocketComm):
         
         self.print_purple("Moving to initial cavity length of " + str(initial_length))
         
-        step_sock = self.__get_step_sock()
-        self.__set_stepper_motor(step_sock, 5)
-        
         delta_l = initial_length - current_length
-        delta_steps = int(round(16 * 200 * delta_l))
         
         self.print_yellow("Need to move " + str(delta_l))
         
-        self._send_command_scl(step_sock, "FL" + str(delta_steps))
-        delay_time = abs(delta_l)
-        time.sleep(delay_time)
-        
-        step_sock.close()
+        # 16 revolutions per inch
+        self.move(16 * delta_l, 5)
 
     def reset_cavity(self, len_of_tune):
-
-        step_sock = self.__get_step_sock()
-        self.__set_stepper_motor(step_sock, 5)
+        
+        # also used when cleaning up after a crash, so start from a fresh
+        # session in case the old one was interrupted part-way through a command
+        self.close()
 
         rev = int(len_of_tune * -16)
 
         self.print_purple("Setting cavity back to initial length...")
 
-        nsteps = int(rev * 200)
-
-        print ("Moving motor ", rev, " Revolutions.")  # Movement will take", abs(duration), "seconds."
-        self._send_command_scl(step_sock, "FL" + str(nsteps))
-
-        step_sock.close()
+        duration = self.move(rev, 5, wait=False)
+        print ("Moving motor ", rev, " Revolutions. Movement will take", round(duration, 1), "seconds.")
         
     def panic_reset_cavity(self, iteration, revs_per_iter):
 
         rev = -1.0 * float(iteration) * revs_per_iter
-        nsteps = int(rev * 200)
 
-        step_sock = self.__get_step_sock()
-        self.__set_stepper_motor(step_sock, 5)
+        # start from a fresh session in case the old one was interrupted
+        # part-way through a command
+        self.close()
 
         self.print_red("Program halted! Resetting cavity to initial length.")
         print ("Moving motor " + str(abs(rev)) + " revolutions.")
 
-        self._send_command_scl(step_sock, "FL" + str(nsteps))
-
-        step_sock.close()
-
-    def walk_loop(self, len_of_tune, revs, iters, num_of_iters):
+        self.move(rev, 5, wait=False)
 
-        step_sock = self.__get_step_sock()
-        self.__set_stepper_motor(step_sock, 1)
+    def walk_loop(self, len_of_tune, revs, iters, num_of_iters, wait=True):
 
         print ("Iteration:", iters, " of ", num_of_iters, ".  Moving stepper", revs, "revolution(s).")
-        itsteps = int(revs * 200)
-        self._send_command_scl(step_sock, "FL" + str(itsteps))
-
-        # wait for stepper motor to move
-        time.sleep(revs)
-        step_sock.close()
+        
+        # wait for stepper motor to move, unless the caller has other work to do first
+        return self.move(revs, 1, wait)
         
 class SwitchComm (SocketComm):
     """
@@ -570,37 +1299,266 @@ class ArduComm(SocketComm):
     """
     Object to send and receive commands from an Arduino Uno (R3), equipped
     with a string potentiometer.
+    
+    Optionally a background sampler thread (see start_sampler()) polls the Arduino
+    continuously and keeps the most recent timestamped readings, so that the cavity
+    length can be looked up without waiting on the Arduino.
     """
     
-    def __init__(self, ardu_sock):
+    def __init__(self, ardu_sock, max_samples=64):
+        """
+        Args:
+            ardu_sock: Socket where the Arduino can be found
+            max_samples: Number of readings kept by the sampler
+        """
         super(ArduComm, self).__init__()
         self.ardu_sock = ardu_sock
+        self.framer = TerminatorFramer(b'\n')
+        
+        # only one query may be in flight at a time
+        self.sock_lock = threading.Lock()
+        
+        # ring buffer of (time.time(), cavity length) pairs, newest last
+        self.samples = collections.deque(maxlen=max_samples)
+        self.samples_lock = threading.Lock()
+        # readings taken before this time are never used, see mark_stale()
+        self.min_sample_time = 0.0
+        
+        self.max_age = 1.0
+        self.sampler_thread = None
+        self.sampler_stop = threading.Event()
         
-    def get_cavity_length(self):
+    def start_sampler(self, interval=0.25, max_age=1.0):
+        """
+        Start polling the Arduino in a background thread.
+        
+        Args:
+            interval: time between readings, in seconds
+            max_age: readings older than this (in seconds) are considered stale
+            and will not be returned by get_cavity_length()
+        """
+        if self.sampler_thread is not None:
+            return
+        
+        self.max_age = max_age
+        self.sampler_stop.clear()
+        self.sampler_thread = threading.Thread(target=self.__sample_loop, args=(interval,), daemon=True)
+        self.sampler_thread.start()
+        
+    def stop_sampler(self):
+        """
+        Stop the background sampler thread, if running.
+        """
+        if self.sampler_thread is None:
+            return
+        
+        self.sampler_stop.set()
+        self.sampler_thread.join()
+        self.sampler_thread = None
+        
+    def mark_stale(self):
+        """
+        Discard all readings taken so far, e.g. because the cavity has just been moved.
+        The next call to get_cavity_length() will use a reading taken after this call.
+        """
+        with self.samples_lock:
+            self.min_sample_time = time.time()
+        
+    def get_cavity_length(self, max_age=None):
         """
         Get the current cavity length from the Arduino.
         
-        This function will poll the Arduino until a non-empty string is returned,
-        guaranteeing that the return value will be valid.
+        If the sampler is running the newest reading is returned, provided it is
+        no older than max_age. Otherwise the Arduino is polled until a valid
+        response is returned, guaranteeing that the return value will be valid.
+        
+        Responses are framed on the line terminator, and any stale data is flushed
+        before the query is sent, so 'doubled' responses, e.g. "7.5\r\n7.5",
+        only contribute their first value.
+        
+        Args:
+            max_age: oldest acceptable reading in seconds, defaults to the value given
+            to start_sampler(). Use 0 to force a fresh reading.
+        """
+        
+        samples = self.__recent_samples(max_age)
+        if samples:
+            return samples[-1][1]
+        
+        return self.__read_cavity_length_safe()
+    
+    def get_cavity_length_median(self, window=1.0):
+        """
+        Get the median of the cavity lengths read within the last 'window' seconds,
+        which suppresses occasional bad readings from the string potentiometer.
+        
+        If the sampler has no readings in the window a fresh reading is taken.
+        
+        Args:
+            window: how far back to look for readings, in seconds
+        """
+        
+        samples = self.__recent_samples(window)
+        if not samples:
+            return self.__read_cavity_length_safe()
+        
+        lengths = sorted(length for _, length in samples)
+        mid = len(lengths) // 2
+        
+        if len(lengths) % 2:
+            return lengths[mid]
+        return (lengths[mid - 1] + lengths[mid]) / 2
+    
+    def __recent_samples(self, max_age):
+        """
+        Get readings that are no older than max_age (and not marked stale), oldest first.
+        """
+        
+        if max_age is None:
+            # without the sampler every call should go to the Arduino, as before
+            max_age = self.max_age if self.sampler_thread is not None else 0.0
+            
+        with self.samples_lock:
+            oldest = max(time.time() - max_age, self.min_sample_time)
+            return [sample for sample in self.samples if sample[0] >= oldest]
+    
+    def __read_cavity_length(self):
+        """
+        Query the Arduino once and record the reading.
+        
+        Returns:
+            The cavity length, or None if no valid response was received
+        """
+        
+        with self.sock_lock:
+            timestamp = time.time()
+            self._flush_input(self.ardu_sock)
+            self._send_command(self.ardu_sock, "LengthOfCavity")
+            # Arduino can take an unusually long time to respond, need to use a timeout > 2 seconds.
+            # A garbled byte should fail the cast below rather than raise from the decode
+            response = self._read_data(self.ardu_sock, timeout=5, errors='replace')
+            
+        # split also strips any whitespace that would cause a bad cast from string to float
+        try:
+            length = float(response.split()[0])
+        except (IndexError, ValueError):
+            return None
         
-        Note that this does not elminate the problem of getting 'doubled' responses, e.g.
-        "7.5\r\n7.5"
+        with self.samples_lock:
+            self.samples.append((timestamp, length))
+            
+        return length
+    
+    def __read_cavity_length_safe(self):
+        """
+        Query the Arduino until a valid response is returned.
         """
-        self._send_command(self.ardu_sock, "LengthOfCavity")
-        # Arduino can take an unusually long time to respond, need to use a timeout > 2 seconds
-        # need to strip any whiteespace that that will cause a bad cast from string to float
-        response = self._read_data_safe(self.ardu_sock, 5).strip(' \t\n\r')
         
-        return float(response)
+        length = self.__read_cavity_length()
+        
+        while length is None:
+            time.sleep(1)
+            self.print_red ("Failed to read cavity length, retrying...")
+            length = self.__read_cavity_length()
+            
+        return length
+    
+    def __sample_loop(self, interval):
+        
+        while not self.sampler_stop.is_set():
+            if self.ardu_sock.fileno() < 0:
+                # socket has been closed underneath us, nothing more to sample
+                self.print_red("Cavity length sampler stopped: socket closed")
+                break
+            
+            try:
+                self.__read_cavity_length()
+            except OSError as exc:
+                self.print_red("Cavity length sampler stopped: " + str(exc))
+                break
+            except ValueError as exc:
+                # a single bad reading, keep sampling
+                self.print_red("Failed to read cavity length, retrying: " + str(exc))
+            
+            self.sampler_stop.wait(interval)
         
 class SignalAnalyzerComm(SocketComm):
     """
     Object to send and receive commands from Aligent CXA Signal Analyzer
     """
     
+    # IQ sample rate as a multiple of the frequency span, used to estimate
+    # the capture time of a single FFT
+    SAMPLE_RATE_PER_SPAN = 1.25
+    # bit of the Standard Event Status Register set by *OPC
+    ESR_OPERATION_COMPLETE = 0x01
+    # fraction of the estimated integration time to wait before polling
+    EARLY_POLL_FRACTION = 0.9
+    POLL_INTERVAL = 0.05
+    MAX_POLL_INTERVAL = 1.0
+    FETCH_TIMEOUT = 2
+    # number of times an empty or short spectrum is fetched again
+    FETCH_RETRIES = 3
+    
     def __init__(self, sa_sock):
         super(SignalAnalyzerComm, self).__init__()
         self.sa_sock = sa_sock
+        # SCPI responses are either newline terminated or definite-length blocks
+        self.framer = BlockFramer(b'\n')
+        
+        # estimated integration time for the current settings, and the ratio
+        # of measured to estimated integration time seen on the last spectrum
+        self.integration_estimate = 0.0
+        self.integration_ratio = 1.0
+        
+    def estimate_integration_time(self, fft_length, freq_span, num_averages):
+        """
+        Estimate how long the signal analyzer takes to build a power spectrum.
+        
+        Args:
+            fft_length: the number of IQ points that make up a power spectrum
+            freq_span: width of the frequency window (in MHz)
+            num_averages: the number of spectra averaged together
+            
+        Returns:
+            Estimated integration time in seconds
+        """
+        capture_time = fft_length / (self.SAMPLE_RATE_PER_SPAN * freq_span * 1e6)
+        return capture_time * num_averages
+        
+    def _parse_spectrum(self, data):
+        """
+        Convert the response to :FETC:SPEC7? into a float32 array.
+        
+        Args:
+            data: the response, either a 'FORM REAL,32' definite-length block or
+            comma separated ASCII values
+            
+        Returns:
+            NumPy float32 array of power values (dBm)
+            
+        Raises:
+            ValueError: if the response is empty or was cut short
+        """
+        if data[0:1] == b'#':
+            num_digits = bytes(data[1:2])
+            header_length = 2 + int(num_digits) if num_digits.isdigit() else 0
+            length_digits = bytes(data[2:header_length])
+            if len(length_digits) != header_length - 2 or not length_digits.isdigit():
+                raise ValueError("Incomplete block header")
+            
+            payload = data[header_length:]
+            block_length = int(length_digits)
+            if len(payload) != block_length or block_length % 4:
+                raise ValueError("Expected a block of " + str(block_length) + " bytes, received " + str(len(payload)))
+            # copy out of the receive buffer, converting to native byte order
+            return np.frombuffer(payload, dtype='>f4').astype(np.float32)
+        
+        # an ASCII response is only complete once its terminator has arrived
+        if not bytes(data).endswith(b'\n') or not bytes(data).strip():
+            raise ValueError("Incomplete ASCII response")
+        
+        return np.array(bytes(data).strip().split(b','), dtype=np.float32)
     
     def set_signal_analyzer(self, center_freq, fft_length=131072, freq_span=10, num_averages=20001):
         """
@@ -642,6 +1600,11 @@ class SignalAnalyzerComm(SocketComm):
         self._send_command(self.sa_sock, "SPEC:AVER:COUN " + str(num_averages))  # set number of averages
         self._send_command(self.sa_sock, "INIT:CONT OFF")  # turn off continuous measurement operation
         # Total integration time is given by time_per_frame(FFT length)*num_averages
+        self.integration_estimate = self.estimate_integration_time(fft_length, freq_span, num_averages)
+        
+        # transfer spectra as big-endian 32 bit floats
+        self._send_command(self.sa_sock, "FORM REAL,32")
+        self._send_command(self.sa_sock, "FORM:BORD NORM")
         
         self.print_green("Spectrum analyzer set")
 
@@ -650,39 +1613,92 @@ class SignalAnalyzerComm(SocketComm):
         Collect a power spectrum from the signal analyzer.
         Note that this function will trigger the signal analyzer to build a new power spectrum,
         and not return until it is finished.
+        
+        Completion is signalled through the Operation Complete bit of the
+        Standard Event Status Register (*OPC), which is only polled once most of
+        the estimated integration time has passed.
+        
+        Returns:
+            NumPy float32 array of power values (dBm)
         """
         self.print_purple("Starting integration...")
+        
+        # discard anything left over from earlier queries, such as the line
+        # feed trailing a definite-length block
+        self._flush_input(self.sa_sock)
 
         # Initialize measurement
-        # This will start collecting and averaging samples
-        self._send_command(self.sa_sock, "INIT:IMM")
+        # This will start collecting and averaging samples, *OPC sets the
+        # Operation Complete bit once the requested number of samples have been collected
+        self._send_command(self.sa_sock, "*CLS")
+        self._send_command(self.sa_sock, "INIT:IMM;*OPC")
+        start_time = time.time()
+        
+        estimate = self.integration_estimate * self.integration_ratio
+        time.sleep(self.EARLY_POLL_FRACTION * estimate)
+        
+        poll_interval = self.POLL_INTERVAL
+        while not self.__operation_complete():
+            elapsed_time = time.time() - start_time
+            status = "\rWaiting, time elapsed: " + str(round(elapsed_time)) + " seconds"
+            status += " (estimated " + str(round(estimate)) + " seconds)"
+            sys.stdout.write(status)
+            sys.stdout.flush()
+            
+            time.sleep(poll_interval)
+            poll_interval = min(2 * poll_interval, self.MAX_POLL_INTERVAL)
+            
+        elapsed_time = time.time() - start_time
+        print ("\nIntegration complete after " + str(round(elapsed_time, 2)) + " seconds")
         
-        elapsed_time = 0.0
-
-        # *OPC? will write "1\n" to the output when operation is complete.
-        while True:
-            # Poll the signal analyzer
-            self._send_command(self.sa_sock, "*OPC?")
-            status_str = self._read_data(self.sa_sock, printlen = False , timeout = 1)
-            
-            # Wait until *OPC? returns '1\n' indicating that the requested number
-            # of samples have been collected
-            if(status_str == "1\n"):
-                print ("\nIntegration complete")
-                break
-            else:
-                elapsed_time += dt.datetime.now().microsecond
-#                 print ("\rWaiting, time elapsed: "+str(round(elapsed_time/1e6))+ " seconds")
-                status = "\rWaiting, time elapsed: " + str(round(elapsed_time / 1e6)) + " seconds"
-                sys.stdout.write(status)
-                sys.stdout.flush()
+        if self.integration_estimate > 0:
+            self.integration_ratio = elapsed_time / self.integration_estimate
 
         # Since measurement is already initliazed collect data with the
         # FETC(h) command
+        return self.__fetch_spectrum()
+    
+    def __fetch_spectrum(self):
+        """
+        Fetch the last power spectrum. An empty or short response is discarded
+        and the fetch re-issued, up to FETCH_RETRIES times.
+        
+        Returns:
+            NumPy float32 array of power values (dBm)
+        """
         self._send_command(self.sa_sock, ":FETC:SPEC7?")
-        raw_sa_data = self._read_data_safe(self.sa_sock, 0.5)
         
-        return raw_sa_data
+        for attempt in range(self.FETCH_RETRIES + 1):
+            if attempt:
+                time.sleep(1)
+                self.print_red("Failed to read spectrum from socket, retrying...")
+                # the rest of a short response may still arrive, drop it along
+                # with the partial response before asking again
+                self._flush_input(self.sa_sock)
+                self._send_command(self.sa_sock, ":FETC:SPEC7?")
+                
+            raw_sa_data = self._read_bytes(self.sa_sock, timeout=self.FETCH_TIMEOUT)
+            try:
+                return self._parse_spectrum(raw_sa_data)
+            except ValueError as exc:
+                self.print_red(str(exc))
+                
+        raise IOError("No complete spectrum after " + str(self.FETCH_RETRIES + 1) + " fetches")
+    
+    def __operation_complete(self):
+        """
+        Read (and clear) the Standard Event Status Register.
+        
+        Returns:
+            True if the Operation Complete bit is set
+        """
+        self._send_command(self.sa_sock, "*ESR?")
+        response = self._read_data(self.sa_sock, timeout=1)
+        
+        try:
+            return bool(int(response.strip()) & self.ESR_OPERATION_COMPLETE)
+        except ValueError:
+            return False
     
 class SignalGeneratorComm(SocketComm):
     """
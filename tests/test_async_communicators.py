@@ -0,0 +1,108 @@
+import asyncio
+import socket
+import threading
+import time
+import unittest
+
+import async_communicators as ac
+
+class FakeArduino:
+    """
+    Answers every 'LengthOfCavity' query with the next length after 'delay'
+    seconds, on the far end of a socketpair.
+    """
+
+    def __init__(self, sock, lengths, delay):
+        self.sock = sock
+        self.lengths = list(lengths)
+        self.delay = delay
+        self.busy = threading.Lock()
+        self.overlapped = False
+        self.thread = threading.Thread(target=self.__serve, daemon=True)
+        self.thread.start()
+
+    def __serve(self):
+        pending = b''
+        while True:
+            try:
+                data = self.sock.recv(4096)
+            except OSError:
+                return
+            if not data:
+                return
+            pending += data
+            while b'\n' in pending:
+                command, pending = pending.split(b'\n', 1)
+                if command != b'LengthOfCavity':
+                    continue
+                if not self.busy.acquire(blocking=False):
+                    self.overlapped = True
+                    continue
+                time.sleep(self.delay)
+                self.sock.sendall(str(self.lengths.pop(0)).encode() + b'\r\n')
+                self.busy.release()
+
+class AsyncCommTest(unittest.TestCase):
+
+    def connect(self, lengths, delay=0.0):
+        ardu_sock, far_sock = socket.socketpair()
+        self.addCleanup(ardu_sock.close)
+        self.addCleanup(far_sock.close)
+
+        fake = FakeArduino(far_sock, lengths, delay)
+        return ardu_sock, fake
+
+    def open(self, ardu_sock, **kwargs):
+        ardu_comm = asyncio.run(ac.AsyncArduComm.open(ardu_sock, **kwargs))
+        self.addCleanup(ardu_comm.shutdown)
+        return ardu_comm
+
+    def test_calls_run_the_synchronous_methods(self):
+        ardu_sock, fake = self.connect([7.5, 7.25])
+        ardu_comm = self.open(ardu_sock)
+
+        async def read():
+            return [await ardu_comm.get_cavity_length(), await ardu_comm.get_cavity_length()]
+
+        self.assertEqual(asyncio.run(read()), [7.5, 7.25])
+        # attributes are passed through
+        self.assertEqual(len(ardu_comm.samples), 2)
+
+    def test_instruments_run_concurrently(self):
+        delay = 0.3
+        first_sock, _ = self.connect([1.0], delay)
+        second_sock, _ = self.connect([2.0], delay)
+        first_comm = self.open(first_sock)
+        second_comm = self.open(second_sock)
+
+        async def read():
+            return await asyncio.gather(first_comm.get_cavity_length(), second_comm.get_cavity_length())
+
+        start = time.time()
+        self.assertEqual(asyncio.run(read()), [1.0, 2.0])
+        self.assertLess(time.time() - start, 1.8 * delay)
+
+    def test_calls_to_one_instrument_run_in_order(self):
+        ardu_sock, fake = self.connect([1.0, 2.0, 3.0], 0.05)
+        ardu_comm = self.open(ardu_sock)
+
+        async def read():
+            return await asyncio.gather(*[ardu_comm.get_cavity_length() for _ in range(3)])
+
+        self.assertEqual(asyncio.run(read()), [1.0, 2.0, 3.0])
+        self.assertFalse(fake.overlapped)
+
+    def test_time_limit(self):
+        ardu_sock, fake = self.connect([1.0, 2.0], 0.5)
+        ardu_comm = self.open(ardu_sock)
+
+        async def read():
+            with self.assertRaises(asyncio.TimeoutError):
+                await ardu_comm.get_cavity_length(timeout=0.1)
+            # the timed out call still completes, the next one gets its own reading
+            return await ardu_comm.get_cavity_length(max_age=0)
+
+        self.assertEqual(asyncio.run(read()), 2.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import re
+import unittest
+
+import numpy as np
+
+import data_processors as procs
+
+# the string based conversions Convertor used before parse_powers() and
+# make_plot_arrays(), which the array versions have to reproduce exactly
+
+def legacy_power_list(raw_strs):
+    total_str = ''.join(raw_strs)
+    power_list = total_str.strip()
+    power_list = re.split(',|\n', power_list)
+    return [float(y) for y in power_list]
+
+def legacy_plot_points(power_list, cavity_length, min_frequency, max_frequency):
+    num_points = len(power_list)
+    formatted_points = []
+    for idx, power in enumerate(power_list):
+        frequency = (idx + 1) * (max_frequency - min_frequency) / (num_points) + min_frequency
+        frequency = int(round(frequency))
+        formatted_points.append([frequency, cavity_length, power])
+    return formatted_points
+
+def legacy_power_str(power_list, center_freq, freq_window, cavity_length):
+    max_length = round(center_freq) + freq_window / 2
+    min_length = round(center_freq) - freq_window / 2
+    trans_table = dict.fromkeys(map(ord, ' []'), None)
+
+    freq_window_str = ''
+    for triple in legacy_plot_points(power_list, cavity_length, min_length, max_length):
+        freq_window_str += str(triple).translate(trans_table) + "\n"
+    return freq_window_str
+
+def ascii_sweeps(num_windows, num_points, seed=0):
+    """
+    Sweeps as the network analyzer sends them in ASCII mode, one string per window.
+    """
+    rng = np.random.RandomState(seed)
+    powers = np.round(rng.normal(-20.0, 5.0, (num_windows, num_points)), 4)
+    return [','.join(repr(power) for power in row.tolist()) + '\n' for row in powers]
+
+class ParsePowersTest(unittest.TestCase):
+
+    def setUp(self):
+        self.convertor = procs.Convertor()
+
+    def test_matches_legacy_parser(self):
+        sweeps = ascii_sweeps(4, 401)
+        # a single string, with newlines between windows and a stray space
+        joined = ''.join(sweeps).replace(',', ', ', 1)
+
+        for raw_data in [sweeps, joined, sweeps[:1]]:
+            powers = self.convertor.parse_powers(raw_data)
+
+            self.assertEqual(powers.tolist(), legacy_power_list(raw_data))
+            self.assertEqual(powers.dtype, np.float64)
+            self.assertTrue(powers.flags['C_CONTIGUOUS'])
+            self.assertEqual(self.convertor.str_list_to_power_list(raw_data), legacy_power_list(raw_data))
+
+    def test_binary_windows_are_joined(self):
+        windows = [np.linspace(-30.0, -10.0, 5), np.linspace(-10.0, -30.0, 5)]
+
+        powers = self.convertor.parse_powers(windows)
+
+        np.testing.assert_array_equal(powers, np.concatenate(windows))
+        np.testing.assert_array_equal(self.convertor.parse_powers(windows[0]), windows[0])
+
+    def test_malformed_values_raise(self):
+        # eg a window cut short in the middle of a value, or an empty transfer
+        for raw_data in [['-20.5,,-21.0'], ['-20.5,-21.0\n-2x'], ['-20.5,-21.0,-'], ['']]:
+            with self.assertRaises(ValueError):
+                legacy_power_list(raw_data)
+            with self.assertRaises(ValueError, msg=repr(raw_data)):
+                self.convertor.parse_powers(raw_data)
+
+class PlotArraysTest(unittest.TestCase):
+
+    def setUp(self):
+        self.convertor = procs.Convertor()
+
+    def test_make_plot_points_matches_legacy(self):
+        sweeps = ascii_sweeps(4, 401)
+        # spans whose frequencies fall on .5, to check the rounding
+        for min_frequency, max_frequency in [(3000, 4600), (3000.0, 3801.0), (3000, 3002)]:
+            points = self.convertor.make_plot_points(sweeps, 7.25, min_frequency, max_frequency)
+            expected = legacy_plot_points(legacy_power_list(sweeps), 7.25, min_frequency, max_frequency)
+
+            self.assertEqual(points, expected)
+            self.assertTrue(all(type(point[0]) is int for point in points))
+
+    def test_make_plot_arrays_matches_plot_points(self):
+        sweeps = ascii_sweeps(4, 401)
+
+        arrays = self.convertor.make_plot_arrays(sweeps, 7.25, 3000, 4600)
+        points = legacy_plot_points(legacy_power_list(sweeps), 7.25, 3000, 4600)
+
+        self.assertEqual(arrays.cavity_length, 7.25)
+        self.assertEqual(arrays.frequencies.tolist(), [point[0] for point in points])
+        self.assertEqual(arrays.powers.tolist(), [point[2] for point in points])
+        # the frequency axis is shared between calls
+        self.assertFalse(arrays.frequencies.flags['WRITEABLE'])
+
+    def test_plot_points_to_arrays(self):
+        sweeps = ascii_sweeps(2, 11)
+        arrays = self.convertor.make_plot_arrays(sweeps, 7.25, 3000, 3400)
+        points = self.convertor.make_plot_points(sweeps, 7.25, 3000, 3400)
+
+        from_points = self.convertor.plot_points_to_arrays(points)
+
+        self.assertIs(self.convertor.plot_points_to_arrays(arrays), arrays)
+        np.testing.assert_array_equal(from_points.frequencies, arrays.frequencies)
+        np.testing.assert_array_equal(from_points.powers, arrays.powers)
+        self.assertEqual(from_points.cavity_length, 7.25)
+
+    def test_power_list_to_str_matches_legacy(self):
+        power_list = legacy_power_list(ascii_sweeps(1, 401))
+
+        for cavity_length in [7.25, 7, 6.123456789]:
+            self.assertEqual(self.convertor.power_list_to_str(power_list, 4200.4, 400, cavity_length),
+                             legacy_power_str(power_list, 4200.4, 400, cavity_length))
+
+    def test_power_list_to_arrays(self):
+        power_list = legacy_power_list(ascii_sweeps(1, 401))
+
+        frequencies, powers = self.convertor.power_list_to_arrays(power_list, 4200.4, 400)
+        points = legacy_plot_points(power_list, 0, 4000, 4400)
+
+        self.assertEqual(frequencies.tolist(), [point[0] for point in points])
+        self.assertEqual(powers.tolist(), power_list)
+
+if __name__ == '__main__':
+    unittest.main()
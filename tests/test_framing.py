@@ -0,0 +1,163 @@
+import socket
+import threading
+import time
+import unittest
+
+import socket_communicators as sc
+
+class FramerTest(unittest.TestCase):
+
+    def test_terminator_framer(self):
+        framer = sc.TerminatorFramer(b'\n')
+
+        self.assertEqual(framer(b'7.5\r\n7.5'), 5)
+        self.assertEqual(framer(b'7.5'), 0)
+        self.assertEqual(framer(b''), 0)
+
+    def test_terminator_split_across_chunks(self):
+        framer = sc.TerminatorFramer(b'\r\n')
+        data = bytearray(b'7.5\r\n')
+
+        # the newest chunk starts with the second byte of the terminator
+        self.assertEqual(framer(data, len(data), 4), 5)
+        self.assertEqual(framer(data, 4, 0), 0)
+
+    def test_block_framer(self):
+        framer = sc.BlockFramer(b'\n')
+        block = b'#14abcd'
+
+        self.assertEqual(framer(block + b'\n'), len(block))
+        # the payload may contain the terminator
+        self.assertEqual(framer(b'#14a\nb'), 0)
+        self.assertEqual(framer(b'#14a\nbc\n'), 7)
+        for length in range(len(block)):
+            self.assertEqual(framer(block[:length]), 0, block[:length])
+
+    def test_block_framer_ascii_and_indefinite(self):
+        framer = sc.BlockFramer(b'\n')
+
+        self.assertEqual(framer(b'+1\n'), 3)
+        self.assertEqual(framer(b'+1'), 0)
+        self.assertEqual(framer(b'#0abc\n'), 6)
+
+    def test_length_framer(self):
+        framer = sc.LengthFramer(4)
+
+        self.assertEqual(framer(b'\x00\x01\x02'), 0)
+        self.assertEqual(framer(b'\x00\x01\x02\x03\x04'), 4)
+        self.assertEqual(framer(bytearray(8), 4), 4)
+
+class ReceiveBufferTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sock, self.far_sock = socket.socketpair()
+        self.addCleanup(self.sock.close)
+        self.addCleanup(self.far_sock.close)
+
+    def test_grows_and_keeps_contents(self):
+        recv_buffer = sc.ReceiveBuffer(size=16, min_free=8)
+        sent = bytes(range(256)) * 4
+
+        self.far_sock.sendall(sent)
+        while recv_buffer.length < len(sent):
+            recv_buffer.recv_into(self.sock)
+
+        self.assertEqual(bytes(recv_buffer.data()), sent)
+        self.assertGreaterEqual(len(recv_buffer.buffer), len(sent))
+
+    def test_next_frame_keeps_the_rest(self):
+        recv_buffer = sc.ReceiveBuffer()
+        self.far_sock.sendall(b'first\nsecond')
+        recv_buffer.recv_into(self.sock)
+
+        self.assertEqual(bytes(recv_buffer.data(6)), b'first\n')
+        self.assertEqual(recv_buffer.next_frame(), 6)
+        self.assertEqual(bytes(recv_buffer.data()), b'second')
+
+    def test_reset(self):
+        recv_buffer = sc.ReceiveBuffer()
+        self.far_sock.sendall(b'stale')
+        recv_buffer.recv_into(self.sock)
+
+        recv_buffer.reset()
+
+        self.assertEqual(recv_buffer.next_frame(), 0)
+        self.assertEqual(bytes(recv_buffer.data()), b'')
+
+class ReadBytesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sock, self.far_sock = socket.socketpair()
+        self.addCleanup(self.sock.close)
+        self.addCleanup(self.far_sock.close)
+
+        self.comm = sc.SocketComm()
+        self.comm.framer = sc.TerminatorFramer(b'\n')
+
+    def send_later(self, data, delay=0.05):
+        def send():
+            time.sleep(delay)
+            self.far_sock.sendall(data)
+        thread = threading.Thread(target=send)
+        thread.start()
+        self.addCleanup(thread.join)
+
+    def read(self, timeout=2, framer=None):
+        return bytes(self.comm._read_bytes(self.sock, timeout=timeout, framer=framer))
+
+    def test_split_frame(self):
+        self.far_sock.sendall(b'7.')
+        self.send_later(b'5\n')
+
+        start = time.time()
+        self.assertEqual(self.read(), b'7.5\n')
+        # returned as soon as the frame was complete, not after the timeout
+        self.assertLess(time.time() - start, 1.0)
+
+    def test_split_block(self):
+        framer = sc.BlockFramer(b'\n')
+        self.far_sock.sendall(b'#19ab')
+        self.send_later(b'cd\nefgh\n')
+
+        self.assertEqual(self.read(framer=framer), b'#19abcd\nefgh')
+
+    def test_coalesced_frames(self):
+        self.far_sock.sendall(b'7.5\r\n7.25\r\n7.')
+
+        self.assertEqual(self.read(), b'7.5\r\n')
+        self.assertEqual(self.read(), b'7.25\r\n')
+
+        # the partial frame kept from the first chunk is completed by the next one
+        self.send_later(b'125\r\n')
+        self.assertEqual(self.read(), b'7.125\r\n')
+
+    def test_unframed_read_waits_for_quiet(self):
+        self.comm.framer = None
+        self.far_sock.sendall(b'a\nb')
+        self.send_later(b'c', 0.05)
+
+        self.assertEqual(self.read(timeout=0.3), b'a\nbc')
+
+    def test_incomplete_frame_returns_what_arrived(self):
+        self.far_sock.sendall(b'7.5')
+
+        self.assertEqual(self.read(timeout=0.1), b'7.5')
+
+    def test_flush_input_resets_the_buffer(self):
+        self.far_sock.sendall(b'old\nleft over')
+        self.assertEqual(self.read(), b'old\n')
+
+        self.far_sock.sendall(b'waiting\n')
+        time.sleep(0.05)
+        self.comm._flush_input(self.sock)
+
+        self.far_sock.sendall(b'new\n')
+        self.assertEqual(self.read(), b'new\n')
+
+    def test_read_data_decodes(self):
+        self.far_sock.sendall(b'7.5\r\n')
+
+        self.assertEqual(self.comm._read_data(self.sock), '7.5\r\n')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+
+import numpy as np
+
+import data_processors as procs
+
+NWA_POINTS = 401
+FREQ_WINDOW = 10.0
+
+def make_windows(num_windows, quality_factor, noise_db=0.0, seed=0):
+    """
+    Returns:
+        (windows, window_centers, true_centers) with one Lorentzian peak in dBm per row
+    """
+    rng = np.random.RandomState(seed)
+    
+    window_centers = rng.uniform(3000, 6000, num_windows).round()
+    true_centers = window_centers + rng.uniform(-0.5, 0.5, num_windows)
+    hwhm = true_centers / (2 * quality_factor)
+    
+    x = (window_centers[:, np.newaxis] - FREQ_WINDOW / 2
+         + FREQ_WINDOW * np.arange(NWA_POINTS) / NWA_POINTS)
+    shape = hwhm[:, np.newaxis] ** 2 / ((x - true_centers[:, np.newaxis]) ** 2 + hwhm[:, np.newaxis] ** 2)
+    windows = 10 * np.log10(1e-3 * shape) + rng.normal(0, noise_db, x.shape)
+    
+    return windows, window_centers, true_centers
+
+def quiet(fitter):
+    fitter.print_blue = fitter.print_purple = lambda *args: None
+    return fitter
+
+class NouveauLorentzianFitterTest(unittest.TestCase):
+    
+    def test_center_is_max_power_frequency(self):
+        windows, window_centers, _ = make_windows(20, 10000, noise_db=0.05)
+        fitter = quiet(procs.NouveauLorentzianFitter())
+        
+        bin_width = FREQ_WINDOW / NWA_POINTS
+        for window, center in zip(windows, window_centers):
+            quality_factor, frequency, hwhm = fitter(window.tolist(), center, FREQ_WINDOW)
+            
+            expected = center - FREQ_WINDOW / 2 + bin_width * np.argmax(window)
+            self.assertAlmostEqual(frequency, expected, places=9)
+            self.assertAlmostEqual(quality_factor, frequency / (2 * hwhm))
+    
+    def test_interpolated_width(self):
+        windows, window_centers, true_centers = make_windows(20, 10000)
+        
+        results = procs.NouveauLorentzianFitter().fit_batch(windows, window_centers, FREQ_WINDOW)
+        
+        # the crossings are interpolated, so the width is much finer than a bin
+        np.testing.assert_allclose(results[:, 2], true_centers / 20000, rtol=0.01)
+    
+    def test_batch_matches_single(self):
+        windows, window_centers, _ = make_windows(10, 5000, noise_db=0.05)
+        fitter = quiet(procs.NouveauLorentzianFitter())
+        
+        single = [fitter(window.tolist(), center, FREQ_WINDOW) for window, center in zip(windows, window_centers)]
+        
+        np.testing.assert_allclose(fitter.fit_batch(windows, window_centers, FREQ_WINDOW), single)
+
+class LorentzianFitterTest(unittest.TestCase):
+    
+    def test_recovers_exact_lorentzian(self):
+        for quality_factor in (5000, 20000):
+            windows, window_centers, true_centers = make_windows(10, quality_factor)
+            
+            results = procs.LorentzianFitter().fit_batch(windows, window_centers, FREQ_WINDOW)
+            
+            np.testing.assert_allclose(results[:, 0], quality_factor, rtol=1e-6)
+            np.testing.assert_allclose(results[:, 1], true_centers, atol=1e-6)
+    
+    def test_noisy_fit_beats_half_power_points(self):
+        windows, window_centers, true_centers = make_windows(50, 10000, noise_db=0.05, seed=1)
+        
+        fitted = procs.LorentzianFitter().fit_batch(windows, window_centers, FREQ_WINDOW)
+        half_power = procs.NouveauLorentzianFitter().fit_batch(windows, window_centers, FREQ_WINDOW)
+        
+        self.assertLess(np.median(np.abs(fitted[:, 0] / 10000 - 1)), 0.01)
+        self.assertLess(np.median(np.abs(fitted[:, 1] - true_centers)),
+                        np.median(np.abs(half_power[:, 1] - true_centers)))
+    
+    def test_batch_matches_single(self):
+        windows, window_centers, _ = make_windows(5, 10000, noise_db=0.05)
+        fitter = quiet(procs.LorentzianFitter())
+        
+        single = [fitter(window.tolist(), center, FREQ_WINDOW) for window, center in zip(windows, window_centers)]
+        
+        np.testing.assert_allclose(fitter.fit_batch(windows, window_centers, FREQ_WINDOW), single)
+    
+    def test_fit_stays_within_bounds(self):
+        # a flat window has no peak to fit
+        windows = np.full((1, NWA_POINTS), -40.0)
+        
+        hwhm, center = procs.LorentzianFitter().fit_batch(windows, 4000.0, FREQ_WINDOW)[0, [2, 1]]
+        
+        self.assertTrue(0 <= hwhm <= FREQ_WINDOW)
+        self.assertTrue(4000.0 - FREQ_WINDOW <= center <= 4000.0 + FREQ_WINDOW)
+
+if __name__ == '__main__':
+    unittest.main()
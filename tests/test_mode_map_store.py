@@ -0,0 +1,120 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import data_processors as procs
+
+class ModeMapStoreTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, 'map')
+        self.frequencies = np.linspace(3000.0, 3100.0, 11)
+        self.lengths = [7.5, 7.0, 8.0, 7.25]
+        self.powers = np.arange(len(self.lengths) * 11, dtype=np.float32).reshape(-1, 11)
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def fill(self, store, sweeps):
+        for index in sweeps:
+            store.append(self.frequencies, self.powers[index], self.lengths[index])
+    
+    def test_round_trip(self):
+        store = procs.ModeMapStore(self.directory)
+        self.fill(store, range(4))
+        
+        self.assertEqual(len(store), 4)
+        np.testing.assert_array_equal(store.grid_view(), self.powers)
+        np.testing.assert_array_equal(store.cavity_lengths(), self.lengths)
+        
+        lengths, frequencies, powers = store.window(3020.0, 3050.0, slice(1, 3))
+        np.testing.assert_array_equal(lengths, self.lengths[1:3])
+        np.testing.assert_array_equal(frequencies, self.frequencies[2:6])
+        np.testing.assert_array_equal(powers, self.powers[1:3, 2:6])
+        store.close()
+    
+    def test_resume(self):
+        store = procs.ModeMapStore(self.directory)
+        self.fill(store, range(2))
+        store.close()
+        
+        store = procs.ModeMapStore(self.directory)
+        self.assertEqual(len(store), 2)
+        self.fill(store, range(2, 4))
+        store.close()
+        
+        store = procs.ModeMapStore(self.directory)
+        np.testing.assert_array_equal(store.frequencies, self.frequencies)
+        np.testing.assert_array_equal(store.grid_view(), self.powers)
+        np.testing.assert_array_equal(store.cavity_lengths(), self.lengths)
+        store.close()
+    
+    def test_resume_drops_interrupted_sweep(self):
+        store = procs.ModeMapStore(self.directory)
+        self.fill(store, range(2))
+        # powers written, but not the length
+        store.powers.append(self.powers[2])
+        store.close()
+        
+        store = procs.ModeMapStore(self.directory)
+        self.assertEqual(len(store), 2)
+        self.fill(store, [3])
+        np.testing.assert_array_equal(store.grid_view(), self.powers[[0, 1, 3]])
+        store.close()
+    
+    def test_nearest_sweep(self):
+        store = procs.ModeMapStore(self.directory)
+        self.fill(store, range(4))
+        
+        # lengths are 7.5, 7.0, 8.0 and 7.25
+        self.assertEqual(store.nearest_sweep(6.0), 1)
+        self.assertEqual(store.nearest_sweep(7.1), 1)
+        self.assertEqual(store.nearest_sweep(7.2), 3)
+        self.assertEqual(store.nearest_sweep(7.5), 0)
+        self.assertEqual(store.nearest_sweep(9.0), 2)
+        
+        # the length index is updated by appends
+        store.append(self.frequencies, self.powers[0], 7.6)
+        self.assertEqual(store.nearest_sweep(7.59), 4)
+        
+        length, frequencies, powers = store.nearest(7.3, 3000.0, 3010.0)
+        self.assertEqual(length, 7.25)
+        np.testing.assert_array_equal(frequencies, self.frequencies[:2])
+        np.testing.assert_array_equal(powers, self.powers[3, :2])
+        store.close()
+    
+    def test_empty_map(self):
+        store = procs.ModeMapStore(self.directory)
+        
+        self.assertEqual(len(store), 0)
+        with self.assertRaises(IndexError):
+            store.nearest_sweep(7.0)
+    
+    def test_other_frequencies_rejected(self):
+        store = procs.ModeMapStore(self.directory)
+        self.fill(store, [0])
+        
+        with self.assertRaises(ValueError):
+            store.append(self.frequencies + 1.0, self.powers[1], 7.0)
+        store.close()
+    
+    def test_import_mode_map(self):
+        csv_path = os.path.join(self.tmp.name, 'map.csv')
+        with open(csv_path, 'w') as out_file:
+            for index in range(4):
+                for frequency, power in zip(self.frequencies, self.powers[index]):
+                    print(str(frequency) + "," + str(self.lengths[index]) + "," + str(power), file=out_file)
+            # incomplete last sweep
+            print("3000.0,9.0,-40.0", file=out_file)
+        
+        store = procs.import_mode_map(csv_path, self.directory, len(self.frequencies))
+        
+        np.testing.assert_array_equal(store.grid_view(), self.powers)
+        np.testing.assert_array_equal(store.cavity_lengths(), self.lengths)
+        store.close()
+
+if __name__ == '__main__':
+    unittest.main()
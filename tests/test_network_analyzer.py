@@ -0,0 +1,73 @@
+import socket
+import unittest
+from unittest import mock
+
+import socket_communicators as sc
+
+class ShadowStateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.nwa_sock, self.far_sock = socket.socketpair()
+        self.addCleanup(self.nwa_sock.close)
+        self.addCleanup(self.far_sock.close)
+
+        # skip the settling delays
+        patcher = mock.patch.object(sc.time, 'sleep')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.nwa_comm = sc.NetworkAnalyzerComm(self.nwa_sock, 401, 400, 0)
+
+        # record every batch instead of sending it
+        self.batches = []
+        self.nwa_comm._send_command_long = lambda sock, cmd: self.batches.append(cmd.split("\n"))
+
+    def commands(self):
+        return [cmd for batch in self.batches for cmd in batch]
+
+    def test_unchanged_settings_are_skipped(self):
+        self.nwa_comm.set_freq_window(5000, 400)
+        self.assertIn("CF 5000MZ", self.commands())
+        # the span was already set by the constructor
+        self.assertNotIn("DF 400MZ", self.commands())
+
+        self.batches = []
+        self.nwa_comm.set_freq_window(5000, 400)
+        self.assertEqual(self.commands(), ["++addr 17", "++addr 16"])
+
+        self.batches = []
+        self.nwa_comm.set_freq_window(5100, 400)
+        self.assertEqual(self.commands(), ["++addr 17", "CF 5100MZ", "++addr 16"])
+
+    def test_commands_for_one_address_are_batched(self):
+        self.nwa_comm.turn_off_RF_source()
+
+        self.assertEqual(self.batches, [["++addr 17", "RF0"], ["++addr 16"]])
+
+    def test_settings_are_kept_per_address(self):
+        self.nwa_comm.turn_off_RF_source()
+        self.nwa_comm.turn_on_RF_source()
+
+        self.assertEqual(self.commands().count("RF0"), 1)
+        self.assertEqual(self.commands().count("RF1"), 1)
+
+    def test_reset_shadow_state(self):
+        self.nwa_comm.set_freq_window(5000, 400)
+        self.nwa_comm.reset_shadow_state()
+
+        self.batches = []
+        self.nwa_comm.set_freq_window(5000, 400)
+
+        self.assertEqual(self.commands(), ["PT19", "++addr 17", "CF 5000MZ", "DF 400MZ", "++addr 16"])
+
+    def test_command_counts(self):
+        self.nwa_comm.report_command_counts()
+        self.nwa_comm.set_freq_window(5000, 400)
+        self.nwa_comm.set_freq_window(5000, 400)
+
+        # PT19 and DF on both calls, CF on the second
+        self.assertEqual(self.nwa_comm.commands_skipped, 5)
+        self.assertEqual(self.nwa_comm.commands_sent, len(self.commands()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import data_processors as procs
+
+class NpySegmentTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'segment.npy')
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_readable_after_every_append(self):
+        segment = procs.NpySegment(self.path, np.float32, (3,), max_rows=10)
+        rows = np.arange(12, dtype=np.float32).reshape(4, 3)
+        
+        for count in range(1, 5):
+            segment.append(rows[count - 1])
+            np.testing.assert_array_equal(np.load(self.path), rows[:count])
+        
+        segment.close()
+    
+    def test_resume_keeps_rows(self):
+        segment = procs.NpySegment(self.path, np.float64, (), max_rows=10)
+        segment.append(np.array([1.0, 2.0]))
+        segment.close()
+        
+        segment = procs.NpySegment(self.path, np.float64, (), max_rows=10, resume=True)
+        self.assertEqual(segment.rows, 2)
+        segment.append(3.0)
+        segment.close()
+        
+        np.testing.assert_array_equal(np.load(self.path), [1.0, 2.0, 3.0])
+    
+    def test_resume_rejects_other_shape(self):
+        procs.NpySegment(self.path, np.float32, (3,), max_rows=10).close()
+        
+        with self.assertRaises(ValueError):
+            procs.NpySegment(self.path, np.float32, (4,), max_rows=10, resume=True)
+
+class RunArchiveTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, 'archive')
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_round_trip(self):
+        rng = np.random.RandomState(0)
+        spectra = rng.rand(7, 16).astype(np.float32)
+        config = {'nwa_span': 400, 'start_length': 7.25}
+        
+        archive = procs.RunArchive(self.directory, config, chunk_size=3)
+        for index, spectrum in enumerate(spectra):
+            count = archive.append(spectrum, {'Q': 1000.0 + index, 'cavity_length': 7.0 + index})
+            self.assertEqual(count, index + 1)
+        archive.close()
+        
+        loaded, metadata, loaded_config = procs.load_run_archive(self.directory)
+        
+        self.assertEqual([len(segment) for segment in loaded], [3, 3, 1])
+        np.testing.assert_array_equal(np.concatenate(loaded), spectra)
+        np.testing.assert_array_equal(metadata['iteration'], np.arange(7))
+        np.testing.assert_array_equal(metadata['Q'], 1000.0 + np.arange(7))
+        np.testing.assert_array_equal(metadata['cavity_length'], 7.0 + np.arange(7))
+        self.assertEqual(loaded_config, config)
+    
+    def test_memory_mapped_load(self):
+        archive = procs.RunArchive(self.directory)
+        archive.append(np.ones(8))
+        archive.close()
+        
+        spectra, metadata, config = procs.load_run_archive(self.directory, mmap_mode='r')
+        
+        self.assertIsInstance(spectra[0], np.memmap)
+        np.testing.assert_array_equal(spectra[0], np.ones((1, 8)))
+        self.assertEqual(len(metadata), 1)
+        self.assertIsNone(config)
+    
+    def test_given_iteration_is_recorded(self):
+        archive = procs.RunArchive(self.directory)
+        archive.append(np.zeros(4), iteration=12)
+        archive.append(np.zeros(4))
+        archive.close()
+        
+        _, metadata, _ = procs.load_run_archive(self.directory)
+        
+        np.testing.assert_array_equal(metadata['iteration'], [12, 1])
+    
+    def test_new_segment_when_spectrum_or_fields_change(self):
+        archive = procs.RunArchive(self.directory, chunk_size=10)
+        archive.append(np.zeros(4), {'Q': 1.0, 'hwhm': 0.5})
+        archive.append(np.zeros(6), {'Q': 2.0, 'hwhm': 0.5})
+        archive.append(np.zeros(6), {'Q': 3.0})
+        archive.close()
+        
+        spectra, metadata, _ = procs.load_run_archive(self.directory)
+        
+        self.assertEqual([segment.shape for segment in spectra], [(1, 4), (1, 6), (1, 6)])
+        # only the fields found in every segment are kept
+        self.assertEqual(metadata.dtype.names, ('iteration', 'timestamp', 'Q'))
+        np.testing.assert_array_equal(metadata['Q'], [1.0, 2.0, 3.0])
+    
+    def test_reopened_archive_keeps_segments(self):
+        archive = procs.RunArchive(self.directory)
+        archive.append(np.zeros(4))
+        archive.close()
+        
+        archive = procs.RunArchive(self.directory)
+        archive.append(np.ones(4))
+        archive.close()
+        
+        spectra, _, _ = procs.load_run_archive(self.directory)
+        
+        np.testing.assert_array_equal(np.concatenate(spectra), [np.zeros(4), np.ones(4)])
+    
+    def test_empty_archive(self):
+        procs.RunArchive(self.directory).close()
+        
+        spectra, metadata, _ = procs.load_run_archive(self.directory)
+        
+        self.assertEqual(spectra, [])
+        self.assertEqual(len(metadata), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import data_processors as procs
+
+def header(q, frequency, length, iteration=None):
+    
+    text = "Q;" + str(q) + "\n"
+    text += "actual_center_freq;" + str(frequency) + "\n"
+    text += "fitted_hwhm;0.25\n"
+    text += "cavity_length;" + str(length) + "\n"
+    if iteration is not None:
+        text += "iteration;" + str(iteration) + "\n"
+    
+    return text
+
+class RunCatalogTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+        self.catalog = procs.RunCatalog(os.path.join(self.root, 'catalog.sqlite'))
+        self.spectra = {}
+    
+    def tearDown(self):
+        self.catalog.close()
+        self.tmp.cleanup()
+    
+    def run_folder(self, name):
+        directory = os.path.join(self.root, name)
+        os.makedirs(directory)
+        return directory
+    
+    def spectrum(self, run, iteration, points=32):
+        spectrum = np.random.RandomState(len(self.spectra)).rand(points).astype(np.float32)
+        self.spectra[(run, iteration)] = spectrum
+        return spectrum
+    
+    def write_existing_runs(self):
+        """
+        Run folders as left by DigitizerSaver and ArchiveSaver, without a catalog.
+        """
+        
+        # raw and formatted text, as written before the iteration was added to headers
+        run = '00:00:10_01.06.2017'
+        directory = self.run_folder(run)
+        for number in range(2):
+            spectrum = self.spectrum(run, number)
+            with open(os.path.join(directory, 'SA_R' + str(number) + '.csv'), 'w') as out_file:
+                print(header(1000 + number, 4000.0, 7.0), file=out_file)
+                print(','.join(spectrum.astype(str)), file=out_file)
+            with open(os.path.join(directory, 'SA_F' + str(number) + '.csv'), 'w') as out_file:
+                print(header(1000 + number, 4000.0, 7.0), file=out_file)
+                print("\n".join(spectrum.astype(str)), file=out_file)
+        
+        # formatted text only, with the iteration in the header
+        run = '00:00:11_01.06.2017'
+        directory = self.run_folder(run)
+        spectrum = self.spectrum(run, 4)
+        with open(os.path.join(directory, 'SA_F0.csv'), 'w') as out_file:
+            print(header(2000, 4100.0, 7.1, iteration=4), file=out_file)
+            print("\n".join(spectrum.astype(str)), file=out_file)
+        
+        # compressed stream
+        run = '00:00:12_01.06.2017'
+        directory = self.run_folder(run)
+        stream = procs.SpectrumStreamWriter(os.path.join(directory, 'SA.spectra'))
+        for iteration in (3, 5):
+            stream.append(self.spectrum(run, iteration), header(3000 + iteration, 4200.0, 7.2, iteration))
+        stream.close()
+        
+        # binary archive
+        run = '00:00:13_01.06.2017'
+        directory = self.run_folder(run)
+        archive = procs.RunArchive(os.path.join(directory, 'archive'), chunk_size=2)
+        for iteration in (0, 2, 6):
+            metadata = procs._parse_data_header(header(4000 + iteration, 4300.0, 7.3))
+            archive.append(self.spectrum(run, iteration), metadata, iteration)
+        archive.close()
+    
+    def test_rebuild_existing_runs(self):
+        self.write_existing_runs()
+        
+        self.assertEqual(self.catalog.rebuild(), 8)
+        records = self.catalog.query()
+        
+        self.assertEqual([(record['run'], record['iteration'], record['format']) for record in records],
+                         [('00:00:10_01.06.2017', 0, 'R'), ('00:00:10_01.06.2017', 1, 'R'),
+                          ('00:00:11_01.06.2017', 4, 'F'),
+                          ('00:00:12_01.06.2017', 3, 'Z'), ('00:00:12_01.06.2017', 5, 'Z'),
+                          ('00:00:13_01.06.2017', 0, 'A'), ('00:00:13_01.06.2017', 2, 'A'),
+                          ('00:00:13_01.06.2017', 6, 'A')])
+        np.testing.assert_array_equal(records['q'], [1000, 1001, 2000, 3003, 3005, 4000, 4002, 4006])
+        np.testing.assert_array_equal(records['cavity_length'], [7.0, 7.0, 7.1, 7.2, 7.2, 7.3, 7.3, 7.3])
+        self.assertTrue(np.all(records['hwhm'] == 0.25))
+        self.assertTrue(np.all(records['run_time'][1:] > records['run_time'][:-1] - 1))
+        
+        for record in records:
+            np.testing.assert_allclose(self.catalog.load(record),
+                                       self.spectra[(record['run'], record['iteration'])], rtol=1e-6)
+    
+    def test_rebuild_replaces_contents(self):
+        self.write_existing_runs()
+        self.catalog.rebuild()
+        
+        for name in os.listdir(os.path.join(self.root, '00:00:10_01.06.2017')):
+            os.remove(os.path.join(self.root, '00:00:10_01.06.2017', name))
+        
+        self.assertEqual(self.catalog.rebuild(), 6)
+        self.assertEqual(len(self.catalog.query(run='00:00:10_01.06.2017')), 0)
+    
+    def test_query_limits(self):
+        self.write_existing_runs()
+        self.catalog.rebuild()
+        
+        records = self.catalog.query(min_frequency=4100.0, max_frequency=4200.0, min_q=3004)
+        self.assertEqual(list(records['q']), [3005])
+        
+        records = self.catalog.query(max_length=7.05)
+        self.assertEqual(list(records['iteration']), [0, 1])
+    
+    def test_missing_header_values_are_nan(self):
+        run = '00:00:10_01.06.2017'
+        directory = self.run_folder(run)
+        with open(os.path.join(directory, 'SA_R0.csv'), 'w') as out_file:
+            print("Q;1000\n", file=out_file)
+            print(','.join(self.spectrum(run, 0).astype(str)), file=out_file)
+        
+        self.catalog.rebuild()
+        record = self.catalog.query()[0]
+        
+        self.assertEqual(record['q'], 1000)
+        self.assertTrue(np.isnan(record['center_frequency']))
+        np.testing.assert_allclose(self.catalog.load(record), self.spectra[(run, 0)], rtol=1e-6)
+    
+    def test_saved_spectra_match_rebuild(self):
+        # savers make their run folder relative to data_processors.py
+        module_dir = os.path.dirname(os.path.realpath(procs.__file__))
+        
+        for sa_type in ('R', 'R+F', 'Z', 'archive'):
+            # every saver here makes a run folder with the same time stamp, so each
+            # gets its own catalog
+            directory = os.path.join(self.root, sa_type.replace('+', ''))
+            catalog = procs.RunCatalog(os.path.join(directory, 'catalog.sqlite'))
+            root_dir = os.path.relpath(directory, module_dir)
+            
+            if sa_type == 'archive':
+                saver = procs.ArchiveSaver(root_dir, catalog=catalog)
+            else:
+                saver = procs.DigitizerSaver(root_dir, sa_type, catalog=catalog)
+            for iteration in (1, 4, 6):
+                saver(','.join(self.spectrum(sa_type, iteration).astype(str)),
+                      header(1000 + iteration, 4000.0, 7.0), iteration)
+            saver.close()
+            
+            saved = catalog.query()
+            self.assertEqual(list(saved['iteration']), [1, 4, 6], sa_type)
+            self.assertEqual(list(saved['q']), [1001, 1004, 1006], sa_type)
+            for record in saved:
+                np.testing.assert_allclose(catalog.load(record), self.spectra[(sa_type, record['iteration'])],
+                                           rtol=1e-6)
+            
+            self.assertEqual(catalog.rebuild(), 3)
+            rebuilt = catalog.query()
+            for name in ('run', 'iteration', 'q', 'file', 'offset', 'format'):
+                self.assertEqual(list(rebuilt[name]), list(saved[name]), sa_type + " " + name)
+            catalog.close()
+
+if __name__ == '__main__':
+    unittest.main()
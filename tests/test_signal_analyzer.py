@@ -0,0 +1,121 @@
+import socket
+import struct
+import threading
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import socket_communicators as sc
+
+def block(values):
+    payload = np.asarray(values, dtype='>f4').tobytes()
+    length = str(len(payload)).encode()
+    return b'#' + str(len(length)).encode() + length + payload
+
+class FakeSignalAnalyzer:
+    """
+    Answers *ESR? with 'operation complete' and every :FETC:SPEC7? with the
+    next scripted response, on the far end of a socketpair.
+    """
+
+    def __init__(self, sock, responses):
+        self.sock = sock
+        self.responses = list(responses)
+        self.fetches = 0
+        self.thread = threading.Thread(target=self.__serve, daemon=True)
+        self.thread.start()
+
+    def __serve(self):
+        pending = b''
+        while True:
+            data = self.sock.recv(4096)
+            if not data:
+                return
+            pending += data
+            while b'\n' in pending:
+                command, pending = pending.split(b'\n', 1)
+                if command == b'*ESR?':
+                    self.sock.sendall(b'+1\n')
+                elif command == b':FETC:SPEC7?':
+                    self.fetches += 1
+                    response = self.responses.pop(0) if self.responses else b''
+                    if response:
+                        self.sock.sendall(response)
+
+class SignalAnalyzerFetchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sa_sock, far_sock = socket.socketpair()
+        self.addCleanup(self.sa_sock.close)
+        self.addCleanup(far_sock.close)
+        self.far_sock = far_sock
+
+        self.comm = sc.SignalAnalyzerComm(self.sa_sock)
+        self.comm.FETCH_TIMEOUT = 0.2
+
+        # skip the one second pause between fetches
+        patcher = mock.patch.object(sc.time, 'sleep')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def take(self, responses):
+        self.fake = FakeSignalAnalyzer(self.far_sock, responses)
+        return self.comm.take_data_signal_analyzer()
+
+    def test_complete_block(self):
+        values = [-90.0, -85.5, -80.25, 1.0]
+
+        spectrum = self.take([block(values) + b'\n'])
+
+        np.testing.assert_array_equal(spectrum, np.array(values, dtype=np.float32))
+        self.assertEqual(self.fake.fetches, 1)
+
+    def test_short_block_is_fetched_again(self):
+        values = [-90.0, -85.5, -80.25, 1.0]
+        short = block(values)[:-6]
+
+        spectrum = self.take([short, block(values) + b'\n'])
+
+        np.testing.assert_array_equal(spectrum, np.array(values, dtype=np.float32))
+        self.assertEqual(self.fake.fetches, 2)
+
+    def test_empty_response_is_fetched_again(self):
+        values = [-70.0, -71.0]
+
+        spectrum = self.take([b'', block(values) + b'\n'])
+
+        np.testing.assert_array_equal(spectrum, np.array(values, dtype=np.float32))
+        self.assertEqual(self.fake.fetches, 2)
+
+    def test_gives_up_after_retries(self):
+        with self.assertRaises(IOError):
+            self.take([])
+
+        self.assertEqual(self.fake.fetches, self.comm.FETCH_RETRIES + 1)
+
+    def test_ascii_response(self):
+        spectrum = self.take([b'-90.5,-80.25,-70\n'])
+
+        np.testing.assert_array_equal(spectrum, np.array([-90.5, -80.25, -70], dtype=np.float32))
+
+class ParseSpectrumTest(unittest.TestCase):
+
+    def setUp(self):
+        self.comm = sc.SignalAnalyzerComm(None)
+
+    def test_rejects_truncated_responses(self):
+        full = block([1.0, 2.0, 3.0])
+
+        for data in [b'', b'#', b'#3', b'#31', full[:-1], full[:-4], b'-90.5,-80']:
+            with self.assertRaises(ValueError, msg=repr(data)):
+                self.comm._parse_spectrum(data)
+
+    def test_rejects_partial_float(self):
+        data = b'#15' + struct.pack('>f', 1.0) + b'\x00'
+
+        with self.assertRaises(ValueError):
+            self.comm._parse_spectrum(data)
+
+if __name__ == '__main__':
+    unittest.main()
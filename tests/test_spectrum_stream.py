@@ -0,0 +1,110 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import data_processors as procs
+
+FILTERS = [0, procs.SPECTRUM_DELTA, procs.SPECTRUM_SHUFFLE, procs.SPECTRUM_DELTA | procs.SPECTRUM_SHUFFLE]
+
+def spectra():
+    rng = np.random.RandomState(0)
+    
+    noise = rng.normal(-90.0, 2.0, 1001).astype(np.float32)
+    smooth = (-80.0 + 10.0 * np.sin(np.linspace(0.0, 6.0, 512))).astype(np.float32)
+    special = np.array([0.0, -0.0, np.inf, -np.inf, np.nan, 1e-45, -3.4e38, 1.0], dtype=np.float32)
+    
+    return [noise, smooth, special, np.zeros(0, dtype=np.float32)]
+
+class SpectrumCodingTest(unittest.TestCase):
+    
+    def test_round_trip_is_exact(self):
+        for codec in procs.SPECTRUM_CODECS.values():
+            for filters in FILTERS:
+                for spectrum in spectra():
+                    payload = procs._encode_spectrum(spectrum, filters, codec, None)
+                    decoded = procs._decode_spectrum(payload, len(spectrum), filters, codec)
+                    
+                    # compare bit patterns, so that NaN and -0.0 have to match too
+                    np.testing.assert_array_equal(decoded.view('<u4'), spectrum.view('<u4'),
+                                                  "filters " + str(filters) + ", codec " + str(codec))
+    
+    def test_float64_input_is_stored_as_float32(self):
+        spectrum = np.linspace(-90.0, -80.0, 100)
+        
+        payload = procs._encode_spectrum(spectrum, procs.SPECTRUM_SHUFFLE, procs.SPECTRUM_CODECS['zlib'], 1)
+        decoded = procs._decode_spectrum(payload, len(spectrum), procs.SPECTRUM_SHUFFLE, procs.SPECTRUM_CODECS['zlib'])
+        
+        np.testing.assert_array_equal(decoded, spectrum.astype(np.float32))
+    
+    def test_uncompressed_payload_size(self):
+        spectrum = spectra()[0]
+        
+        for filters in FILTERS:
+            payload = procs._encode_spectrum(spectrum, filters, procs.SPECTRUM_CODECS['none'], None)
+            self.assertEqual(len(payload), 4 * len(spectrum))
+
+class SpectrumStreamTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'SA.spectra')
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def write(self, **kwargs):
+        writer = procs.SpectrumStreamWriter(self.path, **kwargs)
+        offsets = [writer.append(spectrum, "index;" + str(index)) for index, spectrum in enumerate(spectra())]
+        writer.close()
+        return offsets
+    
+    def check(self, reader):
+        self.assertEqual(len(reader), len(spectra()))
+        for index, spectrum in enumerate(spectra()):
+            np.testing.assert_array_equal(reader[index].view('<u4'), spectrum.view('<u4'))
+            self.assertEqual(reader.header(index), "index;" + str(index))
+    
+    def test_round_trip(self):
+        for codec in procs.SPECTRUM_CODECS:
+            for delta in (False, True):
+                for shuffle in (False, True):
+                    for path in (self.path, self.path + '.idx'):
+                        if os.path.exists(path):
+                            os.remove(path)
+                    
+                    offsets = self.write(codec=codec, delta=delta, shuffle=shuffle)
+                    
+                    reader = procs.SpectrumStreamReader(self.path)
+                    np.testing.assert_array_equal(reader.offsets, offsets)
+                    self.check(reader)
+                    reader.close()
+    
+    def test_appends_to_existing_stream(self):
+        self.write()
+        self.write(codec='lzma')
+        
+        reader = procs.SpectrumStreamReader(self.path)
+        self.assertEqual(len(reader), 2 * len(spectra()))
+        np.testing.assert_array_equal(reader[len(spectra())], spectra()[0])
+        reader.close()
+    
+    def test_scan_without_index(self):
+        self.write()
+        os.remove(self.path + '.idx')
+        
+        # a record cut short by a crash is ignored
+        with open(self.path, 'ab') as out_file:
+            out_file.write(procs._SPECTRUM_RECORD.pack(b'SPEC', 1, 0, 0, 0, 100, 0, 400) + bytes(10))
+        
+        reader = procs.SpectrumStreamReader(self.path)
+        self.check(reader)
+        reader.close()
+    
+    def test_unknown_codec(self):
+        with self.assertRaises(ValueError):
+            procs.SpectrumStreamWriter(self.path, codec='bz2')
+
+if __name__ == '__main__':
+    unittest.main()
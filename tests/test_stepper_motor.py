@@ -0,0 +1,140 @@
+import math
+import socket
+import threading
+import time
+import unittest
+
+import socket_communicators as sc
+
+class FakeDrive:
+    """
+    Records the SCL commands sent to it and reports the motor as moving for
+    the first 'moving_polls' status requests, on a local TCP port.
+    """
+
+    def __init__(self, moving_polls=0):
+        self.server = socket.socket()
+        self.server.bind(('127.0.0.1', 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+
+        self.commands = []
+        self.connections = 0
+        self.moving_polls = moving_polls
+        self.conn = None
+
+        self.thread = threading.Thread(target=self.__serve, daemon=True)
+        self.thread.start()
+
+    def __serve(self):
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            self.conn = conn
+            self.connections += 1
+
+            pending = b''
+            while True:
+                try:
+                    data = conn.recv(4096)
+                except OSError:
+                    break
+                if not data:
+                    break
+                pending += data
+                while b'\r' in pending:
+                    command, pending = pending.split(b'\r', 1)
+                    command = command.lstrip(b'\0\a').decode()
+                    self.commands.append(command)
+                    if command == 'SC':
+                        moving = self.moving_polls > 0
+                        self.moving_polls -= 1
+                        conn.sendall(b'SC=0019\r' if moving else b'SC=0009\r')
+            conn.close()
+
+    def drop_connection(self):
+        self.conn.shutdown(socket.SHUT_RDWR)
+
+    def close(self):
+        self.server.close()
+        if self.conn is not None:
+            self.conn.close()
+
+class PredictMoveTimeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.step_comm = sc.StepperMotorComm(['127.0.0.1', 0])
+
+    def test_trapezoidal_profile(self):
+        # one second each to speed up and slow down, covering one revolution,
+        # then eight revolutions at full speed
+        self.assertAlmostEqual(self.step_comm.predict_move_time(10, 2), 6.0)
+
+    def test_triangular_profile(self):
+        # too short to reach full speed, peaks at sqrt(2) rev/s
+        self.assertAlmostEqual(self.step_comm.predict_move_time(1, 2), math.sqrt(2))
+
+    def test_profiles_meet(self):
+        ramp_distance = 2.0
+        below = self.step_comm.predict_move_time(ramp_distance - 1e-9, 2)
+        above = self.step_comm.predict_move_time(ramp_distance + 1e-9, 2)
+
+        self.assertAlmostEqual(below, above, places=6)
+
+    def test_direction_and_zero(self):
+        self.assertEqual(self.step_comm.predict_move_time(-10, 2), self.step_comm.predict_move_time(10, 2))
+        self.assertEqual(self.step_comm.predict_move_time(0, 2), 0.0)
+
+class MoveTest(unittest.TestCase):
+
+    def start(self, moving_polls=0):
+        self.drive = FakeDrive(moving_polls)
+        self.addCleanup(self.drive.close)
+
+        self.step_comm = sc.StepperMotorComm(['127.0.0.1', self.drive.port])
+        self.addCleanup(self.step_comm.close)
+
+    def wait_for_commands(self, count):
+        deadline = time.time() + 2
+        while len(self.drive.commands) < count and time.time() < deadline:
+            time.sleep(0.01)
+        return self.drive.commands
+
+    def test_profile_is_only_sent_when_it_changes(self):
+        self.start()
+
+        move_time = self.step_comm.move(10, 2, wait=False)
+        self.step_comm.move(-1, 2, wait=False)
+        self.step_comm.move(1, 3, wait=False)
+
+        self.assertEqual(move_time, self.step_comm.predict_move_time(10, 2))
+        self.assertEqual(self.wait_for_commands(9), ["MR0", "AC2", "DE2", "VE2", "FL2000", "FL-200",
+                                                     "AC3", "DE3", "VE3", "FL200"])
+
+    def test_wait_for_move_polls_until_stopped(self):
+        self.start(moving_polls=2)
+
+        start = time.time()
+        move_time = self.step_comm.move(1, 100)
+
+        self.assertGreaterEqual(time.time() - start, move_time - self.step_comm.POLL_INTERVAL)
+        self.assertEqual(self.drive.commands.count("SC"), 3)
+
+    def test_reconnects_after_connection_is_lost(self):
+        self.start()
+
+        self.step_comm.move(1, 2, wait=False)
+        self.wait_for_commands(5)
+        self.drive.drop_connection()
+        time.sleep(0.05)
+
+        self.step_comm.move(1, 2, wait=False)
+
+        # a new session starts over with the step resolution and motion profile
+        self.assertEqual(self.wait_for_commands(10)[5:], ["MR0", "AC2", "DE2", "VE2", "FL200"])
+        self.assertEqual(self.drive.connections, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import os
+import tempfile
+import threading
+import unittest
+
+import data_processors as procs
+
+class WriteBehindQueueTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'out.txt')
+        self.writer = procs.WriteBehindQueue(max_depth=4, fsync_policy='never')
+    
+    def tearDown(self):
+        self.writer.close()
+        self.tmp.cleanup()
+    
+    def hold(self):
+        """
+        Block the writer thread until the returned event is set, every job queued
+        meanwhile is then taken as one batch.
+        """
+        started = threading.Event()
+        release = threading.Event()
+        self.writer.submit(lambda: (started.set(), release.wait()))
+        started.wait()
+        return release
+    
+    def read(self):
+        with open(self.path) as in_file:
+            return in_file.read()
+    
+    def test_flush_waits_for_queued_writes(self):
+        for index in range(20):
+            self.writer.write(self.path, str(index) + "\n", 'a')
+        self.writer.flush()
+        
+        self.assertEqual(self.read(), "".join(str(index) + "\n" for index in range(20)))
+    
+    def test_jobs_run_in_order(self):
+        order = []
+        
+        self.writer.write(self.path, "first", 'w+', on_written=lambda: order.append(self.read()))
+        self.writer.submit(lambda: order.append('call'))
+        self.writer.write(self.path, "second", 'w+', on_written=lambda: order.append(self.read()))
+        self.writer.flush()
+        
+        self.assertEqual(order, ["first", 'call', "second"])
+    
+    def test_replaced_file_holds_last_write(self):
+        release = self.hold()
+        for index in range(3):
+            self.writer.write(self.path, str(index), 'w+')
+        release.set()
+        self.writer.flush()
+        
+        self.assertEqual(self.read(), "2")
+        self.assertEqual(self.writer.metrics()['bytes_written'], 1)
+    
+    def test_close_runs_queued_jobs(self):
+        done = []
+        
+        release = self.hold()
+        self.writer.write(self.path, "data", 'a')
+        self.writer.submit(lambda: done.append(True))
+        release.set()
+        self.writer.close()
+        
+        self.assertEqual(self.read(), "data")
+        self.assertEqual(done, [True])
+        self.assertFalse(self.writer.writer_thread.is_alive())
+    
+    def test_closed_queue(self):
+        self.writer.close()
+        self.writer.close()
+        self.writer.flush()
+        
+        with self.assertRaises(RuntimeError):
+            self.writer.write(self.path, "data")
+    
+    def test_failed_write_skips_its_callback(self):
+        called = []
+        missing = os.path.join(self.tmp.name, 'missing', 'out.txt')
+        
+        self.writer.write(missing, "data", 'a', on_written=lambda: called.append(True))
+        self.writer.write(self.path, "data", 'a', on_written=lambda: called.append(False))
+        self.writer.flush()
+        
+        self.assertEqual(called, [False])
+        self.assertEqual(self.writer.metrics()['errors'], 1)
+    
+    def test_failing_jobs_do_not_stop_the_writer(self):
+        def fail():
+            raise ValueError("failed")
+        
+        self.writer.submit(fail)
+        self.writer.write(self.path, "data", 'a', on_written=fail)
+        self.writer.write(self.path, "more", 'a')
+        self.writer.close()
+        
+        self.assertEqual(self.read(), "datamore")
+        metrics = self.writer.metrics()
+        self.assertEqual(metrics['errors'], 2)
+        self.assertEqual(metrics['completed'], metrics['submitted'])
+        self.assertEqual(metrics['depth'], 0)
+    
+    def test_backpressure(self):
+        release = self.hold()
+        
+        # the writer is blocked, so the queue fills up and the last writes have to wait
+        timer = threading.Timer(0.1, release.set)
+        timer.start()
+        for index in range(6):
+            self.writer.write(self.path, str(index), 'a')
+        self.writer.flush()
+        timer.join()
+        
+        self.assertEqual(self.read(), "012345")
+        self.assertGreaterEqual(self.writer.metrics()['backpressure_waits'], 1)
+    
+    def test_unknown_fsync_policy(self):
+        with self.assertRaises(ValueError):
+            procs.WriteBehindQueue(fsync_policy='sometimes')
+
+if __name__ == '__main__':
+    unittest.main()